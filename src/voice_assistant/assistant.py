@@ -3,21 +3,67 @@
 from __future__ import annotations
 
 import contextlib
+import functools
 import logging
 import os
 import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict
 from pathlib import Path
 
+import openai
 import pygame
 import speech_recognition as sr
 from gtts import gTTS
 from gtts.tts import gTTSError
-from openai import OpenAI
+from openai import DefaultHttpxClient, OpenAI
 
+from voice_assistant.audio import preprocess_audio
+from voice_assistant.bargein import BargeIn, BargeInMonitor
+from voice_assistant.capture import CaptureSettings, select_capture_settings
 from voice_assistant.config import AssistantConfig
+from voice_assistant.faq import FaqIndex
+from voice_assistant.metrics import Metrics
+from voice_assistant.profiling import StageProfiler
+from voice_assistant.recognition import RecognizerRace, Transcript, create_backends
+from voice_assistant.routing import ModelRouter, Route, TimedStream
+from voice_assistant.scheduler import (
+    BATCH,
+    INTERACTIVE,
+    SPECULATIVE,
+    RateLimitScheduler,
+    estimate_tokens,
+)
+from voice_assistant.session import Interaction, SessionRecorder
+from voice_assistant.speculation import Prefetcher
+from voice_assistant.synthesis import split_sentences
+from voice_assistant.tuning import (
+    DEFAULT_PROFILE_PATH,
+    TUNED_SETTINGS,
+    AutoTuner,
+    TuningProfile,
+    explicit_settings,
+    observe_audio,
+)
+from voice_assistant.warmup import run_warmup
 
 LOGGER = logging.getLogger(__name__)
 
+# gTTS produces 24 kHz mono MP3s; matching the mixer avoids resampling on playback.
+MIXER_FREQUENCY = 24000
+
+# Errors that say a model is unavailable rather than that the request was bad.
+FALLBACK_ERRORS = (openai.APIConnectionError, openai.InternalServerError)
+
+
+def _remove_file(path: Path, future: Future | None = None) -> None:
+    """Delete a temporary audio file; usable as a future's done-callback."""
+    with contextlib.suppress(OSError):
+        path.unlink()
+
 
 class VoiceAssistant:
     """Speech-driven assistant that delegates answers to the OpenAI API."""
@@ -27,11 +73,72 @@ class VoiceAssistant:
         api_key: str | None = None,
         config: AssistantConfig | None = None,
         recognizer: sr.Recognizer | None = None,
+        scheduler: RateLimitScheduler | None = None,
     ) -> None:
         self.config = config or AssistantConfig()
         self.recognizer = recognizer or sr.Recognizer()
         self.recognizer.pause_threshold = self.config.pause_threshold
-        self.client = OpenAI(api_key=self._resolve_api_key(api_key))
+        self.metrics = Metrics()
+        # A scheduler passed in may be shared with other assistants.
+        self._owns_scheduler = scheduler is None
+        self.scheduler = scheduler or RateLimitScheduler(
+            self.config.requests_per_minute,
+            self.config.tokens_per_minute,
+            metrics=self.metrics,
+        )
+        self.client = self._create_client(self._resolve_api_key(api_key))
+        self.tuner = self._load_tuner() if self.config.autotune else None
+        self.faq = self._load_faq() if self.config.faq_path else None
+        self.recognizer_race = (
+            RecognizerRace(
+                create_backends(self.recognizer, self.config.recognizers),
+                min_confidence=self.config.recognition_confidence,
+                timeout=self.config.recognition_timeout,
+                metrics=self.metrics,
+            )
+            if tuple(self.config.recognizers) != ("google",)
+            else None
+        )
+        self.prefetcher = (
+            Prefetcher(
+                self._speculate,
+                min_words=self.config.speculation_min_words,
+                metrics=self.metrics,
+            )
+            if self.config.speculative_prefetch
+            else None
+        )
+        if self.prefetcher is not None and self.recognizer_race is None:
+            LOGGER.warning(
+                "Speculative prefetch needs early transcripts from several recognizers"
+            )
+        self.router = (
+            ModelRouter(
+                self.config.fast_model,
+                self.config.model,
+                long_prompt_words=self.config.route_prompt_words,
+                degraded_latency=self.config.degraded_latency,
+            )
+            if self.config.fast_model
+            else None
+        )
+        self.profiler = (
+            StageProfiler(
+                self.config.profile_dir, interactions=self.config.profile_interactions
+            )
+            if self.config.profile_dir
+            else None
+        )
+        self._microphone: sr.Microphone | None = None
+        self.recorder = (
+            SessionRecorder(self.config.record_session)
+            if self.config.record_session
+            else None
+        )
+        self._interaction: Interaction | None = None
+        self._cancel = threading.Event()
+        self._active_stream = None
+        self._barge_in_preroll: bytes | None = None
 
     @staticmethod
     def _resolve_api_key(explicit: str | None) -> str:
@@ -42,52 +149,397 @@ class VoiceAssistant:
             )
         return key
 
+    def _create_client(self, api_key: str, **options: object) -> OpenAI:
+        """OpenAI client whose responses keep the scheduler's rate limits current.
+
+        The SDK's own retries are off by default: a 429 retried inside the call
+        would skip the scheduler's priority queue and its shared pause.
+        """
+        http_client = DefaultHttpxClient(
+            event_hooks={"response": [self.scheduler.observe_response]}
+        )
+        options.setdefault("max_retries", 0)
+        return OpenAI(api_key=api_key, http_client=http_client, **options)
+
+    @property
+    def tuning_profile_path(self) -> Path:
+        """Location of the persisted auto-tuning profile."""
+        if self.config.tuning_profile:
+            return Path(self.config.tuning_profile).expanduser()
+        return DEFAULT_PROFILE_PATH
+
+    def _load_tuner(self) -> AutoTuner:
+        """Restore learned capture parameters and start tuning from them."""
+        profile = TuningProfile.from_config(self.config)
+        path = self.tuning_profile_path
+        if path.exists():
+            try:
+                profile = TuningProfile.load(path)
+            except (OSError, TypeError, ValueError) as exc:
+                LOGGER.warning("Ignoring unreadable tuning profile %s: %s", path, exc)
+            else:
+                LOGGER.info("Loaded tuning profile from %s", path)
+        pinned = explicit_settings(self.config)
+        LOGGER.info(
+            "Capture settings: %s",
+            ", ".join(
+                (
+                    f"{name}={getattr(self.config, name)} (configured)"
+                    if name in pinned
+                    else f"{name}={getattr(profile, name)} (tuned)"
+                )
+                for name in TUNED_SETTINGS
+            ),
+        )
+        profile.apply(self.config, self.recognizer, pinned=pinned)
+        return AutoTuner(profile, pinned=pinned)
+
+    def _load_faq(self) -> FaqIndex | None:
+        """Build the local answer index from the configured FAQ file."""
+        start = time.perf_counter()
+        try:
+            faq = FaqIndex.load(
+                self.config.faq_path, threshold=self.config.faq_threshold
+            )
+        except (AttributeError, OSError, TypeError, ValueError) as exc:
+            LOGGER.warning(
+                "Ignoring unreadable FAQ file %s: %s", self.config.faq_path, exc
+            )
+            return None
+        elapsed = time.perf_counter() - start
+        self.metrics.record("faq_build", elapsed)
+        LOGGER.info("Indexed %d FAQ questions in %.1f ms", len(faq), elapsed * 1000)
+        return faq
+
     def run(self, *, once: bool = False) -> None:
         """Start the main interaction loop."""
+        if self.config.warm_up:
+            self.warm_up()
         LOGGER.info(
             "Starting voice assistant; waiting for keyword '%s'", self.config.keyword
         )
         try:
             while True:
-                if not self._await_keyword():
+                if self._barge_in_preroll is None and not self._await_keyword():
                     continue
 
+                self._interaction = Interaction(timestamp=time.time())
                 try:
-                    question = self._capture_question()
-                except RuntimeError as exc:  # microphone failure
-                    LOGGER.error("Could not capture question: %s", exc)
-                    continue
+                    finished = self._handle_question()
+                finally:
+                    self._finish_interaction()
 
-                if not question:
-                    LOGGER.warning("No speech detected after keyword; waiting again")
-                    if once:
-                        break
-                    continue
+                if once and finished:
+                    break
+        except KeyboardInterrupt:
+            LOGGER.info("Received interrupt; shutting down")
+        finally:
+            self.metrics.log_report(LOGGER)
+            self._log_faq_hit_rate()
+            self._log_routing()
+            self._log_recognizer_wins()
+            self._write_profile()
+            self.close()
+
+    def close(self) -> None:
+        """Shut down the recognizer race and prefetch thread pools and the scheduler."""
+        if self.recognizer_race is not None:
+            self.recognizer_race.close()
+        if self.prefetcher is not None:
+            self.prefetcher.close()
+        if self._owns_scheduler:
+            self.scheduler.close()
+
+    def _log_faq_hit_rate(self) -> None:
+        hits = self.metrics.count("faq_hits")
+        lookups = hits + self.metrics.count("faq_misses")
+        if lookups:
+            LOGGER.info(
+                "FAQ answered %d of %d questions (%.0f%%)",
+                hits,
+                lookups,
+                100 * hits / lookups,
+            )
 
-                LOGGER.info("User said: %s", question)
+    def _log_recognizer_wins(self) -> None:
+        if self.recognizer_race is None:
+            return
+        wins = {
+            name: self.metrics.count(f"recognition_wins_{name}")
+            for name in self.recognizer_race.backends
+        }
+        total = sum(wins.values())
+        for name, count in wins.items():
+            latency = self.metrics.summary(f"recognition_{name}")
+            LOGGER.info(
+                "Recognizer %s won %d of %d races; p50 latency %s",
+                name,
+                count,
+                total,
+                "unknown" if latency is None else f"{latency.p50:.3f}s",
+            )
 
-                try:
-                    response = self.generate_response(question)
-                except Exception:  # pragma: no cover - network/API errors
-                    LOGGER.exception("Failed to fetch response from OpenAI")
-                    if once:
-                        break
-                    continue
+    def _log_routing(self) -> None:
+        if self.router is None:
+            return
+        for tier, model in self.router.models.items():
+            latency = self.router.latency.get(model)
+            LOGGER.info(
+                "Routed %d questions to %s (%s); average latency %s",
+                self.metrics.count(f"route_{tier}"),
+                model,
+                tier,
+                "unknown" if latency is None else f"{latency:.2f}s",
+            )
 
-                LOGGER.info("Assistant response: %s", response)
-                self.speak_text(response)
+    def interact(self) -> Interaction:
+        """Capture, answer and speak a single question as if the keyword was just heard."""
+        self._interaction = interaction = Interaction(timestamp=time.time())
+        try:
+            self._handle_question()
+        finally:
+            self._finish_interaction()
+        return interaction
 
-                if once:
-                    break
-        except KeyboardInterrupt:
-            LOGGER.info("Received interrupt; shutting down")
+    def answer_audio(self, audio: sr.AudioData) -> Interaction:
+        """Transcribe and answer recorded ``audio`` without microphone or speaker.
+
+        Used for batch and server processing; the response is returned in the
+        interaction rather than spoken.
+        """
+        self._interaction = interaction = Interaction(timestamp=time.time())
+        try:
+            interaction.audio = audio
+            processed = self._preprocess_audio(audio)
+            interaction.transcript = self._recognize_speech(processed, prefetch=True)
+            if interaction.transcript:
+                interaction.response = self._respond(
+                    interaction.transcript, priority=BATCH
+                )
+        except Exception as exc:  # pragma: no cover - network/API errors
+            LOGGER.exception("Failed to answer recorded audio")
+            interaction.error = str(exc)
+        finally:
+            self._finish_interaction()
+        return interaction
+
+    def _handle_question(self) -> bool:
+        """Capture, answer and speak one question after the keyword.
+
+        Returns ``False`` when no question could be captured at all.
+        """
+        interaction = self._interaction
+        preroll, self._barge_in_preroll = self._barge_in_preroll, None
+        try:
+            question = self._capture_question(preroll=preroll)
+        except RuntimeError as exc:  # microphone failure
+            LOGGER.error("Could not capture question: %s", exc)
+            interaction.error = str(exc)
+            return False
+
+        interaction.transcript = question
+        if not question:
+            LOGGER.warning("No speech detected after keyword; waiting again")
+            return True
+
+        LOGGER.info("User said: %s", question)
+
+        with self._barge_in_monitoring():
+            try:
+                response = self._respond(question)
+            except BargeIn:
+                LOGGER.info("Response generation cancelled by barge-in")
+                interaction.error = "barge-in"
+                return True
+            except Exception as exc:  # pragma: no cover - network/API errors
+                LOGGER.exception("Failed to fetch response from OpenAI")
+                interaction.error = str(exc)
+                return True
+
+            interaction.response = response
+            LOGGER.info("Assistant response: %s", response)
+            self.speak_text(response)
+        return True
+
+    @contextlib.contextmanager
+    def _barge_in_monitoring(self) -> Iterator[None]:
+        """Listen for the user talking over generation and playback.
+
+        A barge-in cancels only the monitored interaction; the cancellation is
+        cleared when it ends.
+        """
+        self._cancel.clear()
+        try:
+            if not self.config.barge_in:
+                yield
+                return
+
+            energy_threshold = getattr(self.recognizer, "energy_threshold", 300)
+            monitor = BargeInMonitor(
+                self._get_microphone(),
+                self._on_barge_in,
+                energy_threshold=energy_threshold * self.config.barge_in_ratio,
+                min_speech=self.config.barge_in_min_speech,
+            )
+            with monitor:
+                yield
+            if monitor.triggered:
+                self.metrics.increment("barge_ins")
+                self._barge_in_preroll = monitor.preroll_audio()
+        finally:
+            self._cancel.clear()
+
+    def _on_barge_in(self, speech_started_at: float) -> None:
+        """Stop playback and streaming as soon as the user starts speaking."""
+        self._cancel.set()
+        stream = self._active_stream
+        if stream is not None:
+            with contextlib.suppress(Exception):
+                stream.close()
+        if pygame.mixer.get_init() and pygame.mixer.music.get_busy():
+            pygame.mixer.music.stop()
+        cutoff = time.perf_counter() - speech_started_at
+        self.metrics.record("barge_in_cutoff", cutoff)
+        LOGGER.info("Barge-in: stopped %.3fs after speech started", cutoff)
+
+    def _finish_interaction(self) -> None:
+        """Record the total interaction time and append it to the session file."""
+        interaction, self._interaction = self._interaction, None
+        total = time.time() - interaction.timestamp
+        interaction.timings["interaction"] = total
+        self.metrics.record("interaction", total)
+        if self.recorder is not None:
+            try:
+                self.recorder.record(interaction)
+            except OSError as exc:
+                LOGGER.warning("Could not record interaction: %s", exc)
+        if self.profiler is not None and self.profiler.interaction_finished():
+            self._write_profile()
+
+    def _write_profile(self) -> None:
+        """Write the collected stage profiles and stop profiling."""
+        profiler, self.profiler = self.profiler, None
+        if profiler is None:
+            return
+        try:
+            profiler.write()
+        except OSError as exc:
+            LOGGER.warning("Could not write profiles: %s", exc)
+
+    def warm_up(self, components: Iterable[str] | None = None) -> dict[str, float]:
+        """Initialize the audio mixer and the OpenAI connection concurrently.
+
+        ``components`` limits warm-up to the named tasks, e.g. ``["openai"]`` for
+        a process without audio output.  Returns the seconds each component
+        took; components that fail to warm up are omitted and fall back to lazy
+        initialization.
+        """
+        tasks = self._warmup_tasks()
+        if components is not None:
+            tasks = {name: tasks[name] for name in components}
+        with self._stage("warmup"):
+            timings = run_warmup(tasks)
+        for name, seconds in timings.items():
+            self.metrics.record(f"warmup_{name}", seconds)
+        return timings
+
+    def _warmup_tasks(self) -> dict[str, Callable[[], object]]:
+        """Components that are otherwise initialized on the first interaction.
+
+        The microphone is not among them: ``sr.Microphone`` reopens PortAudio and
+        its stream on every capture, so opening it early saves nothing.
+        """
+        return {
+            "mixer": self._ensure_mixer,
+            "openai": self._warm_up_client,
+        }
+
+    def _warm_up_client(self) -> None:
+        """Establish the pooled HTTPS connection to the OpenAI API.
+
+        The request goes through :attr:`scheduler` so it counts against the
+        rate limit, behind any live question.
+        """
+        self.scheduler.submit(
+            lambda: self.client.models.retrieve(self.config.model), priority=BATCH
+        )
+
+    def _get_microphone(self) -> sr.Microphone:
+        """Return the shared microphone, probing the audio device only once."""
+        if self._microphone is None:
+            config = self.config
+            settings = self._select_capture_settings() if config.auto_capture else None
+            if settings is not None:
+                options = asdict(settings)
+            else:
+                # Unset options keep the default device, its rate and 1024 frames.
+                options = {
+                    name: value
+                    for name, value in (
+                        ("device_index", config.device_index),
+                        ("sample_rate", config.capture_sample_rate),
+                        ("chunk_size", config.chunk_size),
+                    )
+                    if value is not None
+                }
+            self._microphone = sr.Microphone(**options)
+        return self._microphone
+
+    def _select_capture_settings(self) -> CaptureSettings | None:
+        """Complete the configured capture settings with the lowest-latency supported ones."""
+        config = self.config
+        try:
+            settings = select_capture_settings(
+                sr.Microphone.get_pyaudio(),
+                device_index=config.device_index,
+                sample_rate=config.capture_sample_rate,
+                chunk_size=config.chunk_size,
+                preferred_rate=config.target_sample_rate,
+            )
+        except (AttributeError, OSError, ValueError) as exc:
+            LOGGER.warning("Could not select capture settings: %s", exc)
+            return None
+        LOGGER.info("Capturing from %s", settings.describe())
+        return settings
+
+    def _ensure_mixer(self) -> None:
+        """Initialize the pygame mixer with a small, low-latency output buffer."""
+        if not pygame.mixer.get_init():
+            pygame.mixer.init(
+                frequency=MIXER_FREQUENCY,
+                size=-16,
+                channels=1,
+                buffer=self.config.mixer_buffer_size,
+            )
+
+    @contextlib.contextmanager
+    def _stage(self, name: str) -> Iterator[None]:
+        """Time a pipeline stage under ``name``.
+
+        The duration goes to :attr:`metrics` and, while an interaction is in
+        progress, is added to that interaction's timings.  With ``--profile``
+        the stage also runs under :attr:`profiler`.
+        """
+        profiler = self.profiler
+        profile = profiler.start() if profiler is not None else None
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            if profile is not None:
+                profiler.stop(name, profile)
+            self.metrics.record(name, elapsed)
+            if self._interaction is not None:
+                timings = self._interaction.timings
+                timings[name] = timings.get(name, 0.0) + elapsed
 
     def _await_keyword(self) -> bool:
         """Listen until the configured keyword is spoken."""
         LOGGER.debug("Listening for wake word")
-        print(f"Say '{self.config.keyword}' to start recording your question...")
+        self._prompt(f"Say '{self.config.keyword}' to start recording your question...")
         try:
-            with sr.Microphone() as source:
+            with self._get_microphone() as source:
                 self._prepare_microphone(source)
                 try:
                     audio = self.recognizer.listen(
@@ -102,66 +554,233 @@ class VoiceAssistant:
             LOGGER.error("Microphone is not available: %s", exc)
             return False
 
-        transcription = self._recognize_speech(audio)
+        transcription = self._recognize_speech(self._preprocess_audio(audio))
         LOGGER.debug("Wake-word transcription: %s", transcription)
         return bool(
             transcription
             and transcription.lower().strip() == self.config.keyword.lower()
         )
 
-    def _capture_question(self) -> str | None:
-        """Record and transcribe the user's question."""
-        print("Keyword detected. Ask your question after the tone!")
+    def _capture_question(self, *, preroll: bytes | None = None) -> str | None:
+        """Record and transcribe the user's question.
+
+        ``preroll`` is audio already heard by the barge-in monitor; the user is
+        mid-sentence, so it is prepended and noise calibration is skipped.
+        """
+        if preroll is None:
+            self._prompt("Keyword detected. Ask your question after the tone!")
         try:
-            with sr.Microphone() as source:
-                self._prepare_microphone(source)
+            with self._get_microphone() as source:
+                if preroll is None:
+                    self._prepare_microphone(source)
                 try:
-                    audio = self.recognizer.listen(
-                        source,
-                        timeout=self.config.listen_timeout,
-                        phrase_time_limit=self.config.phrase_time_limit,
-                    )
+                    with self._stage("capture"):
+                        audio = self.recognizer.listen(
+                            source,
+                            timeout=self.config.listen_timeout,
+                            phrase_time_limit=self.config.phrase_time_limit,
+                        )
                 except sr.WaitTimeoutError as exc:
                     raise RuntimeError("Timed out waiting for a question") from exc
         except OSError as exc:
             raise RuntimeError("Microphone is not available") from exc
 
-        return self._recognize_speech(audio)
+        if preroll:
+            audio = sr.AudioData(
+                preroll + audio.get_raw_data(), audio.sample_rate, audio.sample_width
+            )
+        if self._interaction is not None:
+            # Record what was captured so a replay preprocesses it afresh.
+            self._interaction.audio = audio
+        processed = self._preprocess_audio(audio)
+        transcription = self._recognize_speech(processed, prefetch=True)
+        if self.tuner is not None:
+            self._update_tuning(audio, transcription)
+        return transcription
+
+    def _prompt(self, message: str) -> None:
+        """Tell the user what to do next."""
+        print(message)
 
     def _prepare_microphone(self, source: sr.AudioSource) -> None:
         """Calibrate for background noise before recording."""
-        self.recognizer.adjust_for_ambient_noise(
-            source, duration=self.config.ambient_noise_duration
+        with self._stage("calibration"):
+            self.recognizer.adjust_for_ambient_noise(
+                source, duration=self.config.ambient_noise_duration
+            )
+
+    def _preprocess_audio(self, audio: sr.AudioData) -> sr.AudioData:
+        """Trim silence and downsample captured audio to cut upload size."""
+        energy_threshold = None
+        if self.config.trim_silence:
+            energy_threshold = getattr(self.recognizer, "energy_threshold", 300)
+        try:
+            with self._stage("preprocess"):
+                processed = preprocess_audio(
+                    audio,
+                    target_rate=self.config.target_sample_rate,
+                    energy_threshold=energy_threshold,
+                    padding=self.config.silence_padding,
+                )
+            captured_bytes = len(audio.get_raw_data())
+        except (AttributeError, TypeError, ValueError) as exc:
+            LOGGER.debug("Sending unprocessed audio; preprocessing failed: %s", exc)
+            return audio
+
+        uploaded_bytes = len(processed.get_raw_data())
+        self.metrics.record("audio_bytes_captured", captured_bytes)
+        self.metrics.record("audio_bytes_uploaded", uploaded_bytes)
+        LOGGER.debug(
+            "Preprocessed audio from %d bytes at %d Hz to %d bytes at %d Hz",
+            captured_bytes,
+            audio.sample_rate,
+            uploaded_bytes,
+            processed.sample_rate,
         )
+        return processed
+
+    def _update_tuning(self, audio: sr.AudioData, transcription: str | None) -> None:
+        """Feed a captured question to the auto-tuner and persist the result."""
+        try:
+            observation = observe_audio(
+                audio,
+                energy_threshold=getattr(self.recognizer, "energy_threshold", 300),
+                phrase_time_limit=self.config.phrase_time_limit,
+                unintelligible=transcription is None,
+                pause_threshold=self.config.pause_threshold,
+            )
+        except (AttributeError, TypeError, ValueError) as exc:
+            LOGGER.debug("Skipping tuning observation: %s", exc)
+            return
 
-    def _recognize_speech(self, audio: sr.AudioData) -> str | None:
-        """Transcribe recorded audio with Google's speech recognition service."""
+        self.tuner.observe(observation)
+        profile = self.tuner.tune()
+        profile.apply(self.config, self.recognizer, pinned=self.tuner.pinned)
+        try:
+            profile.save(self.tuning_profile_path)
+        except OSError as exc:
+            LOGGER.warning("Could not save tuning profile: %s", exc)
+
+    def _recognize_speech(
+        self, audio: sr.AudioData, *, prefetch: bool = False
+    ) -> str | None:
+        """Transcribe recorded audio with Google's speech recognition service.
+
+        With several ``recognizers`` configured, they race in
+        :attr:`recognizer_race` and the first confident transcript wins.  With
+        ``prefetch``, unsure early results of the race are offered to
+        :attr:`prefetcher` to start generating speculatively.
+        """
+        on_early_result = None
+        if prefetch and self.prefetcher is not None:
+            on_early_result = self._offer_early_result
         try:
-            return self.recognizer.recognize_google(audio)
+            with self._stage("recognition"):
+                if self.recognizer_race is not None:
+                    return self.recognizer_race.recognize(
+                        audio, on_early_result=on_early_result
+                    ).text
+                return self.recognizer.recognize_google(audio)
         except sr.UnknownValueError:
             LOGGER.warning("Speech was unintelligible")
         except sr.RequestError as exc:
             LOGGER.error("Speech recognition service unavailable: %s", exc)
         return None
 
-    def generate_response(self, prompt: str) -> str:
-        """Generate a reply for the supplied prompt using the OpenAI Chat Completions API."""
+    def _offer_early_result(self, transcript: Transcript) -> None:
+        if self.faq is not None and self.faq.lookup(transcript.text) is not None:
+            return  # answered locally without waiting for OpenAI
+        LOGGER.debug(
+            "Early transcript from %s (confidence %s): %s",
+            transcript.backend,
+            transcript.confidence,
+            transcript.text,
+        )
+        self.prefetcher.offer(transcript.text)
+
+    def _respond(self, question: str, *, priority: int = INTERACTIVE) -> str:
+        """Answer the final transcript, reusing a matching speculative response."""
+        if self.prefetcher is not None:
+            response = self.prefetcher.resolve(question)
+            if response is not None:
+                # Count what generate_response would have for this answer.
+                if self.faq is not None:
+                    self.metrics.increment("faq_misses")
+                route = self._route(question)
+                self._record_request(
+                    self._completion_request(
+                        question, route.model if route else self.config.model
+                    )
+                )
+                LOGGER.debug("Using speculative response")
+                return response
+        return self.generate_response(question, priority=priority)
+
+    def generate_response(self, prompt: str, *, priority: int = INTERACTIVE) -> str:
+        """Generate a reply for the supplied prompt using the OpenAI Chat Completions API.
+
+        Requests wait in :attr:`scheduler` for rate-limit budget; lower
+        ``priority`` values go first.  With a ``fast_model`` configured,
+        :attr:`router` picks the model for each prompt.
+        """
         if not prompt.strip():
             raise ValueError("Prompt must contain text")
 
-        completion = self.client.chat.completions.create(
-            model=self.config.model,
-            temperature=self.config.temperature,
-            max_tokens=self.config.max_output_tokens,
-            messages=[
+        if self.faq is not None:
+            answer = self._answer_from_faq(prompt)
+            if answer is not None:
+                return answer
+
+        route = self._route(prompt)
+        request = self._completion_request(
+            prompt, route.model if route else self.config.model
+        )
+
+        with self._stage("generation"):
+            if self.config.barge_in:
+                content = self._stream_completion(request, route, priority=priority)
+                if not content:
+                    raise RuntimeError("OpenAI returned an empty response")
+                return content
+            completion = self._routed_completion(request, route, priority=priority)
+        return self._completion_content(completion)
+
+    def _speculate(self, prompt: str) -> str:
+        """Generate a response to an early transcript for :attr:`prefetcher`.
+
+        The request is not streamed, so it shares no barge-in state with the
+        live interaction, and it is not retried on another model.  FAQ and
+        routing metrics are left to :meth:`_respond`, which counts them once
+        for the answer that is used.
+        """
+        model = self.router.route(prompt).model if self.router else self.config.model
+        completion = self._create_completion(
+            self._completion_request(prompt, model), priority=SPECULATIVE
+        )
+        return self._completion_content(completion)
+
+    def _completion_request(self, prompt: str, model: str) -> dict[str, object]:
+        return {
+            "model": model,
+            "temperature": self.config.temperature,
+            "max_tokens": self.config.max_output_tokens,
+            "messages": [
                 {
                     "role": "system",
                     "content": "You are a helpful voice assistant that gives concise answers.",
                 },
                 {"role": "user", "content": prompt},
             ],
-        )
+        }
 
+    def _record_request(self, request: dict[str, object]) -> None:
+        """Note the model and messages sent for the current interaction."""
+        if self._interaction is not None:
+            self._interaction.model = request["model"]
+            self._interaction.messages = list(request["messages"])
+
+    @staticmethod
+    def _completion_content(completion: object) -> str:
         try:
             message = completion.choices[0].message
         except (IndexError, AttributeError) as exc:
@@ -172,41 +791,209 @@ class VoiceAssistant:
 
         return message.content
 
+    def _answer_from_faq(self, prompt: str) -> str | None:
+        """Answer ``prompt`` from the local FAQ index if it is a known question."""
+        with self._stage("faq"):
+            match = self.faq.lookup(prompt)
+        if match is None:
+            self.metrics.increment("faq_misses")
+            return None
+        self.metrics.increment("faq_hits")
+        LOGGER.info(
+            "Answered from FAQ (%.2f similar to '%s')", match.score, match.question
+        )
+        return match.answer
+
+    def _route(self, prompt: str) -> Route | None:
+        """Pick the model for ``prompt`` when routing is enabled."""
+        if self.router is None:
+            return None
+        route = self.router.route(prompt)
+        self.metrics.increment(f"route_{route.tier}")
+        LOGGER.info("Routing question to %s (%s)", route.model, route.reason)
+        return route
+
+    def _routed_completion(
+        self,
+        request: dict[str, object],
+        route: Route | None,
+        *,
+        priority: int,
+        **options: object,
+    ) -> object:
+        """Send ``request`` to the routed model, retrying on the other one if it fails.
+
+        Only connection errors, timeouts and server errors count as a failure
+        of the model; other errors, such as a rejected request, are raised.
+        """
+        if route is None:
+            self._record_request(request)
+            return self._create_completion(request, priority=priority, **options)
+        while True:
+            request = {**request, "model": route.model}
+            self._record_request(request)
+            try:
+                return self._create_completion(
+                    request, priority=priority, route=route, **options
+                )
+            except FALLBACK_ERRORS as exc:
+                self.router.failed(route.model)
+                failed, route = route, self.router.fallback(route)
+                if route is None:
+                    raise
+                self.metrics.increment("route_fallbacks")
+                LOGGER.warning(
+                    "Model %s failed (%s); retrying on %s",
+                    failed.model,
+                    exc,
+                    route.model,
+                )
+
+    def _create_completion(
+        self,
+        request: dict[str, object],
+        *,
+        priority: int,
+        route: Route | None = None,
+        **options: object,
+    ) -> object:
+        """Send a chat completion through the rate-limit scheduler.
+
+        With a ``route`` the request latency, excluding time spent queued, is
+        reported to :attr:`router` and recorded as ``generation_<tier>``.  A
+        streamed completion is timed until its last chunk has been read.
+        """
+
+        def call() -> object:
+            start = time.perf_counter()
+            completion = self.client.chat.completions.create(**request, **options)
+            if route is None:
+                return completion
+            observe = functools.partial(self._observe_route, route)
+            if options.get("stream"):
+                return TimedStream(completion, start, observe)
+            observe(time.perf_counter() - start)
+            return completion
+
+        return self.scheduler.submit(
+            call, priority=priority, tokens=estimate_tokens(request)
+        )
+
+    def _observe_route(self, route: Route, seconds: float) -> None:
+        self.router.observe(route.model, seconds)
+        self.metrics.record(f"generation_{route.tier}", seconds)
+
+    def _stream_completion(
+        self, request: dict[str, object], route: Route | None, *, priority: int
+    ) -> str:
+        """Stream a completion so a barge-in can abandon it mid-generation."""
+        stream = self._routed_completion(request, route, priority=priority, stream=True)
+        self._active_stream = stream
+        parts = []
+        try:
+            for chunk in stream:
+                if self._cancel.is_set():
+                    break
+                if chunk.choices and chunk.choices[0].delta.content:
+                    parts.append(chunk.choices[0].delta.content)
+        except Exception as exc:
+            if not self._cancel.is_set():
+                raise
+            raise BargeIn("Generation cancelled") from exc
+        finally:
+            self._active_stream = None
+            stream.close()
+        if self._cancel.is_set():
+            raise BargeIn("Generation cancelled")
+        return "".join(parts)
+
     def speak_text(self, text: str) -> None:
-        """Convert text to speech using gTTS and play the generated audio."""
+        """Convert text to speech using gTTS and play the generated audio.
+
+        Long responses are split into sentence chunks synthesized concurrently;
+        each chunk plays as soon as it and every chunk before it are ready.
+        """
         if not text.strip():
             LOGGER.debug("Skipping empty response")
             return
+        if self._cancel.is_set():
+            LOGGER.debug("Skipping speech after barge-in")
+            return
 
+        start = time.perf_counter()
+        workers = self.config.synthesis_workers
+        chunks = split_sentences(text) if workers > 1 else [text]
+        paths = [self._temp_audio_path() for _ in chunks]
+        pool = ThreadPoolExecutor(
+            max_workers=min(workers, len(chunks)), thread_name_prefix="synthesis"
+        )
+        futures = [
+            pool.submit(self._synthesize_profiled, chunk, path)
+            for chunk, path in zip(chunks, paths)
+        ]
+        try:
+            for index, (future, path) in enumerate(zip(futures, paths)):
+                try:
+                    with self._stage("synthesis"):
+                        future.result()
+                except gTTSError as exc:
+                    LOGGER.error("Failed to synthesize speech with gTTS: %s", exc)
+                    return
+                if self._cancel.is_set():
+                    LOGGER.debug("Stopping speech after barge-in")
+                    return
+                if index == 0:
+                    self.metrics.record(
+                        "time_to_first_audio", time.perf_counter() - start
+                    )
+                if not self._play(path) or self._cancel.is_set():
+                    return
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+            # Chunks still being synthesized are removed once they finish.
+            for future, path in zip(futures, paths):
+                future.add_done_callback(functools.partial(_remove_file, path))
+
+    @staticmethod
+    def _temp_audio_path() -> Path:
         with tempfile.NamedTemporaryFile(
             prefix="assistant_", suffix=".mp3", delete=False
         ) as temp_file:
-            temp_path = Path(temp_file.name)
+            return Path(temp_file.name)
 
+    def _play(self, path: Path) -> bool:
+        """Play one synthesized file to the end; return ``False`` if it failed."""
         try:
-            gTTS(text=text, lang="en", slow=False).save(str(temp_path))
-        except gTTSError as exc:
-            LOGGER.error("Failed to synthesize speech with gTTS: %s", exc)
-            return
-
-        try:
-            # Initialize pygame mixer if not already initialized
-            if not pygame.mixer.get_init():
-                pygame.mixer.init()
+            self._ensure_mixer()
 
             # Load and play the audio file
-            pygame.mixer.music.load(str(temp_path))
+            pygame.mixer.music.load(str(path))
             pygame.mixer.music.play()
 
             # Wait for playback to finish
-            while pygame.mixer.music.get_busy():
-                pygame.time.Clock().tick(10)
+            with self._stage("playback"):
+                clock = pygame.time.Clock()
+                while pygame.mixer.music.get_busy():
+                    clock.tick(10)
         except Exception as exc:
             LOGGER.error("Unable to play synthesized speech: %s", exc)
+            return False
         finally:
             # Stop and unload the music
             pygame.mixer.music.stop()
             pygame.mixer.music.unload()
-            # Clean up the temporary file
-            with contextlib.suppress(OSError):
-                temp_path.unlink()
+        return True
+
+    def _synthesize_profiled(self, text: str, path: Path) -> None:
+        """Synthesize on a worker thread, profiled as ``tts`` with ``--profile``."""
+        profiler = self.profiler
+        profile = profiler.start() if profiler is not None else None
+        try:
+            self._synthesize(text, path)
+        finally:
+            if profile is not None:
+                profiler.stop("tts", profile)
+
+    def _synthesize(self, text: str, path: Path) -> None:
+        """Write speech for ``text`` to ``path`` as MP3."""
+        gTTS(text=text, lang="en", slow=False).save(str(path))
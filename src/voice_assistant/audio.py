@@ -0,0 +1,146 @@
+"""NumPy helpers that shrink captured audio before it is sent for recognition."""
+
+from __future__ import annotations
+
+import numpy as np
+import speech_recognition as sr
+
+# Recognizer energy thresholds are RMS values of signed 16-bit samples.
+INT16_FULL_SCALE = 32768.0
+FRAME_SECONDS = 0.02
+
+
+def pcm_to_array(frame_data: bytes, channels: int = 1) -> np.ndarray:
+    """Decode little-endian 16-bit PCM into a float32 array of shape ``(samples, channels)``."""
+    if channels < 1:
+        raise ValueError("channels must be at least 1")
+    samples = np.frombuffer(frame_data, dtype="<i2").astype(np.float32)
+    usable = len(samples) - len(samples) % channels
+    return samples[:usable].reshape(-1, channels) / INT16_FULL_SCALE
+
+
+def array_to_pcm(samples: np.ndarray) -> bytes:
+    """Encode float samples in ``[-1, 1]`` as little-endian 16-bit PCM."""
+    scaled = np.clip(
+        samples * INT16_FULL_SCALE, -INT16_FULL_SCALE, INT16_FULL_SCALE - 1
+    )
+    return np.round(scaled).astype("<i2").tobytes()
+
+
+def downmix(samples: np.ndarray) -> np.ndarray:
+    """Average all channels of ``samples`` into a mono signal."""
+    if samples.ndim == 1:
+        return samples
+    return samples.mean(axis=1, dtype=np.float32)
+
+
+def frame_energies(
+    samples: np.ndarray, sample_rate: int, frame_seconds: float = FRAME_SECONDS
+) -> np.ndarray:
+    """Return the RMS energy of consecutive, non-overlapping frames of a mono signal."""
+    frame_length = max(1, int(sample_rate * frame_seconds))
+    frame_count = len(samples) // frame_length
+    if frame_count == 0:
+        return np.zeros(0, dtype=np.float32)
+    frames = samples[: frame_count * frame_length].reshape(frame_count, frame_length)
+    return np.sqrt(np.mean(np.square(frames), axis=1))
+
+
+def speech_segments(
+    samples: np.ndarray,
+    sample_rate: int,
+    threshold: float,
+    frame_seconds: float = FRAME_SECONDS,
+) -> list[tuple[float, float]]:
+    """Return ``(start, end)`` times in seconds of runs of frames above ``threshold``."""
+    voiced = frame_energies(samples, sample_rate, frame_seconds) > threshold
+    if not voiced.any():
+        return []
+    edges = np.diff(voiced.astype(np.int8), prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    return [
+        (start * frame_seconds, end * frame_seconds) for start, end in zip(starts, ends)
+    ]
+
+
+def trim_silence(
+    samples: np.ndarray, sample_rate: int, threshold: float, padding: float = 0.2
+) -> np.ndarray:
+    """Drop leading and trailing audio quieter than ``threshold``, keeping ``padding`` seconds."""
+    segments = speech_segments(samples, sample_rate, threshold)
+    if not segments:
+        return samples
+    start = max(0, int((segments[0][0] - padding) * sample_rate))
+    end = min(len(samples), int((segments[-1][1] + padding) * sample_rate))
+    return samples[start:end]
+
+
+def resample(samples: np.ndarray, source_rate: int, target_rate: int) -> np.ndarray:
+    """Resample a mono signal, low-pass filtering first when downsampling."""
+    if source_rate == target_rate or len(samples) == 0:
+        return samples
+    if target_rate < source_rate:
+        samples = _low_pass(samples, cutoff=0.5 * target_rate / source_rate)
+
+    duration = len(samples) / source_rate
+    target_length = max(1, int(round(duration * target_rate)))
+    source_times = np.arange(len(samples)) / source_rate
+    target_times = np.arange(target_length) / target_rate
+    return np.interp(target_times, source_times, samples).astype(np.float32)
+
+
+def _low_pass(samples: np.ndarray, cutoff: float, taps: int = 31) -> np.ndarray:
+    """Windowed-sinc FIR filter; ``cutoff`` is a fraction of the sample rate."""
+    positions = np.arange(taps) - (taps - 1) / 2
+    kernel = np.sinc(2 * cutoff * positions) * np.hamming(taps)
+    kernel /= kernel.sum()
+    return np.convolve(samples, kernel, mode="same").astype(np.float32)
+
+
+def preprocess_pcm(
+    frame_data: bytes,
+    sample_rate: int,
+    *,
+    channels: int = 1,
+    target_rate: int | None = 16000,
+    energy_threshold: float | None = None,
+    padding: float = 0.2,
+) -> tuple[bytes, int]:
+    """Trim, downmix and resample raw 16-bit PCM.
+
+    ``energy_threshold`` uses the same units as
+    :attr:`speech_recognition.Recognizer.energy_threshold`; ``None`` disables
+    silence trimming.  Returns the processed PCM and its sample rate.
+    """
+    samples = downmix(pcm_to_array(frame_data, channels))
+    if energy_threshold is not None:
+        samples = trim_silence(
+            samples, sample_rate, energy_threshold / INT16_FULL_SCALE, padding
+        )
+    if target_rate is not None and target_rate < sample_rate:
+        samples = resample(samples, sample_rate, target_rate)
+        sample_rate = target_rate
+    return array_to_pcm(samples), sample_rate
+
+
+def preprocess_audio(
+    audio: sr.AudioData,
+    *,
+    target_rate: int | None = 16000,
+    energy_threshold: float | None = None,
+    padding: float = 0.2,
+) -> sr.AudioData:
+    """Return a trimmed, downsampled copy of ``audio`` ready for recognition.
+
+    Audio is never upsampled: when ``target_rate`` is above the capture rate the
+    original rate is kept.
+    """
+    frame_data, sample_rate = preprocess_pcm(
+        audio.get_raw_data(convert_width=2),
+        audio.sample_rate,
+        target_rate=target_rate,
+        energy_threshold=energy_threshold,
+        padding=padding,
+    )
+    return sr.AudioData(frame_data, sample_rate, 2)
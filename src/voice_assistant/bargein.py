@@ -0,0 +1,117 @@
+"""Detect the user speaking over the assistant so playback and generation can stop."""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+
+import numpy as np
+import speech_recognition as sr
+
+LOGGER = logging.getLogger(__name__)
+
+
+class BargeIn(Exception):
+    """Raised when the user interrupts the assistant."""
+
+
+def frame_rms(frame_data: bytes) -> float:
+    """RMS of 16-bit PCM in the units of ``Recognizer.energy_threshold``."""
+    samples = np.frombuffer(frame_data, dtype="<i2").astype(np.float32)
+    if not len(samples):
+        return 0.0
+    return float(np.sqrt(np.mean(np.square(samples))))
+
+
+class BargeInMonitor:
+    """Energy-based voice activity monitor running on the live microphone.
+
+    While active, a background thread reads microphone chunks.  Once
+    ``min_speech`` seconds of consecutive chunks exceed ``energy_threshold``,
+    ``on_speech`` is called with the :func:`time.perf_counter` time at which
+    speech started and the monitor stops.  The most recent ``preroll`` seconds
+    of audio are kept so the start of the interrupting question is not lost.
+
+    The threshold should sit well above the noise floor so the assistant's own
+    voice leaking from the speaker does not trigger it.
+    """
+
+    def __init__(
+        self,
+        source: sr.AudioSource,
+        on_speech: Callable[[float], None],
+        *,
+        energy_threshold: float,
+        min_speech: float = 0.2,
+        preroll: float = 1.0,
+    ) -> None:
+        self.source = source
+        self.on_speech = on_speech
+        self.energy_threshold = energy_threshold
+        self.min_speech = min_speech
+        self.preroll = preroll
+        self.speech_started_at: float | None = None
+        self._frames: deque[bytes] = deque()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def triggered(self) -> bool:
+        return self.speech_started_at is not None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run, name="barge-in-monitor", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> BargeInMonitor:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    def preroll_audio(self) -> bytes:
+        """Audio captured up to and including the detected speech."""
+        return b"".join(self._frames)
+
+    def _run(self) -> None:
+        try:
+            with self.source as source:
+                self._watch(source)
+        except OSError as exc:
+            LOGGER.warning("Barge-in monitoring stopped: %s", exc)
+
+    def _watch(self, source: sr.AudioSource) -> None:
+        chunk_seconds = source.CHUNK / source.SAMPLE_RATE
+        self._frames = deque(maxlen=max(1, math.ceil(self.preroll / chunk_seconds)))
+        needed = max(1, math.ceil(self.min_speech / chunk_seconds))
+        voiced = 0
+        onset = 0.0
+
+        while not self._stop_event.is_set():
+            frame = source.stream.read(source.CHUNK)
+            self._frames.append(frame)
+            if frame_rms(frame) <= self.energy_threshold:
+                voiced = 0
+                continue
+
+            if voiced == 0:
+                onset = time.perf_counter() - chunk_seconds
+            voiced += 1
+            if voiced >= needed:
+                self.speech_started_at = onset
+                LOGGER.debug("Barge-in detected")
+                self.on_speech(onset)
+                return
@@ -0,0 +1,120 @@
+"""Choose low-latency microphone capture settings."""
+
+from __future__ import annotations
+
+import logging
+import math
+from dataclasses import dataclass
+from types import ModuleType
+
+LOGGER = logging.getLogger(__name__)
+
+CANDIDATE_SAMPLE_RATES = (16000, 22050, 32000, 44100, 48000)
+# Shorter buffers risk input overflows when the recognizer falls behind.
+MIN_CHUNK_SECONDS = 0.01
+
+
+@dataclass(frozen=True)
+class CaptureSettings:
+    """Input device, sample rate and frames per buffer for a microphone."""
+
+    device_index: int | None
+    sample_rate: int
+    chunk_size: int
+
+    @property
+    def chunk_seconds(self) -> float:
+        """Audio held in one buffer, the latency a chunk adds before it is read."""
+        return self.chunk_size / self.sample_rate
+
+    def describe(self) -> str:
+        device = "default" if self.device_index is None else self.device_index
+        return (
+            f"device {device} at {self.sample_rate} Hz in {self.chunk_size}-frame "
+            f"chunks ({self.chunk_seconds * 1000:.1f} ms)"
+        )
+
+
+def low_latency_chunk_size(sample_rate: int, seconds: float) -> int:
+    """Smallest power-of-two chunk holding at least ``seconds`` of audio."""
+    frames = max(1, sample_rate * max(seconds, MIN_CHUNK_SECONDS))
+    return 2 ** math.ceil(math.log2(frames))
+
+
+def select_capture_settings(
+    pyaudio_module: ModuleType,
+    *,
+    device_index: int | None = None,
+    sample_rate: int | None = None,
+    chunk_size: int | None = None,
+    preferred_rate: int | None = 16000,
+) -> CaptureSettings:
+    """Pick the lowest-latency settings the input device supports.
+
+    Without a ``device_index`` the default input device is used, or, when
+    there is none, the input device reporting the lowest latency.  The sample
+    rate is ``preferred_rate`` (the recognizer's target rate, so no
+    resampling is needed) if the device supports it, then the first supported
+    candidate rate.  The chunk size is the smallest that covers the device's
+    low input latency.  Explicit values are kept as given.
+    """
+    audio = pyaudio_module.PyAudio()
+    try:
+        device = _input_device(audio, device_index)
+        if sample_rate is None:
+            candidates = [preferred_rate, *CANDIDATE_SAMPLE_RATES]
+            candidates.append(int(device["defaultSampleRate"]))
+            sample_rate = next(
+                (
+                    rate
+                    for rate in candidates
+                    if rate and _supports(pyaudio_module, audio, device, rate)
+                ),
+                None,
+            )
+            if sample_rate is None:
+                raise ValueError(
+                    f"No supported sample rate for device {device['index']}"
+                )
+        if chunk_size is None:
+            chunk_size = low_latency_chunk_size(
+                sample_rate, float(device.get("defaultLowInputLatency") or 0.0)
+            )
+    finally:
+        audio.terminate()
+    return CaptureSettings(int(device["index"]), sample_rate, chunk_size)
+
+
+def _input_device(audio: object, device_index: int | None) -> dict[str, object]:
+    if device_index is not None:
+        return audio.get_device_info_by_index(device_index)
+    try:
+        device = audio.get_default_input_device_info()
+    except OSError:
+        device = None
+    if device and device.get("maxInputChannels", 0) > 0:
+        return device
+    inputs = [
+        info
+        for info in map(audio.get_device_info_by_index, range(audio.get_device_count()))
+        if info.get("maxInputChannels", 0) > 0
+    ]
+    if not inputs:
+        raise OSError("No audio input device found")
+    return min(inputs, key=lambda info: info.get("defaultLowInputLatency", math.inf))
+
+
+def _supports(
+    pyaudio_module: ModuleType, audio: object, device: dict[str, object], rate: int
+) -> bool:
+    try:
+        return bool(
+            audio.is_format_supported(
+                rate,
+                input_device=device["index"],
+                input_channels=1,
+                input_format=pyaudio_module.paInt16,
+            )
+        )
+    except ValueError:
+        return False
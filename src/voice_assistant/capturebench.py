@@ -0,0 +1,153 @@
+"""Measure how long captured audio waits in the buffer for each capture setting."""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import speech_recognition as sr
+
+from voice_assistant.capture import CaptureSettings
+from voice_assistant.cli import configure_logging
+from voice_assistant.fakes import FakeMicrophone, synthetic_speech
+from voice_assistant.metrics import percentile
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CaptureBenchmark:
+    """How long captured frames waited before the recognizer could read them."""
+
+    settings: CaptureSettings
+    reads: int
+    mean_delay: float
+    p95_delay: float
+    max_delay: float
+
+
+def benchmark_capture(
+    settings: Iterable[CaptureSettings],
+    *,
+    audio: sr.AudioData | None = None,
+    pause_threshold: float = 0.5,
+) -> list[CaptureBenchmark]:
+    """Listen to ``audio`` from a real-time fake microphone with each of ``settings``.
+
+    The real recognizer reads the microphone as it would in the assistant;
+    for every read the delay from the arrival of its first frame to the
+    read returning is measured.
+    """
+    audio = audio or synthetic_speech(seed=0)
+    results = []
+    for setting in settings:
+        recognizer = sr.Recognizer()
+        recognizer.pause_threshold = pause_threshold
+        recognizer.non_speaking_duration = min(
+            recognizer.non_speaking_duration, pause_threshold
+        )
+        recognizer.dynamic_energy_threshold = False
+        microphone = FakeMicrophone(
+            setting.sample_rate, setting.chunk_size, audio=audio, realtime=True
+        )
+        with microphone as source:
+            start = time.perf_counter()
+            recognizer.listen(source, timeout=5, phrase_time_limit=10)
+            delays = source.stream.read_delays
+        LOGGER.debug(
+            "Listened with %s in %.2fs",
+            setting.describe(),
+            time.perf_counter() - start,
+        )
+        results.append(
+            CaptureBenchmark(
+                settings=setting,
+                reads=len(delays),
+                mean_delay=sum(delays) / len(delays),
+                p95_delay=percentile(delays, 0.95),
+                max_delay=max(delays),
+            )
+        )
+    return results
+
+
+def format_benchmark(results: Iterable[CaptureBenchmark]) -> str:
+    """Render benchmark results as a plain-text table."""
+    lines = [
+        f"{'rate':>6} {'chunk':>6} {'buffer ms':>9} {'reads':>6} "
+        f"{'mean ms':>8} {'p95 ms':>7} {'max ms':>7}"
+    ]
+    for result in results:
+        setting = result.settings
+        lines.append(
+            f"{setting.sample_rate:>6} {setting.chunk_size:>6} "
+            f"{setting.chunk_seconds * 1000:>9.1f} {result.reads:>6} "
+            f"{result.mean_delay * 1000:>8.1f} {result.p95_delay * 1000:>7.1f} "
+            f"{result.max_delay * 1000:>7.1f}"
+        )
+    return "\n".join(lines)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments for the capture benchmark."""
+    parser = argparse.ArgumentParser(
+        description="Measure the delay capture buffering adds for each sample rate and chunk size."
+    )
+    parser.add_argument(
+        "--sample-rates",
+        default="16000,44100",
+        help="Comma-separated sample rates in Hz (default: 16000,44100)",
+    )
+    parser.add_argument(
+        "--chunk-sizes",
+        default="256,512,1024,2048,4096",
+        help="Comma-separated frames per buffer (default: 256,512,1024,2048,4096)",
+    )
+    parser.add_argument(
+        "--pause-threshold",
+        type=float,
+        default=0.5,
+        help="Seconds of silence that end the phrase (default: 0.5)",
+    )
+    parser.add_argument(
+        "--log-level",
+        default="WARNING",
+        choices=["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"],
+        help="Logging verbosity",
+    )
+    args = parser.parse_args(argv)
+    try:
+        args.sample_rates = [int(rate) for rate in args.sample_rates.split(",")]
+        args.chunk_sizes = [int(size) for size in args.chunk_sizes.split(",")]
+    except ValueError:
+        parser.error(
+            "--sample-rates and --chunk-sizes must be comma-separated integers"
+        )
+    if min(args.sample_rates + args.chunk_sizes) < 1:
+        parser.error("sample rates and chunk sizes must be positive")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark for every combination of sample rate and chunk size."""
+    args = parse_args(argv)
+    configure_logging(args.log_level)
+    settings = [
+        CaptureSettings(None, rate, size)
+        for rate in args.sample_rates
+        for size in args.chunk_sizes
+    ]
+    print(
+        format_benchmark(
+            benchmark_capture(settings, pause_threshold=args.pause_threshold)
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
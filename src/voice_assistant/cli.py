@@ -8,6 +8,8 @@ import sys
 
 from voice_assistant.assistant import VoiceAssistant
 from voice_assistant.config import AssistantConfig
+from voice_assistant.memory import install_memory_dump
+from voice_assistant.recognition import BACKENDS
 
 
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
@@ -64,6 +66,173 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         default=0.8,
         help="Seconds of silence that will mark the end of a phrase",
     )
+    parser.add_argument(
+        "--target-sample-rate",
+        type=int,
+        default=16000,
+        help="Downsample captured audio to this rate before recognition (default: 16000)",
+    )
+    parser.add_argument(
+        "--no-trim-silence",
+        dest="trim_silence",
+        action="store_false",
+        help="Send captured audio without trimming leading and trailing silence",
+    )
+    parser.add_argument(
+        "--autotune",
+        action="store_true",
+        help="Learn pause threshold, noise calibration and timeouts from recent sessions",
+    )
+    parser.add_argument(
+        "--tuning-profile",
+        dest="tuning_profile",
+        help="File that stores the learned tuning profile (default: ~/.voice-assistant/tuning.json)",
+    )
+    parser.add_argument(
+        "--no-warm-up",
+        dest="warm_up",
+        action="store_false",
+        help="Initialize the audio mixer and the OpenAI client lazily instead of at start-up",
+    )
+    parser.add_argument(
+        "--mixer-buffer-size",
+        type=int,
+        default=512,
+        help="Playback buffer size in samples; smaller starts audio sooner (default: 512)",
+    )
+    parser.add_argument(
+        "--record-session",
+        dest="record_session",
+        help="Append every interaction (audio, transcripts, responses, timings) to this file",
+    )
+    parser.add_argument(
+        "--device-index",
+        type=int,
+        help="Input device index (default: the system's default input device)",
+    )
+    parser.add_argument(
+        "--capture-sample-rate",
+        type=int,
+        help="Microphone sample rate in Hz (default: the device's default rate)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        help="Frames per capture buffer; smaller buffers add less latency (default: 1024)",
+    )
+    parser.add_argument(
+        "--auto-capture",
+        action="store_true",
+        help="Select the lowest-latency device, sample rate and chunk size the hardware supports",
+    )
+    parser.add_argument(
+        "--barge-in",
+        action="store_true",
+        help="Stop speaking and cancel generation when the user talks over the assistant",
+    )
+    parser.add_argument(
+        "--barge-in-ratio",
+        type=float,
+        default=3.0,
+        help="Speech must be this many times louder than the recognizer's energy threshold to interrupt (default: 3.0)",
+    )
+    parser.add_argument(
+        "--barge-in-min-speech",
+        type=float,
+        default=0.2,
+        help="Seconds of continuous speech that count as an interruption (default: 0.2)",
+    )
+    parser.add_argument(
+        "--synthesis-workers",
+        type=int,
+        default=4,
+        help="Synthesize long responses sentence by sentence on this many threads; 1 sends the whole response at once (default: 4)",
+    )
+    parser.add_argument(
+        "--faq",
+        dest="faq_path",
+        help="JSON file of question/answer pairs answered locally without calling OpenAI",
+    )
+    parser.add_argument(
+        "--faq-threshold",
+        type=float,
+        default=0.75,
+        help="Minimum similarity (0-1) for a question to be answered from the FAQ (default: 0.75)",
+    )
+    parser.add_argument(
+        "--recognizers",
+        default="google",
+        help=(
+            "Comma-separated speech recognizers to race, from "
+            f"{', '.join(BACKENDS)} (default: google)"
+        ),
+    )
+    parser.add_argument(
+        "--recognition-confidence",
+        type=float,
+        default=0.7,
+        help="Confidence (0-1) at which a racing recognizer's transcript wins (default: 0.7)",
+    )
+    parser.add_argument(
+        "--recognition-timeout",
+        type=float,
+        default=3.0,
+        help="Seconds after which racing recognizers settle for the best transcript so far (default: 3.0)",
+    )
+    parser.add_argument(
+        "--speculative-prefetch",
+        action="store_true",
+        help="Start generating from an early, unsure transcript of racing recognizers",
+    )
+    parser.add_argument(
+        "--speculation-min-words",
+        type=int,
+        default=3,
+        help="Words an early transcript needs before generating from it (default: 3)",
+    )
+    parser.add_argument(
+        "--fast-model",
+        help="Cheaper, faster chat model for simple questions; --model answers the rest",
+    )
+    parser.add_argument(
+        "--route-prompt-words",
+        type=int,
+        default=25,
+        help="Questions longer than this many words go to --model (default: 25)",
+    )
+    parser.add_argument(
+        "--degraded-latency",
+        type=float,
+        default=5.0,
+        help="Average seconds per request above which a routed model is avoided (default: 5.0)",
+    )
+    parser.add_argument(
+        "--requests-per-minute",
+        type=int,
+        help="OpenAI request budget to schedule against before rate-limit headers arrive",
+    )
+    parser.add_argument(
+        "--tokens-per-minute",
+        type=int,
+        help="OpenAI token budget to schedule against before rate-limit headers arrive",
+    )
+    parser.add_argument(
+        "--profile",
+        dest="profile_dir",
+        metavar="DIR",
+        help="Write per-stage pstats and collapsed-stack profiles to this directory",
+    )
+    parser.add_argument(
+        "--profile-interactions",
+        type=int,
+        default=5,
+        help="Number of interactions to profile with --profile (default: 5)",
+    )
+    parser.add_argument(
+        "--memory-diagnostics",
+        action="store_true",
+        help="Trace allocations and log a memory report whenever the process receives SIGUSR1",
+    )
     parser.add_argument(
         "--once", action="store_true", help="Exit after answering a single question"
     )
@@ -73,7 +242,22 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         choices=["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"],
         help="Logging verbosity",
     )
-    return parser.parse_args(argv)
+    args = parser.parse_args(argv)
+    args.recognizers = [name.strip() for name in args.recognizers.split(",")]
+    unknown = [name for name in args.recognizers if name not in BACKENDS]
+    if unknown:
+        parser.error(f"unknown recognizer: {', '.join(unknown)}")
+    if args.recognition_timeout <= 0:
+        parser.error("--recognition-timeout must be positive")
+    if args.target_sample_rate < 8000:
+        parser.error("--target-sample-rate must be at least 8000")
+    if args.chunk_size is not None and args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+    if args.synthesis_workers < 1:
+        parser.error("--synthesis-workers must be at least 1")
+    if args.profile_interactions < 1:
+        parser.error("--profile-interactions must be at least 1")
+    return args
 
 
 def configure_logging(level: str) -> None:
@@ -88,6 +272,8 @@ def main(argv: list[str] | None = None) -> int:
     """Main entry point for the voice assistant CLI."""
     args = parse_args(argv)
     configure_logging(args.log_level)
+    if args.memory_diagnostics:
+        install_memory_dump()
 
     config = AssistantConfig(
         keyword=args.keyword,
@@ -98,10 +284,42 @@ def main(argv: list[str] | None = None) -> int:
         phrase_time_limit=args.phrase_time_limit,
         ambient_noise_duration=args.ambient_noise_duration,
         pause_threshold=args.pause_threshold,
+        target_sample_rate=args.target_sample_rate,
+        trim_silence=args.trim_silence,
+        autotune=args.autotune,
+        tuning_profile=args.tuning_profile,
+        warm_up=args.warm_up,
+        mixer_buffer_size=args.mixer_buffer_size,
+        record_session=args.record_session,
+        device_index=args.device_index,
+        capture_sample_rate=args.capture_sample_rate,
+        chunk_size=args.chunk_size,
+        auto_capture=args.auto_capture,
+        barge_in=args.barge_in,
+        barge_in_ratio=args.barge_in_ratio,
+        barge_in_min_speech=args.barge_in_min_speech,
+        synthesis_workers=args.synthesis_workers,
+        faq_path=args.faq_path,
+        faq_threshold=args.faq_threshold,
+        recognizers=args.recognizers,
+        recognition_confidence=args.recognition_confidence,
+        recognition_timeout=args.recognition_timeout,
+        speculative_prefetch=args.speculative_prefetch,
+        speculation_min_words=args.speculation_min_words,
+        fast_model=args.fast_model,
+        route_prompt_words=args.route_prompt_words,
+        degraded_latency=args.degraded_latency,
+        requests_per_minute=args.requests_per_minute,
+        tokens_per_minute=args.tokens_per_minute,
+        profile_dir=args.profile_dir,
+        profile_interactions=args.profile_interactions,
     )
 
     assistant = VoiceAssistant(api_key=args.api_key, config=config)
-    assistant.run(once=args.once)
+    try:
+        assistant.run(once=args.once)
+    finally:
+        assistant.close()
     return 0
 
 
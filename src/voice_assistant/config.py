@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -17,3 +17,33 @@ class AssistantConfig:
     ambient_noise_duration: float = 0.5
     listen_timeout: float | None = None
     phrase_time_limit: float | None = None
+    target_sample_rate: int | None = 16000
+    trim_silence: bool = True
+    silence_padding: float = 0.2
+    autotune: bool = False
+    tuning_profile: str | None = None
+    warm_up: bool = True
+    mixer_buffer_size: int = 512
+    record_session: str | None = None
+    device_index: int | None = None
+    capture_sample_rate: int | None = None
+    chunk_size: int | None = None
+    auto_capture: bool = False
+    barge_in: bool = False
+    barge_in_ratio: float = 3.0
+    barge_in_min_speech: float = 0.2
+    synthesis_workers: int = 4
+    faq_path: str | None = None
+    faq_threshold: float = 0.75
+    requests_per_minute: int | None = None
+    tokens_per_minute: int | None = None
+    profile_dir: str | None = None
+    profile_interactions: int = 5
+    fast_model: str | None = None
+    route_prompt_words: int = 25
+    degraded_latency: float = 5.0
+    recognizers: list[str] = field(default_factory=lambda: ["google"])
+    recognition_confidence: float = 0.7
+    recognition_timeout: float = 3.0
+    speculative_prefetch: bool = False
+    speculation_min_words: int = 3
@@ -0,0 +1,273 @@
+"""In-process stand-ins for the microphone, recognizer and OpenAI client.
+
+These drive :class:`~voice_assistant.assistant.VoiceAssistant` through its real
+code paths without audio hardware or network access, for replay, load and
+soak testing.
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from types import SimpleNamespace
+
+import numpy as np
+import speech_recognition as sr
+
+from voice_assistant.audio import array_to_pcm
+
+Delay = Callable[[], float]
+
+# A silent MPEG-1 Layer III frame: 128 kbit/s, 44.1 kHz, 1152 samples.
+_SILENT_MP3_FRAME = b"\xff\xfb\x90\x00" + b"\x00" * 413
+_MP3_FRAME_SECONDS = 1152 / 44100
+
+
+def fixed_delay(seconds: float) -> Delay:
+    """Return a delay function that always waits ``seconds``."""
+    return lambda: seconds
+
+
+def synthetic_speech(
+    seconds: float = 1.5,
+    sample_rate: int = 16000,
+    *,
+    lead: float = 0.3,
+    tail: float = 0.8,
+    seed: int | None = None,
+) -> sr.AudioData:
+    """Generate a syllable-like tone burst pattern surrounded by silence."""
+    rng = np.random.default_rng(seed)
+    times = np.arange(int(seconds * sample_rate)) / sample_rate
+    pitch = rng.uniform(120, 220)
+    voiced = np.sin(2 * np.pi * pitch * times) * (
+        0.5 + 0.5 * np.sin(2 * np.pi * 4 * times)
+    )
+    noise = rng.normal(0, 0.002, int((lead + seconds + tail) * sample_rate))
+    signal = noise.astype(np.float32)
+    start = int(lead * sample_rate)
+    signal[start : start + len(voiced)] += 0.4 * voiced
+    return sr.AudioData(array_to_pcm(signal), sample_rate, 2)
+
+
+def silent_mp3(seconds: float = 0.1) -> bytes:
+    """Return an MP3 of silence that pygame can load and play like gTTS output."""
+    # mpg123 will not play a stream shorter than a couple of frames.
+    return _SILENT_MP3_FRAME * max(3, math.ceil(seconds / _MP3_FRAME_SECONDS))
+
+
+class FakeAudioStream:
+    """Input stream that plays back PCM, then silence, like a microphone stream.
+
+    With ``realtime`` each :meth:`read` blocks until the requested frames would
+    have been captured by real hardware, and :attr:`read_delays` records how
+    long the first frame of each read had been waiting in the buffer.
+    """
+
+    def __init__(
+        self,
+        frame_data: bytes = b"",
+        *,
+        sample_rate: int = 16000,
+        sample_width: int = 2,
+        realtime: bool = False,
+    ) -> None:
+        self._data = frame_data
+        self._position = 0
+        self.sample_rate = sample_rate
+        self.sample_width = sample_width
+        self.realtime = realtime
+        self.read_delays: list[float] = []
+        self._next_frame_time: float | None = None
+
+    def read(self, size: int) -> bytes:
+        """Return ``size`` frames of audio."""
+        if self.realtime:
+            now = time.perf_counter()
+            if self._next_frame_time is None:
+                self._next_frame_time = now
+            first_frame_time = self._next_frame_time
+            self._next_frame_time += size / self.sample_rate
+            time.sleep(max(0.0, self._next_frame_time - now))
+            self.read_delays.append(time.perf_counter() - first_frame_time)
+
+        length = size * self.sample_width
+        chunk = self._data[self._position : self._position + length]
+        self._position += len(chunk)
+        return chunk + b"\x00" * (length - len(chunk))
+
+    def close(self) -> None:
+        return None
+
+
+class FakeMicrophone(sr.AudioSource):
+    """Audio source that satisfies ``with microphone as source`` without a device.
+
+    ``audio`` is what the microphone "hears"; it is followed by silence.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        chunk_size: int = 1024,
+        *,
+        audio: sr.AudioData | None = None,
+        realtime: bool = False,
+    ) -> None:
+        self.SAMPLE_RATE = sample_rate
+        self.SAMPLE_WIDTH = 2
+        self.CHUNK = chunk_size
+        self.audio = audio
+        self.realtime = realtime
+        self.stream: FakeAudioStream | None = None
+
+    def __enter__(self) -> FakeMicrophone:
+        frame_data = b""
+        if self.audio is not None:
+            frame_data = self.audio.get_raw_data(
+                convert_rate=self.SAMPLE_RATE, convert_width=self.SAMPLE_WIDTH
+            )
+        self.stream = FakeAudioStream(
+            frame_data,
+            sample_rate=self.SAMPLE_RATE,
+            sample_width=self.SAMPLE_WIDTH,
+            realtime=self.realtime,
+        )
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stream = None
+
+
+class ScriptedRecognizer:
+    """Recognizer that returns scripted audio and transcripts after a delay.
+
+    ``audio`` and ``transcripts`` are cycled, so a short script can drive any
+    number of interactions.  A ``None`` transcript raises
+    :class:`speech_recognition.UnknownValueError` like an unintelligible capture.
+    """
+
+    def __init__(
+        self,
+        audio: Iterable[sr.AudioData],
+        transcripts: Iterable[str | None],
+        *,
+        listen_delay: Delay | None = None,
+        recognize_delay: Delay | None = None,
+    ) -> None:
+        self._audio = itertools.cycle(list(audio))
+        self._transcripts = itertools.cycle(list(transcripts))
+        self._lock = threading.Lock()
+        self.listen_delay = listen_delay or fixed_delay(0.0)
+        self.recognize_delay = recognize_delay or fixed_delay(0.0)
+        self.pause_threshold = 0.8
+        self.energy_threshold = 300
+
+    def adjust_for_ambient_noise(
+        self, source: sr.AudioSource, duration: float = 1
+    ) -> None:
+        return None
+
+    def listen(
+        self, source: sr.AudioSource, timeout=None, phrase_time_limit=None
+    ) -> sr.AudioData:
+        time.sleep(self.listen_delay())
+        with self._lock:
+            return next(self._audio)
+
+    def recognize_google(self, audio_data: sr.AudioData, **kwargs) -> str:
+        time.sleep(self.recognize_delay())
+        with self._lock:
+            transcript = next(self._transcripts)
+        if transcript is None:
+            raise sr.UnknownValueError()
+        return transcript
+
+
+class FakeRecognitionBackend:
+    """Speech recognition backend for racing recognizers, answering after a delay.
+
+    A ``None`` transcript raises :class:`speech_recognition.UnknownValueError`;
+    ``error`` is raised instead of answering.
+    """
+
+    def __init__(
+        self,
+        transcript: str | None,
+        confidence: float | None = None,
+        *,
+        delay: Delay | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        self.transcript = transcript
+        self.confidence = confidence
+        self.delay = delay or fixed_delay(0.0)
+        self.error = error
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, audio: sr.AudioData) -> tuple[str, float | None]:
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay())
+        if self.error is not None:
+            raise self.error
+        if self.transcript is None:
+            raise sr.UnknownValueError()
+        return self.transcript, self.confidence
+
+
+class FakeOpenAIClient:
+    """Minimal ``OpenAI`` client double answering chat completions from a script."""
+
+    def __init__(
+        self,
+        responses: Iterable[str],
+        *,
+        delay: Delay | None = None,
+        chunk_delay: float = 0.0,
+    ) -> None:
+        self._responses = itertools.cycle(list(responses))
+        self._lock = threading.Lock()
+        self.delay = delay or fixed_delay(0.0)
+        self.chunk_delay = chunk_delay
+        self.request_count = 0
+        self.last_request: dict[str, object] | None = None
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+        self.models = SimpleNamespace(retrieve=lambda model: SimpleNamespace(id=model))
+
+    def _create(self, **kwargs) -> SimpleNamespace | FakeCompletionStream:
+        time.sleep(self.delay())
+        with self._lock:
+            self.request_count += 1
+            self.last_request = kwargs
+            content = next(self._responses)
+        if kwargs.get("stream"):
+            return FakeCompletionStream(content, chunk_delay=self.chunk_delay)
+        message = SimpleNamespace(role="assistant", content=content)
+        usage = SimpleNamespace(completion_tokens=max(1, len(content.split())))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=usage)
+
+
+class FakeCompletionStream:
+    """Streamed chat completion yielding one word per chunk."""
+
+    def __init__(self, content: str, *, chunk_delay: float = 0.0) -> None:
+        self._words = content.split(" ")
+        self.chunk_delay = chunk_delay
+        self.closed = False
+
+    def __iter__(self) -> Iterator[SimpleNamespace]:
+        for index, word in enumerate(self._words):
+            if self.closed:
+                raise RuntimeError("Stream closed")
+            time.sleep(self.chunk_delay)
+            text = word if index == 0 else f" {word}"
+            delta = SimpleNamespace(content=text)
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+    def close(self) -> None:
+        self.closed = True
@@ -0,0 +1,157 @@
+"""Answer known questions locally with a character n-gram TF-IDF index."""
+
+from __future__ import annotations
+
+import json
+import re
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+NGRAM_SIZES = (3, 4)
+DEFAULT_THRESHOLD = 0.75
+
+_NON_WORD = re.compile(r"[^\w\s]+")
+_SPACES = re.compile(r"\s+")
+
+
+def normalize(text: str) -> str:
+    """Lowercase ``text`` and drop punctuation so phrasing differences matter less."""
+    return _SPACES.sub(" ", _NON_WORD.sub(" ", text.lower())).strip()
+
+
+def char_ngrams(text: str, sizes: Iterable[int] = NGRAM_SIZES) -> list[str]:
+    """Character n-grams of ``text`` with word boundaries marked by spaces."""
+    padded = f" {normalize(text)} "
+    return [
+        padded[start : start + size]
+        for size in sizes
+        for start in range(len(padded) - size + 1)
+    ]
+
+
+@dataclass(frozen=True)
+class FaqEntry:
+    """An answer and the phrasings of the question it answers."""
+
+    questions: tuple[str, ...]
+    answer: str
+
+
+@dataclass(frozen=True)
+class FaqMatch:
+    """The closest FAQ entry to a query and its cosine similarity."""
+
+    question: str
+    answer: str
+    score: float
+
+
+def load_entries(path: str | Path) -> list[FaqEntry]:
+    """Read question/answer pairs from a JSON file.
+
+    The file holds a list of objects with an ``answer`` and either a
+    ``question`` string or a ``questions`` list of alternative phrasings.
+    """
+    data = json.loads(Path(path).expanduser().read_text(encoding="utf-8"))
+    if not isinstance(data, list):
+        raise ValueError("FAQ file must contain a list of question/answer objects")
+
+    entries = []
+    for item in data:
+        if not isinstance(item, dict):
+            raise ValueError(f"FAQ entry must be an object: {item!r}")
+        questions = item.get("questions") or [item.get("question")]
+        if not item.get("answer") or not all(questions):
+            raise ValueError(f"FAQ entry needs a question and an answer: {item!r}")
+        if not isinstance(questions, list) or not all(
+            isinstance(question, str) for question in questions
+        ):
+            raise ValueError(f"FAQ entry questions must be strings: {item!r}")
+        entries.append(FaqEntry(tuple(questions), item["answer"]))
+    return entries
+
+
+class FaqIndex:
+    """TF-IDF weighted character n-gram vectors for every known question.
+
+    Each question phrasing is a row of an L2-normalized matrix, so a lookup is
+    one matrix-vector product.  Character n-grams tolerate the small spelling
+    and word-order differences speech recognition introduces.
+    """
+
+    def __init__(
+        self, entries: Iterable[FaqEntry], *, threshold: float = DEFAULT_THRESHOLD
+    ) -> None:
+        self.threshold = threshold
+        self._questions: list[str] = []
+        self._answers: list[str] = []
+        for entry in entries:
+            for question in entry.questions:
+                self._questions.append(question)
+                self._answers.append(entry.answer)
+
+        grams = [char_ngrams(question) for question in self._questions]
+        self._vocabulary: dict[str, int] = {}
+        for question_grams in grams:
+            for gram in question_grams:
+                self._vocabulary.setdefault(gram, len(self._vocabulary))
+
+        rows = np.repeat(np.arange(len(grams)), [len(row) for row in grams])
+        columns = [self._vocabulary[gram] for row in grams for gram in row]
+        counts = np.zeros((len(grams), len(self._vocabulary)), dtype=np.float32)
+        np.add.at(counts, (rows, columns), 1)
+
+        document_frequency = np.count_nonzero(counts, axis=0)
+        self._idf = (np.log((1 + len(grams)) / (1 + document_frequency)) + 1).astype(
+            np.float32
+        )
+        # N-grams never seen in a question are as informative as the rarest ones.
+        self._unknown_idf = float(self._idf.max()) if len(self._idf) else 1.0
+        self._matrix = _normalize_rows(counts * self._idf)
+
+    @classmethod
+    def load(
+        cls, path: str | Path, *, threshold: float = DEFAULT_THRESHOLD
+    ) -> FaqIndex:
+        return cls(load_entries(path), threshold=threshold)
+
+    def __len__(self) -> int:
+        return len(self._questions)
+
+    def best_match(self, query: str) -> FaqMatch | None:
+        """Return the most similar known question, whatever its score."""
+        if not self._questions:
+            return None
+        vector = np.zeros(len(self._vocabulary), dtype=np.float32)
+        unknown: Counter[str] = Counter()
+        for gram in char_ngrams(query):
+            column = self._vocabulary.get(gram)
+            if column is None:
+                unknown[gram] += 1
+            else:
+                vector[column] += 1
+        vector *= self._idf
+        unknown_weight = sum(count**2 for count in unknown.values())
+        norm = np.sqrt(np.dot(vector, vector) + unknown_weight * self._unknown_idf**2)
+        if norm == 0:
+            return None
+
+        scores = self._matrix @ (vector / norm)
+        row = int(np.argmax(scores))
+        return FaqMatch(self._questions[row], self._answers[row], float(scores[row]))
+
+    def lookup(self, query: str) -> FaqMatch | None:
+        """Return the closest known question if it scores at least :attr:`threshold`."""
+        match = self.best_match(query)
+        if match is None or match.score < self.threshold:
+            return None
+        return match
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1, norms)
@@ -0,0 +1,355 @@
+"""Drive many simulated assistants against local stub services at rising concurrency."""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import os
+import sys
+import threading
+import time
+import urllib.request
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import speech_recognition as sr
+
+from voice_assistant.assistant import VoiceAssistant
+from voice_assistant.cli import configure_logging
+from voice_assistant.config import AssistantConfig
+from voice_assistant.fakes import FakeMicrophone, ScriptedRecognizer, synthetic_speech
+from voice_assistant.metrics import percentile
+from voice_assistant.stubs import LatencyDistribution, StubServices
+from voice_assistant.workers import WorkerPool
+
+WORKER_MODES = ("thread", "process", "pool")
+
+
+class StubRecognizer(ScriptedRecognizer):
+    """Scripted microphone input transcribed by the real Google client against a stub endpoint."""
+
+    def __init__(self, audio: sr.AudioData, endpoint: str) -> None:
+        super().__init__([audio], [None])
+        self.endpoint = endpoint
+        self.operation_timeout = 30
+
+    def recognize_google(self, audio_data: sr.AudioData, **kwargs) -> str:
+        return sr.Recognizer.recognize_google(
+            self, audio_data, endpoint=self.endpoint, **kwargs
+        )
+
+
+class StubbedAssistant(VoiceAssistant):
+    """Assistant wired to :class:`~voice_assistant.stubs.StubServices` endpoints.
+
+    Audio preprocessing, FLAC encoding, HTTP clients and response parsing all run
+    for real; only the microphone and speaker are simulated.
+    """
+
+    def __init__(self, endpoints: ServiceEndpoints, *, seed: int | None = None) -> None:
+        super().__init__(
+            api_key="stub",
+            config=AssistantConfig(warm_up=False),
+            recognizer=StubRecognizer(synthetic_speech(seed=seed), endpoints.stt),
+        )
+        self.client = self._create_client("stub", base_url=endpoints.openai)
+        self._microphone = FakeMicrophone()
+        self.tts_endpoint = endpoints.tts
+
+    def _prompt(self, message: str) -> None:
+        return None
+
+    def speak_text(self, text: str) -> None:
+        """Fetch synthesized audio from the stub TTS service without playing it."""
+        request = urllib.request.Request(self.tts_endpoint, data=text.encode("utf-8"))
+        with self._stage("synthesis"), urllib.request.urlopen(request) as response:
+            response.read()
+
+
+@dataclass(frozen=True)
+class ServiceEndpoints:
+    """URLs of the stub services, passed to worker processes."""
+
+    openai: str
+    stt: str
+    tts: str
+
+    @classmethod
+    def from_services(cls, services: StubServices) -> ServiceEndpoints:
+        return cls(
+            openai=services.openai_base_url,
+            stt=services.stt_endpoint,
+            tts=services.tts_endpoint,
+        )
+
+
+@dataclass
+class WorkerResult:
+    """Latencies of every interaction one worker completed, and its CPU time."""
+
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    cpu_seconds: float = 0.0
+
+
+def run_worker(endpoints: ServiceEndpoints, deadline: float, seed: int) -> WorkerResult:
+    """Run interactions back to back on one assistant until ``deadline`` (epoch seconds)."""
+    assistant = StubbedAssistant(endpoints, seed=seed)
+    result = WorkerResult()
+    cpu_start = time.thread_time()
+    while time.time() < deadline:
+        start = time.perf_counter()
+        interaction = assistant.interact()
+        result.latencies.append(time.perf_counter() - start)
+        if interaction.error or not interaction.response:
+            result.errors += 1
+    result.cpu_seconds = time.thread_time() - cpu_start
+    return result
+
+
+@dataclass(frozen=True)
+class LevelReport:
+    """Throughput, latency and resource usage at one concurrency level.
+
+    ``cpu_percent`` counts the workers only, not the stub services serving
+    them from this process.
+    """
+
+    concurrency: int
+    interactions: int
+    errors: int
+    duration: float
+    p50: float
+    p95: float
+    p99: float
+    cpu_percent: float
+    peak_threads: int
+    peak_open_files: int | None
+
+    @property
+    def throughput(self) -> float:
+        return self.interactions / self.duration if self.duration else 0.0
+
+
+def _open_file_count() -> int | None:
+    fd_dir = Path("/proc/self/fd")
+    return len(os.listdir(fd_dir)) if fd_dir.is_dir() else None
+
+
+class _ResourceSampler(threading.Thread):
+    """Track peak thread and file descriptor counts of this process."""
+
+    def __init__(self, interval: float = 0.1) -> None:
+        super().__init__(name="loadtest-sampler", daemon=True)
+        self.interval = interval
+        self.peak_threads = 0
+        self.peak_open_files: int | None = None
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.is_set():
+            self.peak_threads = max(self.peak_threads, threading.active_count())
+            open_files = _open_file_count()
+            if open_files is not None:
+                self.peak_open_files = max(self.peak_open_files or 0, open_files)
+            self._stop_event.wait(self.interval)
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+
+def run_level(
+    endpoints: ServiceEndpoints,
+    concurrency: int,
+    *,
+    duration: float,
+    mode: str = "thread",
+) -> LevelReport:
+    """Run ``concurrency`` workers for ``duration`` seconds and summarize them.
+
+    ``thread`` and ``process`` run independent assistants; ``pool`` feeds
+    synthetic questions through a :class:`~voice_assistant.workers.WorkerPool`
+    of ``concurrency`` processes.
+    """
+    if mode not in WORKER_MODES:
+        raise ValueError(f"Unknown worker mode '{mode}'; choose from {WORKER_MODES}")
+    if mode == "pool":
+        return _run_pool_level(endpoints, concurrency, duration=duration)
+
+    executor: Executor
+    if mode == "process":
+        executor = ProcessPoolExecutor(max_workers=concurrency)
+    else:
+        executor = ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="loadtest"
+        )
+
+    sampler = _ResourceSampler()
+    sampler.start()
+    start = time.perf_counter()
+    deadline = time.time() + duration
+    with executor:
+        futures = [
+            executor.submit(run_worker, endpoints, deadline, seed)
+            for seed in range(concurrency)
+        ]
+        results = [future.result() for future in futures]
+    elapsed = time.perf_counter() - start
+    cpu_used = sum(result.cpu_seconds for result in results)
+    sampler.stop()
+
+    latencies = [latency for result in results for latency in result.latencies]
+    return LevelReport(
+        concurrency=concurrency,
+        interactions=len(latencies),
+        errors=sum(result.errors for result in results),
+        duration=elapsed,
+        p50=percentile(latencies, 0.5) if latencies else 0.0,
+        p95=percentile(latencies, 0.95) if latencies else 0.0,
+        p99=percentile(latencies, 0.99) if latencies else 0.0,
+        cpu_percent=100.0 * cpu_used / elapsed if elapsed else 0.0,
+        peak_threads=sampler.peak_threads,
+        peak_open_files=sampler.peak_open_files,
+    )
+
+
+def _run_pool_level(
+    endpoints: ServiceEndpoints, processes: int, *, duration: float
+) -> LevelReport:
+    """Measure a worker pool; process start-up is excluded from the results."""
+    audio = synthetic_speech(seed=0)
+    pool = WorkerPool(functools.partial(StubbedAssistant, endpoints), processes)
+    with pool:
+        sampler = _ResourceSampler()
+        sampler.start()
+        start = time.perf_counter()
+        deadline = time.time() + duration
+
+        def questions():
+            while time.time() < deadline:
+                yield audio
+
+        interactions = list(pool.map(questions()))
+        elapsed = time.perf_counter() - start
+        sampler.stop()
+
+    latencies = [interaction.timings["interaction"] for interaction in interactions]
+    cpu_used = pool.worker_cpu_seconds
+    return LevelReport(
+        concurrency=processes,
+        interactions=len(interactions),
+        errors=sum(
+            1
+            for interaction in interactions
+            if interaction.error or not interaction.response
+        ),
+        duration=elapsed,
+        p50=percentile(latencies, 0.5) if latencies else 0.0,
+        p95=percentile(latencies, 0.95) if latencies else 0.0,
+        p99=percentile(latencies, 0.99) if latencies else 0.0,
+        cpu_percent=100.0 * cpu_used / elapsed if elapsed else 0.0,
+        peak_threads=sampler.peak_threads,
+        peak_open_files=sampler.peak_open_files,
+    )
+
+
+def format_reports(reports: list[LevelReport]) -> str:
+    """Render the per-level results as a table."""
+    lines = [
+        f"{'workers':>8}{'done':>8}{'errors':>8}{'req/s':>9}{'p50 s':>9}{'p95 s':>9}"
+        f"{'p99 s':>9}{'cpu %':>8}{'threads':>9}{'fds':>6}"
+    ]
+    for report in reports:
+        fds = "-" if report.peak_open_files is None else str(report.peak_open_files)
+        lines.append(
+            f"{report.concurrency:>8}{report.interactions:>8}{report.errors:>8}"
+            f"{report.throughput:>9.2f}{report.p50:>9.3f}{report.p95:>9.3f}"
+            f"{report.p99:>9.3f}{report.cpu_percent:>8.1f}{report.peak_threads:>9}{fds:>6}"
+        )
+    return "\n".join(lines)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments for the load generator."""
+    parser = argparse.ArgumentParser(
+        description="Load test simulated voice assistants against local stub services."
+    )
+    parser.add_argument(
+        "--levels",
+        default="1,2,4,8",
+        help="Comma-separated concurrency levels to ramp through (default: 1,2,4,8)",
+    )
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=10.0,
+        help="Seconds to run each concurrency level (default: 10)",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=WORKER_MODES,
+        default="thread",
+        help="Run each simulated assistant in a thread or a separate process, or feed a worker pool",
+    )
+    parser.add_argument(
+        "--llm-latency",
+        type=LatencyDistribution.parse,
+        default="lognormal:0.8:0.4",
+        help="Stub chat completion latency (default: lognormal:0.8:0.4)",
+    )
+    parser.add_argument(
+        "--stt-latency",
+        type=LatencyDistribution.parse,
+        default="lognormal:0.4:0.3",
+        help="Stub speech recognition latency (default: lognormal:0.4:0.3)",
+    )
+    parser.add_argument(
+        "--tts-latency",
+        type=LatencyDistribution.parse,
+        default="lognormal:0.3:0.3",
+        help="Stub text-to-speech latency (default: lognormal:0.3:0.3)",
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=int,
+        help="Stub chat completion requests allowed per minute; excess requests get 429",
+    )
+    parser.add_argument(
+        "--log-level",
+        default="WARNING",
+        choices=["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"],
+        help="Logging verbosity",
+    )
+    args = parser.parse_args(argv)
+    try:
+        args.levels = [int(level) for level in args.levels.split(",")]
+    except ValueError:
+        parser.error("--levels must be comma-separated integers")
+    if any(level < 1 for level in args.levels):
+        parser.error("--levels must be positive")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Ramp through the concurrency levels and print a report."""
+    args = parse_args(argv)
+    configure_logging(args.log_level)
+
+    print(format_reports([]), flush=True)
+    with StubServices(
+        llm_latency=args.llm_latency,
+        stt_latency=args.stt_latency,
+        tts_latency=args.tts_latency,
+        rate_limit=args.rate_limit,
+    ) as services:
+        endpoints = ServiceEndpoints.from_services(services)
+        for level in args.levels:
+            report = run_level(endpoints, level, duration=args.duration, mode=args.mode)
+            print(format_reports([report]).splitlines()[-1], flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
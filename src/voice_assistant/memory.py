@@ -0,0 +1,89 @@
+"""Memory measurements and an on-demand memory report for long-running processes."""
+
+from __future__ import annotations
+
+import logging
+import os
+import signal
+import tracemalloc
+
+LOGGER = logging.getLogger(__name__)
+
+TRACEBACK_FRAMES = 10
+_IGNORED_FILES = (tracemalloc.__file__, "<frozen importlib._bootstrap>")
+
+
+def rss_bytes() -> int | None:
+    """Resident set size of this process, or ``None`` where ``/proc`` is unavailable."""
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def top_allocations(
+    snapshot: tracemalloc.Snapshot,
+    baseline: tracemalloc.Snapshot | None = None,
+    *,
+    limit: int = 10,
+) -> list[str]:
+    """Describe the allocation sites holding the most memory.
+
+    With a ``baseline`` the sites are ranked by growth since that snapshot.
+    """
+    filters = [tracemalloc.Filter(False, filename) for filename in _IGNORED_FILES]
+    snapshot = snapshot.filter_traces(filters)
+    if baseline is None:
+        stats = snapshot.statistics("lineno")
+        return [
+            f"{stat.size / 1024:.1f} KiB in {stat.count} blocks at {_site(stat)}"
+            for stat in stats[:limit]
+        ]
+    differences = snapshot.compare_to(baseline.filter_traces(filters), "lineno")
+    return [
+        f"{stat.size_diff / 1024:+.1f} KiB ({stat.count_diff:+d} blocks) at {_site(stat)}"
+        for stat in differences[:limit]
+    ]
+
+
+def _site(stat: tracemalloc.Statistic | tracemalloc.StatisticDiff) -> str:
+    frame = stat.traceback[0]
+    return f"{frame.filename}:{frame.lineno}"
+
+
+def memory_report(*, limit: int = 10) -> str:
+    """Current RSS and, when tracing, the largest allocation sites."""
+    rss = rss_bytes()
+    lines = [f"RSS: {'unknown' if rss is None else f'{rss / 2**20:.1f} MiB'}"]
+    if tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        lines.append(f"Traced: {current / 2**20:.1f} MiB (peak {peak / 2**20:.1f} MiB)")
+        lines.extend(top_allocations(tracemalloc.take_snapshot(), limit=limit))
+    else:
+        lines.append("tracemalloc is not tracing; allocation sites unavailable")
+    return "\n".join(lines)
+
+
+def install_memory_dump(signum: int | None = None, *, limit: int = 10) -> bool:
+    """Log :func:`memory_report` whenever the process receives ``signum``.
+
+    Defaults to ``SIGUSR1`` and starts :mod:`tracemalloc` so allocation sites
+    are available.  Returns ``False`` on platforms without that signal.
+    """
+    if signum is None:
+        signum = getattr(signal, "SIGUSR1", None)
+        if signum is None:
+            LOGGER.warning("Memory dumps need SIGUSR1, which this platform lacks")
+            return False
+
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(TRACEBACK_FRAMES)
+
+    def dump(received: int, frame: object) -> None:
+        LOGGER.warning("Memory report:\n%s", memory_report(limit=limit))
+
+    signal.signal(signum, dump)
+    LOGGER.info("Send signal %d to pid %d for a memory report", signum, os.getpid())
+    return True
@@ -0,0 +1,129 @@
+"""Lightweight latency and counter tracking for assistant stages."""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+LOGGER = logging.getLogger(__name__)
+
+
+def percentile(values: Iterable[float], fraction: float) -> float:
+    """Return the linearly interpolated percentile (``fraction`` in ``[0, 1]``)."""
+    ordered = sorted(values)
+    if not ordered:
+        raise ValueError("Cannot compute a percentile of no values")
+    if not 0.0 <= fraction <= 1.0:
+        raise ValueError("Percentile fraction must be between 0 and 1")
+
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    weight = position - lower
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * weight
+
+
+@dataclass(frozen=True)
+class MetricSummary:
+    """Aggregate view over the recorded samples of a single metric."""
+
+    count: int
+    mean: float
+    p50: float
+    p95: float
+    maximum: float
+
+    @classmethod
+    def from_samples(cls, samples: Iterable[float]) -> MetricSummary:
+        values = list(samples)
+        return cls(
+            count=len(values),
+            mean=sum(values) / len(values),
+            p50=percentile(values, 0.5),
+            p95=percentile(values, 0.95),
+            maximum=max(values),
+        )
+
+
+class Metrics:
+    """Thread-safe store of named samples (latencies, byte counts) and counters.
+
+    Only the most recent ``window`` samples are kept per metric so that a
+    long-running assistant does not accumulate history without bound.
+    """
+
+    def __init__(self, window: int = 1000) -> None:
+        self._window = window
+        self._samples: dict[str, deque[float]] = {}
+        self._counters: dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def record(self, name: str, value: float) -> None:
+        """Store a sample for ``name``."""
+        with self._lock:
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = deque(maxlen=self._window)
+            samples.append(float(value))
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        """Increase the counter ``name`` by ``amount``."""
+        with self._lock:
+            self._counters[name] += amount
+
+    def count(self, name: str) -> int:
+        """Return the current value of counter ``name``."""
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    @contextlib.contextmanager
+    def time(self, name: str) -> Iterator[None]:
+        """Record the wall-clock duration of the enclosed block in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def samples(self, name: str) -> list[float]:
+        """Return a copy of the samples recorded for ``name``."""
+        with self._lock:
+            return list(self._samples.get(name, ()))
+
+    def summary(self, name: str) -> MetricSummary | None:
+        """Summarize ``name`` or return ``None`` when nothing was recorded."""
+        samples = self.samples(name)
+        if not samples:
+            return None
+        return MetricSummary.from_samples(samples)
+
+    def report(self) -> dict[str, MetricSummary]:
+        """Summaries for every metric that has samples."""
+        with self._lock:
+            names = sorted(self._samples)
+        return {name: summary for name in names if (summary := self.summary(name))}
+
+    def counters(self) -> dict[str, int]:
+        """Snapshot of all counters."""
+        with self._lock:
+            return dict(self._counters)
+
+    def log_report(self, logger: logging.Logger = LOGGER) -> None:
+        """Write a one-line summary per metric and counter to ``logger``."""
+        for name, summary in self.report().items():
+            logger.info(
+                "%s: n=%d mean=%.4f p50=%.4f p95=%.4f max=%.4f",
+                name,
+                summary.count,
+                summary.mean,
+                summary.p50,
+                summary.p95,
+                summary.maximum,
+            )
+        for name, value in sorted(self.counters().items()):
+            logger.info("%s: %d", name, value)
@@ -0,0 +1,151 @@
+"""Profile pipeline stages with cProfile and write pstats and flamegraph files."""
+
+from __future__ import annotations
+
+import cProfile
+import logging
+import os
+import pstats
+import threading
+from collections import Counter, defaultdict
+from pathlib import Path
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_INTERACTIONS = 5
+COMBINED_FILE = "stages.folded"
+
+# Call paths contributing less than this many seconds are left out of the
+# flamegraph; it also bounds the walk through large call graphs.
+_MIN_PATH_SECONDS = 1e-6
+
+Function = tuple[str, int, str]
+
+
+class StageProfiler:
+    """Collect a cProfile profile per pipeline stage for a number of interactions.
+
+    :meth:`start` and :meth:`stop` bracket one stage on the calling thread;
+    repeated runs of a stage are merged.  Stages nested in a stage that is
+    already being profiled on the same thread are attributed to the outer
+    stage.  Python 3.12 allows only one active profiler per process, so there
+    a stage that overlaps another thread's profiled stage is skipped.
+    """
+
+    def __init__(
+        self, directory: str | Path, *, interactions: int = DEFAULT_INTERACTIONS
+    ) -> None:
+        self.directory = Path(directory).expanduser()
+        self.interactions = interactions
+        self.finished = 0
+        self.stats: dict[str, pstats.Stats] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def start(self) -> cProfile.Profile | None:
+        """Start profiling the calling thread, unless it is already profiled."""
+        if getattr(self._local, "active", False):
+            return None
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:  # another thread holds the profiler (Python 3.12+)
+            return None
+        self._local.active = True
+        return profile
+
+    def stop(self, name: str, profile: cProfile.Profile | None) -> None:
+        """Stop ``profile`` and add it to the stage ``name``."""
+        if profile is None:
+            return
+        profile.disable()
+        self._local.active = False
+        with self._lock:
+            if name in self.stats:
+                self.stats[name].add(profile)
+            else:
+                self.stats[name] = pstats.Stats(profile)
+
+    def interaction_finished(self) -> bool:
+        """Count a finished interaction; return ``True`` once enough are profiled."""
+        self.finished += 1
+        return self.finished >= self.interactions
+
+    def write(self) -> list[Path]:
+        """Write ``<stage>.pstats`` and ``<stage>.folded`` for every profiled stage.
+
+        ``stages.folded`` combines all stages under their stage names, in the
+        collapsed-stack format read by ``flamegraph.pl`` and speedscope.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        written = []
+        combined = []
+        with self._lock:
+            stages = dict(self.stats)
+        for name, stats in sorted(stages.items()):
+            pstats_path = self.directory / f"{name}.pstats"
+            stats.dump_stats(pstats_path)
+            lines = collapsed_stacks(stats, root=name)
+            folded_path = self.directory / f"{name}.folded"
+            folded_path.write_text("".join(f"{line}\n" for line in lines))
+            combined.extend(lines)
+            written.extend([pstats_path, folded_path])
+
+        combined_path = self.directory / COMBINED_FILE
+        combined_path.write_text("".join(f"{line}\n" for line in combined))
+        written.append(combined_path)
+        LOGGER.info(
+            "Wrote profiles of %d stages over %d interactions to %s",
+            len(stages),
+            self.finished,
+            self.directory,
+        )
+        return written
+
+
+def collapsed_stacks(stats: pstats.Stats, *, root: str | None = None) -> list[str]:
+    """Approximate call stacks of ``stats`` as ``frame;frame;frame microseconds`` lines.
+
+    cProfile records only caller/callee pairs, so a function's time is split
+    between its call paths in proportion to the time each caller spent in it.
+    """
+    entries = stats.stats  # type: ignore[attr-defined]
+    callees: dict[Function, list[tuple[Function, float]]] = defaultdict(list)
+    for function, (*_, callers) in entries.items():
+        for caller, edge in callers.items():
+            callees[caller].append((function, edge[3]))
+
+    totals: Counter[tuple[str, ...]] = Counter()
+
+    def walk(function: Function, path: tuple[str, ...], share: float) -> None:
+        _, _, own_time, cumulative, _ = entries[function]
+        path = (*path, _label(function))
+        totals[path] += own_time * share
+        for callee, edge_time in callees.get(function, ()):
+            callee_time = entries[callee][3]
+            if callee_time <= 0 or _label(callee) in path:
+                continue
+            callee_share = share * min(1.0, edge_time / callee_time)
+            if callee_time * callee_share >= _MIN_PATH_SECONDS:
+                walk(callee, path, callee_share)
+
+    prefix = (root,) if root else ()
+    for function, (*_, callers) in entries.items():
+        if not callers:
+            walk(function, prefix, 1.0)
+
+    lines = []
+    for path, seconds in totals.items():
+        microseconds = round(seconds * 1_000_000)
+        if microseconds > 0:
+            lines.append(f"{';'.join(path)} {microseconds}")
+    return sorted(lines)
+
+
+def _label(function: Function) -> str:
+    filename, lineno, name = function
+    if filename == "~":  # built-in
+        label = name
+    else:
+        label = f"{name} ({os.path.basename(filename)}:{lineno})"
+    return label.replace(";", ",")
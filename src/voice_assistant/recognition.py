@@ -0,0 +1,200 @@
+"""Race several speech recognition backends and keep the first confident transcript."""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from collections.abc import Callable, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+
+import speech_recognition as sr
+
+from voice_assistant.metrics import Metrics
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MIN_CONFIDENCE = 0.7
+DEFAULT_TIMEOUT = 3.0
+
+# A backend returns the transcript and its confidence, or ``None`` when the
+# engine does not report one; it raises like ``Recognizer.recognize_*``.
+Backend = Callable[[sr.AudioData], "tuple[str, float | None]"]
+
+
+def _google(recognizer: sr.Recognizer) -> Backend:
+    return lambda audio: recognizer.recognize_google(audio, with_confidence=True)
+
+
+def _sphinx(recognizer: sr.Recognizer) -> Backend:
+    return lambda audio: (recognizer.recognize_sphinx(audio), None)
+
+
+def _whisper(recognizer: sr.Recognizer) -> Backend:
+    def recognize(audio: sr.AudioData) -> tuple[str, float | None]:
+        result = recognizer.recognize_whisper(audio, show_dict=True)
+        return result["text"].strip(), _whisper_confidence(result.get("segments", []))
+
+    return recognize
+
+
+def _whisper_confidence(segments: list[Mapping[str, object]]) -> float | None:
+    """Confidence from Whisper's per-segment average token log-probabilities."""
+    logprobs = [
+        segment["avg_logprob"] for segment in segments if "avg_logprob" in segment
+    ]
+    if not logprobs:
+        return None
+    return math.exp(sum(logprobs) / len(logprobs))
+
+
+# ``sphinx`` (pocketsphinx) and ``whisper`` (openai-whisper) run locally and
+# need their optional packages installed.
+BACKENDS: dict[str, Callable[[sr.Recognizer], Backend]] = {
+    "google": _google,
+    "sphinx": _sphinx,
+    "whisper": _whisper,
+}
+
+
+def create_backends(
+    recognizer: sr.Recognizer, names: list[str] | tuple[str, ...]
+) -> dict[str, Backend]:
+    """Build the named built-in backends around ``recognizer``."""
+    unknown = [name for name in names if name not in BACKENDS]
+    if unknown:
+        raise ValueError(f"Unknown speech recognizer: {', '.join(unknown)}")
+    return {name: BACKENDS[name](recognizer) for name in names}
+
+
+@dataclass(frozen=True)
+class Transcript:
+    """A recognized transcript and the backend that produced it."""
+
+    text: str
+    confidence: float | None
+    backend: str
+
+
+def _rank(transcript: Transcript) -> tuple[bool, float]:
+    """Order unsure results: any reported confidence beats none."""
+    return transcript.confidence is not None, transcript.confidence or 0.0
+
+
+class RecognizerRace:
+    """Send audio to every backend at once and return the first confident result.
+
+    A result wins as soon as its confidence reaches ``min_confidence``.  If no
+    result is confident, the most confident one is used once every backend has
+    finished; a result from a backend that reports no confidence is used
+    only when no other backend answered.  After ``timeout`` seconds the best
+    result so far wins.  Backends still running when a result wins are
+    abandoned; a request in flight cannot be interrupted, so
+    its result is ignored.
+
+    Each backend's latency is recorded as ``recognition_<name>``, wins as
+    ``recognition_wins_<name>`` and failures as ``recognition_failures_<name>``.
+    """
+
+    def __init__(
+        self,
+        backends: Mapping[str, Backend],
+        *,
+        min_confidence: float = DEFAULT_MIN_CONFIDENCE,
+        timeout: float | None = None,
+        metrics: Metrics | None = None,
+    ) -> None:
+        if not backends:
+            raise ValueError("At least one speech recognition backend is required")
+        self.backends = dict(backends)
+        self.min_confidence = min_confidence
+        self.timeout = timeout
+        self.metrics = metrics or Metrics()
+        # Room for abandoned requests of the previous race to finish.
+        self._pool = ThreadPoolExecutor(
+            max_workers=2 * len(self.backends), thread_name_prefix="recognizer"
+        )
+
+    def recognize(
+        self,
+        audio: sr.AudioData,
+        *,
+        on_early_result: Callable[[Transcript], None] | None = None,
+    ) -> Transcript:
+        """Transcribe ``audio``, raising ``UnknownValueError`` or ``RequestError`` like ``recognize_google``.
+
+        Results that arrive below the confidence threshold, or without a
+        confidence, are passed to ``on_early_result`` while the race goes on.
+        """
+        pending: dict[Future, str] = {
+            self._pool.submit(self._run, name, backend, audio): name
+            for name, backend in self.backends.items()
+        }
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        best: Transcript | None = None
+        errors: list[Exception] = []
+        try:
+            while pending:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                if not done:
+                    errors.extend(
+                        sr.RequestError(f"{name} timed out")
+                        for name in pending.values()
+                    )
+                    break
+                for future in done:
+                    name = pending.pop(future)
+                    try:
+                        text, confidence = future.result()
+                    except sr.UnknownValueError:
+                        continue
+                    except Exception as exc:
+                        LOGGER.debug("Recognizer %s failed: %s", name, exc)
+                        errors.append(exc)
+                        continue
+                    transcript = Transcript(text, confidence, name)
+                    if confidence is not None and confidence >= self.min_confidence:
+                        return self._win(transcript)
+                    if best is None or _rank(transcript) > _rank(best):
+                        best = transcript
+                    if on_early_result is not None and pending:
+                        on_early_result(transcript)
+        finally:
+            for future in pending:
+                future.cancel()
+
+        if best is not None:
+            return self._win(best)
+        if errors and len(errors) == len(self.backends):
+            raise sr.RequestError(
+                "; ".join(f"{error}" for error in errors)
+            ) from errors[0]
+        raise sr.UnknownValueError()
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _run(
+        self, name: str, backend: Backend, audio: sr.AudioData
+    ) -> tuple[str, float | None]:
+        start = time.perf_counter()
+        try:
+            return backend(audio)
+        except sr.UnknownValueError:
+            raise
+        except Exception:
+            self.metrics.increment(f"recognition_failures_{name}")
+            raise
+        finally:
+            self.metrics.record(f"recognition_{name}", time.perf_counter() - start)
+
+    def _win(self, transcript: Transcript) -> Transcript:
+        self.metrics.increment(f"recognition_wins_{transcript.backend}")
+        LOGGER.debug(
+            "Recognizer %s won with confidence %s",
+            transcript.backend,
+            transcript.confidence,
+        )
+        return transcript
@@ -0,0 +1,194 @@
+"""Replay recorded sessions through :class:`VoiceAssistant` to compare stage latencies."""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import statistics
+import sys
+import time
+from collections.abc import Iterable
+
+from voice_assistant.assistant import VoiceAssistant
+from voice_assistant.cli import configure_logging
+from voice_assistant.config import AssistantConfig
+from voice_assistant.fakes import (
+    FakeMicrophone,
+    FakeOpenAIClient,
+    ScriptedRecognizer,
+    fixed_delay,
+)
+from voice_assistant.session import Interaction, SessionRecorder, load_session
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ReplayAssistant(VoiceAssistant):
+    """Assistant that swaps its devices and services for a recorded session.
+
+    Recorded service latencies are reproduced divided by ``speed``; ``speed=None``
+    skips them entirely.  Local processing such as audio preprocessing runs for
+    real, so its cost reflects the code under test.
+    """
+
+    def __init__(
+        self,
+        config: AssistantConfig | None = None,
+        *,
+        speed: float | None = 1.0,
+    ) -> None:
+        config = config or AssistantConfig(warm_up=False)
+        super().__init__(api_key="replay", config=config)
+        self.speed = speed
+        self._microphone = FakeMicrophone()
+        self._speak_timings: dict[str, float] = {}
+
+    def _delay(self, recorded: Interaction, stage: str) -> float:
+        if not self.speed:
+            return 0.0
+        return recorded.timings.get(stage, 0.0) / self.speed
+
+    def replay(self, interactions: Iterable[Interaction]) -> list[Interaction]:
+        """Run every recorded interaction that captured audio and return the replays."""
+        replayed = []
+        for recorded in interactions:
+            if recorded.audio is None:
+                LOGGER.debug(
+                    "Skipping interaction without audio at %s", recorded.timestamp
+                )
+                continue
+
+            self.recognizer = ScriptedRecognizer(
+                [recorded.audio],
+                [recorded.transcript],
+                listen_delay=fixed_delay(self._delay(recorded, "capture")),
+                recognize_delay=fixed_delay(self._delay(recorded, "recognition")),
+            )
+            self.client = FakeOpenAIClient(
+                [recorded.response or ""],
+                delay=fixed_delay(self._delay(recorded, "generation")),
+            )
+            self._speak_timings = {
+                stage: self._delay(recorded, stage)
+                for stage in ("synthesis", "playback")
+            }
+
+            replayed.append(self.interact())
+        return replayed
+
+    def _prompt(self, message: str) -> None:
+        return None
+
+    def speak_text(self, text: str) -> None:
+        """Stand in for synthesis and playback with their recorded durations."""
+        for stage, seconds in self._speak_timings.items():
+            with self._stage(stage):
+                time.sleep(seconds)
+
+
+def stage_means(interactions: Iterable[Interaction]) -> dict[str, float]:
+    """Average each stage's duration over ``interactions``."""
+    samples: dict[str, list[float]] = {}
+    for interaction in interactions:
+        for stage, seconds in interaction.timings.items():
+            samples.setdefault(stage, []).append(seconds)
+    return {
+        stage: statistics.fmean(values) for stage, values in sorted(samples.items())
+    }
+
+
+def prompt_changes(
+    baseline: Iterable[Interaction], candidate: Iterable[Interaction]
+) -> list[str]:
+    """Describe where ``candidate`` sent a different model or messages than ``baseline``.
+
+    Interactions are paired in order; those that captured no audio are not
+    replayed and are skipped.  Baselines recorded without a model are ignored.
+    """
+    recorded = [
+        interaction for interaction in baseline if interaction.audio is not None
+    ]
+    changes = []
+    for number, (before, after) in enumerate(zip(recorded, candidate), start=1):
+        if before.model is None:
+            continue
+        if before.model != after.model:
+            changes.append(f"{number}: model {before.model} -> {after.model}")
+        if before.messages != after.messages:
+            changes.append(f"{number}: messages changed")
+    return changes
+
+
+def format_comparison(baseline: dict[str, float], candidate: dict[str, float]) -> str:
+    """Render a per-stage latency comparison table."""
+    lines = [f"{'stage':<14}{'baseline':>12}{'candidate':>12}{'delta':>12}"]
+    for stage in sorted(set(baseline) | set(candidate)):
+        before = baseline.get(stage)
+        after = candidate.get(stage)
+        delta = (
+            f"{after - before:+.4f}"
+            if before is not None and after is not None
+            else "-"
+        )
+        lines.append(
+            f"{stage:<14}"
+            f"{before if before is not None else float('nan'):>12.4f}"
+            f"{after if after is not None else float('nan'):>12.4f}"
+            f"{delta:>12}"
+        )
+    return "\n".join(lines)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments for the replay tool."""
+    parser = argparse.ArgumentParser(
+        description="Replay a recorded voice assistant session and compare stage latencies."
+    )
+    parser.add_argument("session", help="Session file written with --record-session")
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="Replay speed multiplier for recorded service latencies; 0 skips them (default: 1.0)",
+    )
+    parser.add_argument(
+        "--compare",
+        help="Compare against this session file instead of the recorded timings",
+    )
+    parser.add_argument(
+        "--output",
+        help="Append the replayed interactions to this session file",
+    )
+    parser.add_argument(
+        "--log-level",
+        default="WARNING",
+        choices=["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"],
+        help="Logging verbosity",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Replay a session and print recorded versus replayed stage latencies."""
+    args = parse_args(argv)
+    configure_logging(args.log_level)
+
+    recorded = list(load_session(args.session))
+    assistant = ReplayAssistant(speed=args.speed or None)
+    if args.output:
+        assistant.recorder = SessionRecorder(args.output)
+    replayed = assistant.replay(recorded)
+    print(f"Replayed {len(replayed)} of {len(recorded)} interactions")
+
+    baseline = recorded if not args.compare else list(load_session(args.compare))
+    print(format_comparison(stage_means(baseline), stage_means(replayed)))
+    changes = prompt_changes(baseline, replayed)
+    if changes:
+        print(f"Prompt or routing changed in {len(changes)} places:")
+        for change in changes:
+            print(f"  {change}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
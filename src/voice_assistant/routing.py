@@ -0,0 +1,179 @@
+"""Route prompts between a fast model and a more capable one."""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+
+LOGGER = logging.getLogger(__name__)
+
+FAST = "fast"
+STRONG = "strong"
+
+DEFAULT_LONG_PROMPT_WORDS = 25
+DEFAULT_DEGRADED_LATENCY = 5.0
+DEFAULT_COOLDOWN = 60.0
+LATENCY_SMOOTHING = 0.3
+
+# Words that ask for reasoning, explanation or longer output.
+COMPLEX_KEYWORDS = frozenset(
+    {
+        "analyse",
+        "analyze",
+        "compare",
+        "debug",
+        "derive",
+        "describe",
+        "design",
+        "detail",
+        "difference",
+        "essay",
+        "evaluate",
+        "explain",
+        "plan",
+        "prove",
+        "recommend",
+        "story",
+        "summarise",
+        "summarize",
+        "translate",
+        "why",
+        "write",
+    }
+)
+
+_WORD = re.compile(r"[a-z']+")
+
+
+def classify_prompt(
+    prompt: str, *, long_prompt_words: int = DEFAULT_LONG_PROMPT_WORDS
+) -> tuple[str, str]:
+    """Return the model tier a prompt needs and the reason, using cheap heuristics.
+
+    Long prompts, several questions at once and words such as "explain" or
+    "compare" go to :data:`STRONG`; everything else to :data:`FAST`.
+    """
+    words = _WORD.findall(prompt.lower())
+    if len(words) > long_prompt_words:
+        return STRONG, f"{len(words)} words"
+    keyword = next((word for word in words if word in COMPLEX_KEYWORDS), None)
+    if keyword is not None:
+        return STRONG, f"keyword '{keyword}'"
+    if prompt.count("?") > 1:
+        return STRONG, "several questions"
+    return FAST, "simple"
+
+
+@dataclass(frozen=True)
+class Route:
+    """The model chosen for a prompt and why."""
+
+    model: str
+    tier: str
+    reason: str
+
+
+class ModelRouter:
+    """Send simple prompts to ``fast_model`` and complex ones to ``strong_model``.
+
+    Latency is tracked per model as an exponentially weighted moving average.
+    A model whose average exceeds ``degraded_latency`` seconds, or whose
+    request fails, is considered degraded for ``cooldown`` seconds and its
+    prompts go to the other model; after the cooldown it is tried again.
+    """
+
+    def __init__(
+        self,
+        fast_model: str,
+        strong_model: str,
+        *,
+        long_prompt_words: int = DEFAULT_LONG_PROMPT_WORDS,
+        degraded_latency: float = DEFAULT_DEGRADED_LATENCY,
+        cooldown: float = DEFAULT_COOLDOWN,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.models = {FAST: fast_model, STRONG: strong_model}
+        self.long_prompt_words = long_prompt_words
+        self.degraded_latency = degraded_latency
+        self.cooldown = cooldown
+        self.latency: dict[str, float] = {}
+        self._degraded_until: dict[str, float] = {}
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def route(self, prompt: str) -> Route:
+        """Choose the model for ``prompt``."""
+        tier, reason = classify_prompt(prompt, long_prompt_words=self.long_prompt_words)
+        model = self.models[tier]
+        if self.is_degraded(model):
+            other = STRONG if tier == FAST else FAST
+            if not self.is_degraded(self.models[other]):
+                return Route(self.models[other], other, f"{model} degraded")
+        return Route(model, tier, reason)
+
+    def fallback(self, route: Route) -> Route | None:
+        """The route to retry on after ``route``'s model failed, if any."""
+        other = STRONG if route.tier == FAST else FAST
+        model = self.models[other]
+        if model == route.model or self.is_degraded(model):
+            return None
+        return Route(model, other, f"{route.model} failed")
+
+    def is_degraded(self, model: str) -> bool:
+        with self._lock:
+            return self._degraded_until.get(model, 0.0) > self._clock()
+
+    def observe(self, model: str, seconds: float) -> None:
+        """Add the latency of a successful request to ``model``'s average."""
+        with self._lock:
+            previous = self.latency.get(model)
+            average = (
+                seconds
+                if previous is None
+                else LATENCY_SMOOTHING * seconds + (1 - LATENCY_SMOOTHING) * previous
+            )
+            self.latency[model] = average
+        if average > self.degraded_latency:
+            self._degrade(model, f"average latency {average:.2f}s")
+
+    def failed(self, model: str) -> None:
+        """Record a failed request to ``model``."""
+        self._degrade(model, "request failed")
+
+    def _degrade(self, model: str, reason: str) -> None:
+        with self._lock:
+            self._degraded_until[model] = self._clock() + self.cooldown
+            # Start afresh when the model is tried again after the cooldown.
+            self.latency.pop(model, None)
+        LOGGER.warning(
+            "Model %s degraded (%s); routing around it for %.0fs",
+            model,
+            reason,
+            self.cooldown,
+        )
+
+
+class TimedStream:
+    """Pass a streamed response through, reporting its duration once it is used up.
+
+    ``on_finished`` receives the seconds from ``start`` to the last chunk; a
+    stream abandoned part-way, for example by a barge-in, is not reported.
+    """
+
+    def __init__(
+        self, stream, start: float, on_finished: Callable[[float], None]
+    ) -> None:
+        self.stream = stream
+        self.start = start
+        self.on_finished = on_finished
+
+    def __iter__(self) -> Iterator[object]:
+        yield from self.stream
+        self.on_finished(time.perf_counter() - self.start)
+
+    def close(self) -> None:
+        self.stream.close()
@@ -0,0 +1,257 @@
+"""Queue OpenAI requests within the account's rate limits, live questions first."""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import re
+import threading
+import time
+from collections.abc import Callable, Mapping
+from typing import TypeVar
+
+import httpx
+import openai
+
+from voice_assistant.metrics import Metrics
+
+LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Lower values are served first.
+INTERACTIVE = 0
+SPECULATIVE = 5
+BATCH = 10
+
+DEFAULT_MAX_WAIT = 120.0
+DEFAULT_RETRY_AFTER = 1.0
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+
+def parse_duration(value: str) -> float | None:
+    """Parse OpenAI reset durations such as ``"6m0s"``, ``"1.5s"`` or ``"20ms"``."""
+    parts = _DURATION_PART.findall(value.strip())
+    if not parts or "".join(number + unit for number, unit in parts) != value.strip():
+        return None
+    return sum(float(number) * _DURATION_UNITS[unit] for number, unit in parts)
+
+
+def retry_after(headers: Mapping[str, str]) -> float | None:
+    """Seconds the server asked us to wait, from ``retry-after(-ms)`` headers."""
+    for name, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return max(0.0, float(value) * scale)
+        except ValueError:
+            continue
+    return None
+
+
+def estimate_tokens(request: Mapping[str, object]) -> int:
+    """Tokens a chat completion counts against the limit before it runs.
+
+    OpenAI charges the prompt (roughly four characters per token) plus
+    ``max_tokens`` when the request is admitted.
+    """
+    prompt_chars = sum(
+        len(str(message.get("content", ""))) for message in request.get("messages", [])
+    )
+    return prompt_chars // 4 + int(request.get("max_tokens") or 0)
+
+
+class TokenBucket:
+    """Budget of ``capacity`` units refilled continuously at ``per_second``."""
+
+    def __init__(
+        self,
+        capacity: float,
+        per_second: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.capacity = capacity
+        self.per_second = per_second
+        self.level = capacity
+        self._clock = clock
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self.level = min(
+            self.capacity, self.level + (now - self._updated) * self.per_second
+        )
+        self._updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until ``amount`` (at most the capacity) is available."""
+        self._refill()
+        shortfall = min(amount, self.capacity) - self.level
+        if shortfall <= 0:
+            return 0.0
+        return shortfall / self.per_second if self.per_second > 0 else float("inf")
+
+    def take(self, amount: float) -> None:
+        self._refill()
+        self.level -= amount
+
+    def update(self, limit: float, remaining: float, reset: float | None) -> None:
+        """Adopt the limit and remaining budget reported by the server.
+
+        ``reset`` is how long the server needs to refill to ``limit``, which
+        gives the refill rate.
+        """
+        self._refill()
+        self.capacity = limit
+        self.level = min(limit, remaining)
+        if reset and remaining < limit:
+            self.per_second = (limit - remaining) / reset
+
+
+class RateLimitScheduler:
+    """Admit requests in priority order when request and token budgets allow.
+
+    Budgets start from ``requests_per_minute`` and ``tokens_per_minute`` when
+    given and follow the ``x-ratelimit-*`` headers of every API response.  A
+    429 response pauses all requests for the server's ``retry-after`` and
+    requeues the request at its original position instead of failing it,
+    until it has waited ``max_wait`` seconds in total.
+
+    One scheduler can be shared by every assistant using the same API key.
+    Queue time is recorded as ``queue_wait``; requests delayed by the local
+    budget count as ``throttled`` and 429 responses seen by
+    :meth:`observe_response` as ``rate_limited``.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+        *,
+        max_wait: float = DEFAULT_MAX_WAIT,
+        metrics: Metrics | None = None,
+    ) -> None:
+        self.buckets: dict[str, TokenBucket] = {}
+        if requests_per_minute:
+            self.buckets["requests"] = TokenBucket(
+                requests_per_minute, requests_per_minute / 60
+            )
+        if tokens_per_minute:
+            self.buckets["tokens"] = TokenBucket(
+                tokens_per_minute, tokens_per_minute / 60
+            )
+        self.max_wait = max_wait
+        self.metrics = metrics or Metrics()
+        self._condition = threading.Condition()
+        self._queue: list[tuple[int, int]] = []
+        self._sequence = itertools.count()
+        self._paused_until = 0.0
+        self._closed = False
+
+    def close(self) -> None:
+        """Fail queued and future requests with ``RuntimeError``."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def observe_response(self, response: httpx.Response) -> None:
+        """Follow the rate-limit headers of ``response``; an httpx response hook."""
+        self.observe_headers(response.headers, rate_limited=response.status_code == 429)
+
+    def observe_headers(
+        self, headers: Mapping[str, str], *, rate_limited: bool = False
+    ) -> None:
+        """Update budgets from rate-limit headers and pause after a 429."""
+        with self._condition:
+            for name in ("requests", "tokens"):
+                try:
+                    limit = float(headers[f"x-ratelimit-limit-{name}"])
+                    remaining = float(headers[f"x-ratelimit-remaining-{name}"])
+                except (KeyError, ValueError):
+                    continue
+                reset = parse_duration(headers.get(f"x-ratelimit-reset-{name}", ""))
+                bucket = self.buckets.get(name)
+                if bucket is None:
+                    bucket = self.buckets[name] = TokenBucket(limit, limit / 60)
+                bucket.update(limit, remaining, reset)
+            self._condition.notify_all()
+        if rate_limited:
+            self.metrics.increment("rate_limited")
+            self._pause(retry_after(headers) or DEFAULT_RETRY_AFTER)
+
+    def _pause(self, delay: float) -> None:
+        """Hold every request for ``delay`` seconds."""
+        with self._condition:
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+            self._condition.notify_all()
+
+    def submit(
+        self, call: Callable[[], T], *, priority: int = INTERACTIVE, tokens: int = 0
+    ) -> T:
+        """Run ``call`` once it is first in line and within budget; return its result."""
+        ticket = (priority, next(self._sequence))
+        start = time.monotonic()
+        queued = 0.0
+        try:
+            while True:
+                queued += self._admit(ticket, tokens)
+                try:
+                    return call()
+                except openai.RateLimitError as exc:
+                    delay = retry_after(exc.response.headers) or DEFAULT_RETRY_AFTER
+                    if time.monotonic() - start + delay > self.max_wait:
+                        raise
+                    LOGGER.warning("Rate limited by the API; retrying in %.1fs", delay)
+                    self._pause(delay)
+        finally:
+            self.metrics.record("queue_wait", queued)
+
+    def _admit(self, ticket: tuple[int, int], tokens: int) -> float:
+        """Block until ``ticket`` is first in line and within budget; return the wait."""
+        start = time.monotonic()
+        throttled = False
+        with self._condition:
+            heapq.heappush(self._queue, ticket)
+            try:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Rate-limit scheduler is closed")
+                    if self._queue[0] == ticket:
+                        delay = self._delay(tokens)
+                        if delay <= 0:
+                            heapq.heappop(self._queue)
+                            self._take(tokens)
+                            return time.monotonic() - start
+                        if not throttled:
+                            throttled = True
+                            self.metrics.increment("throttled")
+                            LOGGER.debug("Throttling request for %.2fs", delay)
+                        self._condition.wait(timeout=delay)
+                    else:
+                        self._condition.wait()
+            except BaseException:
+                # Do not leave an interrupted request blocking the queue.
+                self._queue.remove(ticket)
+                heapq.heapify(self._queue)
+                raise
+            finally:
+                self._condition.notify_all()
+
+    def _delay(self, tokens: int) -> float:
+        delays = [self._paused_until - time.monotonic()]
+        if "requests" in self.buckets:
+            delays.append(self.buckets["requests"].wait_time(1))
+        if tokens and "tokens" in self.buckets:
+            delays.append(self.buckets["tokens"].wait_time(tokens))
+        return max(delays)
+
+    def _take(self, tokens: int) -> None:
+        if "requests" in self.buckets:
+            self.buckets["requests"].take(1)
+        if tokens and "tokens" in self.buckets:
+            self.buckets["tokens"].take(tokens)
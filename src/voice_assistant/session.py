@@ -0,0 +1,113 @@
+"""Append-only recording of assistant interactions for later replay."""
+
+from __future__ import annotations
+
+import base64
+import json
+import logging
+import threading
+import zlib
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import speech_recognition as sr
+
+LOGGER = logging.getLogger(__name__)
+
+SESSION_FORMAT_VERSION = 1
+
+
+@dataclass
+class Interaction:
+    """Everything that happened between a detected keyword and the spoken answer."""
+
+    timestamp: float
+    transcript: str | None = None
+    response: str | None = None
+    audio: sr.AudioData | None = None
+    timings: dict[str, float] = field(default_factory=dict)
+    error: str | None = None
+    model: str | None = None
+    messages: list[dict[str, str]] | None = None
+
+    def to_json(self) -> str:
+        """Serialize as a single JSON line with zlib-compressed, base64 audio."""
+        record = {
+            "version": SESSION_FORMAT_VERSION,
+            "timestamp": self.timestamp,
+            "transcript": self.transcript,
+            "response": self.response,
+            "model": self.model,
+            "messages": self.messages,
+            "timings": {name: round(value, 6) for name, value in self.timings.items()},
+            "error": self.error,
+            "audio": _encode_audio(self.audio) if self.audio is not None else None,
+        }
+        return json.dumps(record, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, line: str) -> Interaction:
+        record = json.loads(line)
+        if record.get("version") != SESSION_FORMAT_VERSION:
+            raise ValueError(f"Unsupported session format: {record.get('version')}")
+        audio = record.get("audio")
+        return cls(
+            timestamp=record["timestamp"],
+            transcript=record.get("transcript"),
+            response=record.get("response"),
+            model=record.get("model"),
+            messages=record.get("messages"),
+            audio=_decode_audio(audio) if audio else None,
+            timings=dict(record.get("timings") or {}),
+            error=record.get("error"),
+        )
+
+
+def _encode_audio(audio: sr.AudioData) -> dict[str, object]:
+    data = zlib.compress(audio.get_raw_data())
+    return {
+        "rate": audio.sample_rate,
+        "width": audio.sample_width,
+        "data": base64.b64encode(data).decode("ascii"),
+    }
+
+
+def _decode_audio(record: dict[str, object]) -> sr.AudioData:
+    data = zlib.decompress(base64.b64decode(str(record["data"])))
+    return sr.AudioData(data, int(record["rate"]), int(record["width"]))
+
+
+class SessionRecorder:
+    """Append interactions to a JSON Lines session file.
+
+    Each interaction is flushed as soon as it finishes so a crash loses at
+    most the interaction in progress.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def record(self, interaction: Interaction) -> None:
+        try:
+            line = interaction.to_json()
+        except (AttributeError, TypeError) as exc:
+            LOGGER.debug("Recording interaction without audio: %s", exc)
+            interaction.audio = None
+            line = interaction.to_json()
+        with self._lock, self.path.open("a", encoding="utf-8") as session_file:
+            session_file.write(line + "\n")
+
+
+def load_session(path: str | Path) -> Iterator[Interaction]:
+    """Yield the interactions stored in a session file, skipping corrupt lines."""
+    with Path(path).expanduser().open(encoding="utf-8") as session_file:
+        for number, line in enumerate(session_file, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield Interaction.from_json(line)
+            except (KeyError, TypeError, ValueError, zlib.error) as exc:
+                LOGGER.warning("Skipping line %d of %s: %s", number, path, exc)
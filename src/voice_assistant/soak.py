@@ -0,0 +1,246 @@
+"""Soak-test the assistant for memory growth over thousands of interactions."""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from voice_assistant.assistant import VoiceAssistant
+from voice_assistant.cli import configure_logging
+from voice_assistant.config import AssistantConfig
+from voice_assistant.fakes import (
+    FakeMicrophone,
+    FakeOpenAIClient,
+    ScriptedRecognizer,
+    silent_mp3,
+    synthetic_speech,
+)
+from voice_assistant.memory import TRACEBACK_FRAMES, rss_bytes, top_allocations
+
+LOGGER = logging.getLogger(__name__)
+
+
+class SoakAssistant(VoiceAssistant):
+    """Assistant running its full pipeline against fakes for hours on end.
+
+    Preprocessing, metrics, tuning, temp files and pygame mixer loads all run
+    for real; speech is recognized, answered and synthesized by fakes, and the
+    synthesized audio is ``speech_seconds`` of silent MP3.
+    """
+
+    def __init__(
+        self,
+        config: AssistantConfig | None = None,
+        *,
+        speech_seconds: float = 0.05,
+        seed: int | None = None,
+    ) -> None:
+        super().__init__(
+            api_key="soak",
+            config=config or AssistantConfig(warm_up=False),
+            recognizer=ScriptedRecognizer(
+                [synthetic_speech(seed=seed)], ["What time is it?"]
+            ),
+        )
+        self.client = FakeOpenAIClient(["It is twelve o'clock."])
+        self._microphone = FakeMicrophone()
+        self._speech = silent_mp3(speech_seconds)
+
+    def _prompt(self, message: str) -> None:
+        return None
+
+    def _synthesize(self, text: str, path: Path) -> None:
+        path.write_bytes(self._speech)
+
+
+@dataclass(frozen=True)
+class MemorySample:
+    """Memory use after ``interactions`` interactions."""
+
+    interactions: int
+    elapsed: float
+    rss: int | None
+    traced: int
+
+
+@dataclass
+class SoakResult:
+    """Memory samples of a soak run and where memory grew."""
+
+    samples: list[MemorySample] = field(default_factory=list)
+    top_growth: list[str] = field(default_factory=list)
+    errors: int = 0
+    max_growth: int = 0
+
+    @property
+    def growth(self) -> int:
+        """Bytes gained between the first and last sample.
+
+        Uses RSS when available, otherwise memory traced by :mod:`tracemalloc`.
+        """
+        if len(self.samples) < 2:
+            return 0
+        first, last = self.samples[0], self.samples[-1]
+        if first.rss is not None and last.rss is not None:
+            return last.rss - first.rss
+        return last.traced - first.traced
+
+    @property
+    def passed(self) -> bool:
+        return self.growth <= self.max_growth
+
+
+def run_soak(
+    assistant: VoiceAssistant,
+    *,
+    interactions: int,
+    sample_every: int = 100,
+    warmup: int = 20,
+    max_growth: int = 20 * 2**20,
+    top: int = 10,
+) -> SoakResult:
+    """Run ``interactions`` interactions and sample memory every ``sample_every``.
+
+    The first ``warmup`` interactions fill caches and pools and are not
+    measured.  The run fails when memory grows by more than ``max_growth``
+    bytes between the first and last sample.
+    """
+    result = SoakResult(max_growth=max_growth)
+    for _ in range(warmup):
+        assistant.interact()
+
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start(TRACEBACK_FRAMES)
+    try:
+        baseline = tracemalloc.take_snapshot()
+        start = time.perf_counter()
+
+        def sample(done: int) -> None:
+            memory = MemorySample(
+                interactions=done,
+                elapsed=time.perf_counter() - start,
+                rss=rss_bytes(),
+                traced=tracemalloc.get_traced_memory()[0],
+            )
+            result.samples.append(memory)
+            LOGGER.info(
+                "%d interactions: RSS %s, traced %d bytes",
+                done,
+                memory.rss,
+                memory.traced,
+            )
+
+        sample(0)
+        for done in range(1, interactions + 1):
+            interaction = assistant.interact()
+            if interaction.error or not interaction.response:
+                result.errors += 1
+            if done % sample_every == 0 or done == interactions:
+                sample(done)
+
+        result.top_growth = top_allocations(
+            tracemalloc.take_snapshot(), baseline, limit=top
+        )
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return result
+
+
+def format_result(result: SoakResult) -> str:
+    """Render the memory samples, verdict and top growth sites."""
+    lines = [f"{'done':>8}{'seconds':>10}{'rss MiB':>10}{'traced MiB':>12}"]
+    for sample in result.samples:
+        rss = "-" if sample.rss is None else f"{sample.rss / 2**20:.1f}"
+        lines.append(
+            f"{sample.interactions:>8}{sample.elapsed:>10.1f}{rss:>10}"
+            f"{sample.traced / 2**20:>12.2f}"
+        )
+    verdict = "PASS" if result.passed else "FAIL"
+    lines.append(
+        f"{verdict}: grew {result.growth / 2**20:.2f} MiB "
+        f"(limit {result.max_growth / 2**20:.2f} MiB), {result.errors} errors"
+    )
+    if result.top_growth:
+        lines.append("Top allocation growth:")
+        lines.extend(f"  {site}" for site in result.top_growth)
+    return "\n".join(lines)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments for the soak test."""
+    parser = argparse.ArgumentParser(
+        description="Run many simulated interactions and check memory stays flat."
+    )
+    parser.add_argument(
+        "--interactions",
+        type=int,
+        default=2000,
+        help="Number of measured interactions (default: 2000)",
+    )
+    parser.add_argument(
+        "--sample-every",
+        type=int,
+        default=100,
+        help="Sample memory every N interactions (default: 100)",
+    )
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=20,
+        help="Unmeasured interactions run first (default: 20)",
+    )
+    parser.add_argument(
+        "--max-growth-mb",
+        type=float,
+        default=20.0,
+        help="Fail if memory grows by more than this many MiB (default: 20)",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        help="Number of allocation sites to report (default: 10)",
+    )
+    parser.add_argument(
+        "--log-level",
+        default="WARNING",
+        choices=["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"],
+        help="Logging verbosity",
+    )
+    args = parser.parse_args(argv)
+    if args.interactions < 1 or args.sample_every < 1 or args.warmup < 0:
+        parser.error(
+            "--interactions and --sample-every must be positive, --warmup not negative"
+        )
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the soak test; exit with status 1 if memory grew past the limit."""
+    args = parse_args(argv)
+    configure_logging(args.log_level)
+    # Play the silent speech through pygame without needing a sound card.
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    result = run_soak(
+        SoakAssistant(seed=0),
+        interactions=args.interactions,
+        sample_every=args.sample_every,
+        warmup=args.warmup,
+        max_growth=int(args.max_growth_mb * 2**20),
+        top=args.top,
+    )
+    print(format_result(result))
+    return 0 if result.passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+"""Start generating a response from an early transcript before the final one is ready."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+
+from voice_assistant.faq import normalize
+from voice_assistant.metrics import Metrics
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MIN_WORDS = 3
+
+# Transcripts ending in these words are probably cut off mid-sentence.
+TRAILING_WORDS = frozenset(
+    {
+        "a",
+        "an",
+        "and",
+        "but",
+        "for",
+        "from",
+        "in",
+        "is",
+        "my",
+        "of",
+        "on",
+        "or",
+        "so",
+        "the",
+        "to",
+        "uh",
+        "um",
+        "what",
+        "with",
+    }
+)
+
+
+def looks_complete(transcript: str, *, min_words: int = DEFAULT_MIN_WORDS) -> bool:
+    """Whether an early transcript reads like a whole question worth answering."""
+    words = normalize(transcript).split()
+    return len(words) >= min_words and words[-1] not in TRAILING_WORDS
+
+
+def estimate_text_tokens(text: str) -> int:
+    """Tokens in ``text`` at roughly four characters per token."""
+    return len(text) // 4
+
+
+@dataclass
+class _Speculation:
+    key: str
+    prompt: str
+    started: float
+    future: Future | None = None
+    finished: float | None = None
+
+
+class Prefetcher:
+    """Generate speculatively from early transcripts and reuse matching results.
+
+    :meth:`offer` starts ``generate`` on a transcript that
+    :func:`looks_complete`, replacing any earlier speculation.
+    :meth:`resolve` returns the speculative response when the final
+    transcript matches after normalization; otherwise the speculation is
+    cancelled and the caller generates from the final transcript.  A request
+    already sent cannot be recalled, so a mismatched speculation that is
+    running still finishes and its tokens count as wasted.
+
+    ``speculations``, ``speculation_hits`` and ``speculation_misses`` are
+    counted, the generation time saved by hits is recorded as
+    ``speculation_saved``, and ``speculation_tokens`` and
+    ``speculation_wasted_tokens`` give the wasted-token rate.
+    """
+
+    def __init__(
+        self,
+        generate: Callable[[str], str],
+        *,
+        min_words: int = DEFAULT_MIN_WORDS,
+        metrics: Metrics | None = None,
+    ) -> None:
+        self.generate = generate
+        self.min_words = min_words
+        self.metrics = metrics or Metrics()
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="prefetch")
+        self._lock = threading.Lock()
+        self._current: _Speculation | None = None
+
+    def offer(self, transcript: str) -> None:
+        """Start generating from an early transcript if it looks complete."""
+        if not looks_complete(transcript, min_words=self.min_words):
+            return
+        key = normalize(transcript)
+        with self._lock:
+            previous = self._current
+            if previous is not None and previous.key == key:
+                return
+            speculation = _Speculation(key, transcript, time.perf_counter())
+            speculation.future = self._pool.submit(self._run, speculation)
+            self._current = speculation
+        self.metrics.increment("speculations")
+        LOGGER.debug("Speculatively generating for '%s'", transcript)
+        if previous is not None:
+            self._discard(previous)
+
+    def resolve(self, transcript: str) -> str | None:
+        """Return the speculative response for the final ``transcript``, if any.
+
+        Waits for a matching speculation that is still running.  Returns
+        ``None`` when there was no speculation, it did not match or it failed.
+        """
+        with self._lock:
+            speculation, self._current = self._current, None
+        if speculation is None:
+            return None
+        if speculation.key != normalize(transcript):
+            self.metrics.increment("speculation_misses")
+            self._discard(speculation)
+            return None
+
+        resolved = time.perf_counter()
+        try:
+            response = speculation.future.result()
+        except Exception as exc:
+            LOGGER.debug("Speculative generation failed: %s", exc)
+            self.metrics.increment("speculation_misses")
+            return None
+        self.metrics.increment("speculation_hits")
+        self.metrics.record(
+            "speculation_saved",
+            min(resolved, speculation.finished) - speculation.started,
+        )
+        return response
+
+    def close(self) -> None:
+        with self._lock:
+            speculation, self._current = self._current, None
+        if speculation is not None:
+            self._discard(speculation)
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, speculation: _Speculation) -> str:
+        try:
+            response = self.generate(speculation.prompt)
+        finally:
+            speculation.finished = time.perf_counter()
+        self.metrics.increment(
+            "speculation_tokens",
+            estimate_text_tokens(speculation.prompt) + estimate_text_tokens(response),
+        )
+        return response
+
+    def _discard(self, speculation: _Speculation) -> None:
+        """Cancel ``speculation``, counting its tokens as wasted once it finishes."""
+        if speculation.future.cancel():
+            return
+
+        def count_waste(future: Future) -> None:
+            if future.cancelled() or future.exception() is not None:
+                return
+            tokens = estimate_text_tokens(speculation.prompt) + estimate_text_tokens(
+                future.result()
+            )
+            self.metrics.increment("speculation_wasted_tokens", tokens)
+
+        speculation.future.add_done_callback(count_waste)
@@ -0,0 +1,276 @@
+"""Local HTTP stand-ins for the OpenAI, speech recognition and text-to-speech services."""
+
+from __future__ import annotations
+
+import json
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from voice_assistant.scheduler import TokenBucket
+
+STT_PATH = "/speech-api/v2/recognize"
+TTS_PATH = "/tts"
+
+
+@dataclass(frozen=True)
+class LatencyDistribution:
+    """Random service latency in seconds.
+
+    ``fixed:A`` always waits ``A``; ``uniform:A:B`` waits between ``A`` and ``B``;
+    ``lognormal:MEDIAN:SIGMA`` produces the long tail typical of network services.
+    """
+
+    kind: str = "fixed"
+    first: float = 0.0
+    second: float = 0.0
+
+    @classmethod
+    def parse(cls, spec: str) -> LatencyDistribution:
+        kind, *values = spec.split(":")
+        expected = {"fixed": 1, "uniform": 2, "lognormal": 2}
+        if kind not in expected or len(values) != expected[kind]:
+            raise ValueError(
+                f"Invalid latency '{spec}'; use fixed:A, uniform:A:B or lognormal:MEDIAN:SIGMA"
+            )
+        numbers = [float(value) for value in values]
+        if any(number < 0 for number in numbers):
+            raise ValueError(f"Latency values must not be negative: '{spec}'")
+        return cls(kind, *numbers)
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "uniform":
+            return rng.uniform(self.first, self.second)
+        if self.kind == "lognormal":
+            return self.first * rng.lognormvariate(0.0, self.second)
+        return self.first
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    server: _StubServer
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: object) -> None:
+        return None
+
+    def do_GET(self) -> None:
+        if self.path.startswith("/v1/models/"):
+            model = self.path.rsplit("/", 1)[-1]
+            self._send_json(
+                {"id": model, "object": "model", "created": 0, "owned_by": "stub"}
+            )
+        else:
+            self._send_json({"error": {"message": "not found"}}, status=404)
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        services = self.server.services
+        path = self.path.split("?", 1)[0]
+        if path == "/v1/chat/completions":
+            services.count("llm")
+            allowed, headers = services.admit_completion()
+            if not allowed:
+                services.count("llm_rate_limited")
+                error = {
+                    "message": "Rate limit reached for requests",
+                    "type": "requests",
+                    "code": "rate_limit_exceeded",
+                }
+                self._send_json({"error": error}, status=429, headers=headers)
+                return
+            services.wait("llm")
+            self._send_json(
+                services.completion(json.loads(body or b"{}")), headers=headers
+            )
+        elif path == STT_PATH:
+            services.count("stt")
+            services.wait("stt")
+            result = {
+                "result": [
+                    {
+                        "alternative": [
+                            {"transcript": services.transcript, "confidence": 0.92}
+                        ],
+                        "final": True,
+                    }
+                ],
+                "result_index": 0,
+            }
+            self._send(
+                b'{"result":[]}\n' + json.dumps(result).encode(), "application/json"
+            )
+        elif path == TTS_PATH:
+            services.count("tts")
+            services.wait("tts")
+            # Roughly the size of a 24 kHz MP3 of the synthesized text.
+            self._send(b"\xff\xf3" * max(1, 200 * len(body)), "audio/mpeg")
+        else:
+            self._send_json({"error": {"message": "not found"}}, status=404)
+
+    def _send_json(
+        self,
+        payload: dict[str, object],
+        status: int = 200,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        self._send(json.dumps(payload).encode(), "application/json", status, headers)
+
+    def _send(
+        self,
+        data: bytes,
+        content_type: str,
+        status: int = 200,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class _StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    services: StubServices
+
+
+class StubServices:
+    """Threaded HTTP server answering chat completion, recognition and TTS requests.
+
+    Use as a context manager; the server listens on an ephemeral localhost port
+    and every endpoint sleeps for a sample of its latency distribution.  With
+    ``rate_limit`` the chat endpoint allows that many requests per
+    ``rate_limit_window`` seconds, sends OpenAI's ``x-ratelimit-*`` headers and
+    answers 429 with ``retry-after-ms`` once the budget is spent.
+    """
+
+    def __init__(
+        self,
+        *,
+        llm_latency: LatencyDistribution | None = None,
+        stt_latency: LatencyDistribution | None = None,
+        tts_latency: LatencyDistribution | None = None,
+        transcript: str = "What time is it?",
+        response: str = "It is twelve o'clock.",
+        seed: int | None = None,
+        rate_limit: int | None = None,
+        rate_limit_window: float = 60.0,
+    ) -> None:
+        self.latencies = {
+            "llm": llm_latency or LatencyDistribution(),
+            "stt": stt_latency or LatencyDistribution(),
+            "tts": tts_latency or LatencyDistribution(),
+        }
+        self.transcript = transcript
+        self.response = response
+        self.requests: Counter[str] = Counter()
+        self.rate_limit = (
+            TokenBucket(rate_limit, rate_limit / rate_limit_window)
+            if rate_limit
+            else None
+        )
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server: _StubServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("Stub services are not running")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def openai_base_url(self) -> str:
+        return f"{self.base_url}/v1"
+
+    @property
+    def stt_endpoint(self) -> str:
+        return f"{self.base_url}{STT_PATH}"
+
+    @property
+    def tts_endpoint(self) -> str:
+        return f"{self.base_url}{TTS_PATH}"
+
+    def start(self) -> StubServices:
+        self._server = _StubServer(("127.0.0.1", 0), _StubHandler)
+        self._server.services = self
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="stub-services", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> StubServices:
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    def count(self, service: str) -> None:
+        with self._lock:
+            self.requests[service] += 1
+
+    def wait(self, service: str) -> None:
+        with self._lock:
+            delay = self.latencies[service].sample(self._rng)
+        time.sleep(delay)
+
+    def admit_completion(self) -> tuple[bool, dict[str, str]]:
+        """Spend one request of the rate limit; return whether it is allowed and the headers."""
+        bucket = self.rate_limit
+        if bucket is None:
+            return True, {}
+        with self._lock:
+            wait = bucket.wait_time(1)
+            allowed = wait == 0
+            if allowed:
+                bucket.take(1)
+            remaining = max(0, int(bucket.level))
+            reset = (bucket.capacity - bucket.level) / bucket.per_second
+        headers = {
+            "x-ratelimit-limit-requests": str(int(bucket.capacity)),
+            "x-ratelimit-remaining-requests": str(remaining),
+            "x-ratelimit-reset-requests": f"{reset:.3f}s",
+        }
+        if not allowed:
+            headers["retry-after-ms"] = str(max(1, round(wait * 1000)))
+        return allowed, headers
+
+    def completion(self, request: dict[str, object]) -> dict[str, object]:
+        """Build a chat completion body in the OpenAI response format."""
+        completion_tokens = len(self.response.split())
+        prompt_tokens = sum(
+            len(str(message.get("content", "")).split())
+            for message in request.get("messages", [])
+        )
+        return {
+            "id": "chatcmpl-stub",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "stub"),
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": self.response},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
@@ -0,0 +1,35 @@
+"""Split responses into chunks that can be synthesized and played independently."""
+
+from __future__ import annotations
+
+import re
+import textwrap
+
+MAX_CHUNK_CHARS = 200
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def split_sentences(text: str, max_chars: int = MAX_CHUNK_CHARS) -> list[str]:
+    """Split ``text`` into speakable chunks of at most ``max_chars`` characters.
+
+    The first sentence is always a chunk of its own so playback can start as
+    soon as it is synthesized; later sentences are merged up to ``max_chars``
+    to keep the number of requests down.  Sentences longer than ``max_chars``
+    are broken at word boundaries.
+    """
+    sentences = []
+    for sentence in _SENTENCE_END.split(text.strip()):
+        sentences.extend(
+            textwrap.wrap(sentence, max_chars, break_long_words=False)
+            if len(sentence) > max_chars
+            else [sentence]
+        )
+
+    chunks: list[str] = []
+    for sentence in filter(None, (sentence.strip() for sentence in sentences)):
+        if len(chunks) > 1 and len(chunks[-1]) + 1 + len(sentence) <= max_chars:
+            chunks[-1] = f"{chunks[-1]} {sentence}"
+        else:
+            chunks.append(sentence)
+    return chunks
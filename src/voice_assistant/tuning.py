@@ -0,0 +1,267 @@
+"""Self-tuning of capture timing parameters from recently observed utterances."""
+
+from __future__ import annotations
+
+import json
+import logging
+import statistics
+from collections import deque
+from dataclasses import MISSING, asdict, dataclass, fields
+from pathlib import Path
+
+import speech_recognition as sr
+
+from voice_assistant.audio import (
+    INT16_FULL_SCALE,
+    downmix,
+    pcm_to_array,
+    speech_segments,
+)
+from voice_assistant.config import AssistantConfig
+from voice_assistant.metrics import percentile
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_PROFILE_PATH = Path.home() / ".voice-assistant" / "tuning.json"
+
+# Safe bounds for every tuned parameter, in seconds.
+PAUSE_THRESHOLD_BOUNDS = (0.4, 2.0)
+AMBIENT_NOISE_BOUNDS = (0.1, 1.0)
+LISTEN_TIMEOUT_BOUNDS = (3.0, 30.0)
+PHRASE_TIME_LIMIT_BOUNDS = (5.0, 60.0)
+
+# A pause within this many seconds of the pause threshold nearly ended the
+# capture mid-question; a slightly longer one would have cut the speaker off.
+PAUSE_MARGIN = 0.1
+
+TUNED_SETTINGS = (
+    "pause_threshold",
+    "ambient_noise_duration",
+    "listen_timeout",
+    "phrase_time_limit",
+)
+
+
+def explicit_settings(config: AssistantConfig) -> frozenset[str]:
+    """Tuned settings of ``config`` that differ from their defaults."""
+    defaults = {
+        field.name: field.default
+        for field in fields(AssistantConfig)
+        if field.default is not MISSING
+    }
+    return frozenset(
+        name for name in TUNED_SETTINGS if getattr(config, name) != defaults[name]
+    )
+
+
+@dataclass(frozen=True)
+class CaptureObservation:
+    """What was learned from a single captured utterance."""
+
+    duration: float
+    leading_silence: float
+    longest_gap: float
+    energy_threshold: float
+    truncated: bool = False
+    unintelligible: bool = False
+
+
+@dataclass
+class TuningProfile:
+    """Learned capture parameters, persisted between restarts."""
+
+    pause_threshold: float
+    ambient_noise_duration: float
+    listen_timeout: float | None = None
+    phrase_time_limit: float | None = None
+    energy_threshold: float | None = None
+    observations: int = 0
+
+    @classmethod
+    def from_config(cls, config: AssistantConfig) -> TuningProfile:
+        return cls(
+            pause_threshold=config.pause_threshold,
+            ambient_noise_duration=config.ambient_noise_duration,
+            listen_timeout=config.listen_timeout,
+            phrase_time_limit=config.phrase_time_limit,
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> TuningProfile:
+        return cls(**json.loads(path.read_text(encoding="utf-8")))
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(path.suffix + ".tmp")
+        temp_path.write_text(json.dumps(asdict(self), indent=2), encoding="utf-8")
+        temp_path.replace(path)
+
+    def apply(
+        self,
+        config: AssistantConfig,
+        recognizer: sr.Recognizer,
+        *,
+        pinned: frozenset[str] = frozenset(),
+    ) -> None:
+        """Copy the learned values onto ``config`` and ``recognizer``.
+
+        Settings named in ``pinned`` keep their configured value.  Noise
+        calibration is a moving average that starts from the recognizer's
+        current energy threshold, so the learned threshold seeds it.
+        """
+        for name in TUNED_SETTINGS:
+            if name not in pinned:
+                setattr(config, name, getattr(self, name))
+        recognizer.pause_threshold = config.pause_threshold
+        if self.energy_threshold is not None:
+            recognizer.energy_threshold = self.energy_threshold
+
+
+def observe_audio(
+    audio: sr.AudioData,
+    *,
+    energy_threshold: float,
+    phrase_time_limit: float | None,
+    unintelligible: bool,
+    pause_threshold: float | None = None,
+) -> CaptureObservation:
+    """Measure utterance length, leading silence and inter-word gaps of ``audio``.
+
+    The capture counts as truncated when it reached ``phrase_time_limit`` or
+    contains a pause within :data:`PAUSE_MARGIN` of ``pause_threshold``.
+    """
+    samples = downmix(pcm_to_array(audio.get_raw_data(convert_width=2)))
+    duration = len(samples) / audio.sample_rate
+    segments = speech_segments(
+        samples, audio.sample_rate, energy_threshold / INT16_FULL_SCALE
+    )
+    gaps = [start - end for (_, end), (start, _) in zip(segments, segments[1:])]
+    longest_gap = max(gaps, default=0.0)
+    truncated = bool(
+        (phrase_time_limit is not None and duration >= phrase_time_limit - 0.05)
+        or (
+            pause_threshold is not None
+            and longest_gap >= pause_threshold - PAUSE_MARGIN
+        )
+    )
+    return CaptureObservation(
+        duration=segments[-1][1] - segments[0][0] if segments else 0.0,
+        leading_silence=segments[0][0] if segments else duration,
+        longest_gap=longest_gap,
+        energy_threshold=energy_threshold,
+        truncated=truncated,
+        unintelligible=unintelligible,
+    )
+
+
+def _clamp(value: float, bounds: tuple[float, float]) -> float:
+    return min(max(value, bounds[0]), bounds[1])
+
+
+class AutoTuner:
+    """Adjust capture timings towards what recent sessions actually needed.
+
+    Parameters only move part of the way towards their target after each
+    observation and never shrink while the truncation or unintelligible rate
+    is above ``max_error_rate``, so a bad stretch cannot make capture worse.
+    Settings named in ``pinned`` were set explicitly and are not tuned.
+    """
+
+    def __init__(
+        self,
+        profile: TuningProfile,
+        *,
+        pinned: frozenset[str] = frozenset(),
+        window: int = 50,
+        min_observations: int = 5,
+        step: float = 0.5,
+        max_error_rate: float = 0.1,
+    ) -> None:
+        self.profile = profile
+        self.pinned = pinned
+        self.min_observations = min_observations
+        self.step = step
+        self.max_error_rate = max_error_rate
+        self._observations: deque[CaptureObservation] = deque(maxlen=window)
+
+    def observe(self, observation: CaptureObservation) -> None:
+        self._observations.append(observation)
+        self.profile.observations += 1
+
+    @property
+    def truncation_rate(self) -> float:
+        return self._rate(lambda observation: observation.truncated)
+
+    @property
+    def unintelligible_rate(self) -> float:
+        return self._rate(lambda observation: observation.unintelligible)
+
+    def _rate(self, predicate) -> float:
+        if not self._observations:
+            return 0.0
+        return sum(map(predicate, self._observations)) / len(self._observations)
+
+    def tune(self) -> TuningProfile:
+        """Update and return the profile from the observation window."""
+        voiced = [obs for obs in self._observations if obs.duration > 0]
+        if len(voiced) < self.min_observations:
+            return self.profile
+
+        profile = self.profile
+        struggling = (
+            self.truncation_rate > self.max_error_rate
+            or self.unintelligible_rate > self.max_error_rate
+        )
+
+        if "pause_threshold" not in self.pinned:
+            gap_target = percentile([obs.longest_gap for obs in voiced], 0.95) + 0.2
+            profile.pause_threshold = self._move(
+                profile.pause_threshold, gap_target, PAUSE_THRESHOLD_BOUNDS, struggling
+            )
+
+        if profile.listen_timeout is not None and "listen_timeout" not in self.pinned:
+            leading = percentile([obs.leading_silence for obs in voiced], 0.95)
+            profile.listen_timeout = self._move(
+                profile.listen_timeout, 2 * leading, LISTEN_TIMEOUT_BOUNDS, struggling
+            )
+
+        if (
+            profile.phrase_time_limit is not None
+            and "phrase_time_limit" not in self.pinned
+        ):
+            if self.truncation_rate > self.max_error_rate:
+                target = profile.phrase_time_limit * 1.25
+            else:
+                target = 1.5 * percentile([obs.duration for obs in voiced], 0.95)
+            profile.phrase_time_limit = self._move(
+                profile.phrase_time_limit, target, PHRASE_TIME_LIMIT_BOUNDS, struggling
+            )
+
+        energies = [obs.energy_threshold for obs in self._observations]
+        median_energy = statistics.median(energies)
+        spread = statistics.pstdev(energies) / median_energy if median_energy else 1.0
+        # A stable noise floor needs only a short recalibration per capture.
+        noise_target = AMBIENT_NOISE_BOUNDS[0] if spread < 0.15 else 1.0
+        if "ambient_noise_duration" not in self.pinned:
+            profile.ambient_noise_duration = self._move(
+                profile.ambient_noise_duration,
+                noise_target,
+                AMBIENT_NOISE_BOUNDS,
+                False,
+            )
+        profile.energy_threshold = median_energy
+
+        LOGGER.debug("Tuned capture parameters: %s", profile)
+        return profile
+
+    def _move(
+        self,
+        current: float,
+        target: float,
+        bounds: tuple[float, float],
+        no_decrease: bool,
+    ) -> float:
+        proposed = current + self.step * (target - current)
+        if no_decrease:
+            proposed = max(proposed, current)
+        return round(_clamp(proposed, bounds), 3)
@@ -0,0 +1,45 @@
+"""Concurrent start-up warm-up of the assistant's slow-to-initialize components."""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _timed(task: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    task()
+    return time.perf_counter() - start
+
+
+def run_warmup(
+    tasks: Mapping[str, Callable[[], object]],
+    *,
+    max_workers: int | None = None,
+) -> dict[str, float]:
+    """Run every task concurrently and return how long each one took.
+
+    A failing task is logged and left out of the result; warm-up is an
+    optimization, so the assistant still starts and initializes that component
+    lazily on first use.
+    """
+    if not tasks:
+        return {}
+
+    timings: dict[str, float] = {}
+    with ThreadPoolExecutor(
+        max_workers=max_workers or len(tasks), thread_name_prefix="warmup"
+    ) as executor:
+        futures = {name: executor.submit(_timed, task) for name, task in tasks.items()}
+        for name, future in futures.items():
+            try:
+                timings[name] = future.result()
+            except Exception as exc:
+                LOGGER.warning("Warm-up of %s failed: %s", name, exc)
+            else:
+                LOGGER.info("Warmed up %s in %.3fs", name, timings[name])
+    return timings
@@ -0,0 +1,307 @@
+"""Answer recorded audio on a pool of worker processes that each own an assistant."""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import itertools
+import json
+import logging
+import multiprocessing
+import os
+import queue
+import sys
+import time
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+
+import speech_recognition as sr
+
+from voice_assistant.assistant import VoiceAssistant
+from voice_assistant.cli import configure_logging
+from voice_assistant.config import AssistantConfig
+from voice_assistant.session import Interaction
+
+LOGGER = logging.getLogger(__name__)
+
+AssistantFactory = Callable[[], VoiceAssistant]
+
+# Workers have no audio devices; only network clients are worth warming up.
+WORKER_WARMUP = ("openai",)
+
+
+@dataclass(frozen=True)
+class SharedAudio:
+    """PCM audio placed in a shared memory block, passed to workers by name."""
+
+    name: str
+    size: int
+    sample_rate: int
+    sample_width: int
+
+    @classmethod
+    def create(cls, audio: sr.AudioData) -> tuple[SharedMemory, SharedAudio]:
+        """Copy ``audio`` into a new block; the caller must unlink it when done."""
+        frame_data = audio.get_raw_data()
+        memory = SharedMemory(create=True, size=max(1, len(frame_data)))
+        memory.buf[: len(frame_data)] = frame_data
+        return memory, cls(
+            memory.name, len(frame_data), audio.sample_rate, audio.sample_width
+        )
+
+    def read(self) -> sr.AudioData:
+        """Attach to the block and return its audio."""
+        memory = SharedMemory(name=self.name)
+        try:
+            frame_data = bytes(memory.buf[: self.size])
+        finally:
+            memory.close()
+        return sr.AudioData(frame_data, self.sample_rate, self.sample_width)
+
+
+def _serve(
+    factory: AssistantFactory,
+    warm_up: Sequence[str],
+    tasks: multiprocessing.Queue,
+    results: multiprocessing.Queue,
+) -> None:
+    """Worker process loop: build and warm an assistant, then answer tasks."""
+    try:
+        assistant = factory()
+        if warm_up:
+            assistant.warm_up(warm_up)
+    except Exception as exc:
+        results.put(("failed", repr(exc)))
+        return
+    results.put(("ready", os.getpid()))
+
+    cpu_start = time.process_time()
+    while (task := tasks.get()) is not None:
+        key, shared = task
+        interaction = assistant.answer_audio(shared.read())
+        interaction.audio = None
+        results.put((key, interaction))
+    results.put(("stopped", time.process_time() - cpu_start))
+
+
+class WorkerPool:
+    """Supervisor distributing recorded questions over worker processes.
+
+    Each worker builds its own assistant with ``factory`` (which must be
+    picklable, e.g. a :func:`functools.partial` of a class) and warms it up
+    once.  Audio reaches the workers through shared memory rather than being
+    pickled onto the task queue; results come back without audio.
+    """
+
+    def __init__(
+        self,
+        factory: AssistantFactory,
+        processes: int | None = None,
+        *,
+        warm_up: Sequence[str] = WORKER_WARMUP,
+        max_in_flight: int | None = None,
+        start_timeout: float = 60.0,
+    ) -> None:
+        self.factory = factory
+        self.processes = processes or os.cpu_count() or 1
+        self.warm_up = tuple(warm_up)
+        self.max_in_flight = max_in_flight or 2 * self.processes
+        self.start_timeout = start_timeout
+        self.worker_cpu_seconds = 0.0
+        context = multiprocessing.get_context("spawn")
+        self._context = context
+        self._tasks: multiprocessing.Queue = context.Queue()
+        self._results: multiprocessing.Queue = context.Queue()
+        self._workers: list[multiprocessing.process.BaseProcess] = []
+        self._batches = itertools.count()
+
+    def start(self) -> WorkerPool:
+        """Start the workers and wait until every one is warmed up."""
+        for number in range(self.processes):
+            worker = self._context.Process(
+                target=_serve,
+                args=(self.factory, self.warm_up, self._tasks, self._results),
+                name=f"assistant-worker-{number}",
+                daemon=True,
+            )
+            worker.start()
+            self._workers.append(worker)
+
+        for _ in range(self.processes):
+            status, detail = self._get_result(self.start_timeout)
+            if status != "ready":
+                self.close()
+                raise RuntimeError(f"Worker failed to start: {detail}")
+        LOGGER.info("Started %d assistant workers", self.processes)
+        return self
+
+    def close(self) -> None:
+        """Stop the workers after they finish their current task."""
+        alive = [worker for worker in self._workers if worker.is_alive()]
+        for _ in alive:
+            self._tasks.put(None)
+        stopped = 0
+        while stopped < len(alive):
+            try:
+                status, detail = self._get_result(self.start_timeout)
+            except RuntimeError:
+                break
+            if status == "stopped":
+                stopped += 1
+                self.worker_cpu_seconds += detail
+        for worker in self._workers:
+            worker.join(timeout=self.start_timeout)
+            if worker.is_alive():
+                worker.terminate()
+        self._workers = []
+
+    def __enter__(self) -> WorkerPool:
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def map(self, audios: Iterable[sr.AudioData]) -> Iterator[Interaction]:
+        """Answer every audio clip and yield the interactions in input order.
+
+        At most :attr:`max_in_flight` clips are queued at once, which bounds
+        the shared memory in use.
+        """
+        batch = next(self._batches)
+        clips = iter(audios)
+        pending: dict[int, SharedMemory] = {}
+        finished: dict[int, Interaction] = {}
+        submitted = 0
+        next_index = 0
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < self.max_in_flight:
+                    audio = next(clips, None)
+                    if audio is None:
+                        exhausted = True
+                        break
+                    memory, shared = SharedAudio.create(audio)
+                    pending[submitted] = memory
+                    self._tasks.put(((batch, submitted), shared))
+                    submitted += 1
+                if not pending:
+                    return
+
+                key, interaction = self._get_result()
+                if not isinstance(key, tuple) or key[0] != batch:
+                    continue  # left over from an abandoned earlier map()
+                index = key[1]
+                _release(pending.pop(index))
+                finished[index] = interaction
+                while next_index in finished:
+                    yield finished.pop(next_index)
+                    next_index += 1
+        finally:
+            for memory in pending.values():
+                _release(memory)
+
+    def _get_result(self, timeout: float | None = None) -> tuple[object, object]:
+        """Wait for the next worker message, failing if a worker has died."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                return self._results.get(timeout=1.0)
+            except queue.Empty:
+                dead = [
+                    worker.name for worker in self._workers if not worker.is_alive()
+                ]
+                if dead:
+                    raise RuntimeError(
+                        f"Worker exited unexpectedly: {', '.join(dead)}"
+                    ) from None
+                if deadline is not None and time.monotonic() > deadline:
+                    raise RuntimeError("Timed out waiting for workers") from None
+
+
+def _release(memory: SharedMemory) -> None:
+    memory.close()
+    memory.unlink()
+
+
+def read_audio_file(path: str) -> sr.AudioData:
+    """Load a WAV, AIFF or FLAC file."""
+    with sr.AudioFile(path) as source:
+        return sr.Recognizer().record(source)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments for batch processing."""
+    parser = argparse.ArgumentParser(
+        description="Transcribe and answer recorded questions on a pool of worker processes."
+    )
+    parser.add_argument("files", nargs="+", help="WAV, AIFF or FLAC files to answer")
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes (default: number of CPUs)",
+    )
+    parser.add_argument("--api-key", help="OpenAI API key (overrides environment)")
+    parser.add_argument(
+        "--model", default="gpt-3.5-turbo", help="OpenAI chat model to use"
+    )
+    parser.add_argument("--faq", dest="faq_path", help="FAQ file answered locally")
+    parser.add_argument(
+        "--log-level",
+        default="WARNING",
+        choices=["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"],
+        help="Logging verbosity",
+    )
+    args = parser.parse_args(argv)
+    if args.processes < 1:
+        parser.error("--processes must be at least 1")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Answer every file and print one JSON object per file.
+
+    Errors go to the log on stderr; the exit status is 1 if the pool failed or
+    any file went unanswered.
+    """
+    args = parse_args(argv)
+    configure_logging(args.log_level)
+
+    api_key = args.api_key or os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        LOGGER.error("An OpenAI API key is required (--api-key or OPENAI_API_KEY)")
+        return 1
+
+    config = AssistantConfig(model=args.model, faq_path=args.faq_path, warm_up=False)
+    factory = functools.partial(VoiceAssistant, api_key=api_key, config=config)
+    audios = (read_audio_file(path) for path in args.files)
+    failures = 0
+    try:
+        with WorkerPool(factory, min(args.processes, len(args.files))) as pool:
+            for path, interaction in zip(args.files, pool.map(audios)):
+                failures += bool(interaction.error or not interaction.response)
+                print(
+                    json.dumps(
+                        {
+                            "file": path,
+                            "transcript": interaction.transcript,
+                            "response": interaction.response,
+                            "error": interaction.error,
+                            "timings": interaction.timings,
+                        }
+                    ),
+                    flush=True,
+                )
+    except (OSError, ValueError, RuntimeError) as exc:
+        LOGGER.error("Batch processing failed: %s", exc)
+        return 1
+    if failures:
+        LOGGER.error("%d of %d files were not answered", failures, len(args.files))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,6 +8,30 @@ import pytest
 import speech_recognition as sr
 
 from voice_assistant import AssistantConfig, VoiceAssistant
+from voice_assistant.fakes import (
+    FakeMicrophone,
+    FakeOpenAIClient,
+    ScriptedRecognizer,
+    synthetic_speech,
+)
+from voice_assistant.loadtest import ServiceEndpoints
+from voice_assistant.stubs import LatencyDistribution, StubServices
+
+
+class FakeClock:
+    """Clock advanced by hand."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Create a clock for code that takes one, advanced by setting ``now``."""
+    return FakeClock()
 
 
 @pytest.fixture
@@ -77,3 +101,25 @@ def mock_microphone():
     mic.__enter__ = Mock(return_value=mic)
     mic.__exit__ = Mock(return_value=False)
     return mic
+
+
+@pytest.fixture
+def scripted_assistant(assistant_config):
+    """Create a VoiceAssistant driven by scripted fakes instead of devices and APIs."""
+    assistant_config.warm_up = False
+    recognizer = ScriptedRecognizer(
+        [synthetic_speech(seed=0)], ["test", "What time is it?"]
+    )
+    assistant = VoiceAssistant(
+        api_key="sk-test-key-12345", config=assistant_config, recognizer=recognizer
+    )
+    assistant.client = FakeOpenAIClient(["It is noon."])
+    assistant._microphone = FakeMicrophone()
+    return assistant
+
+
+@pytest.fixture(scope="module")
+def endpoints():
+    """Run fast stub OpenAI, recognition and TTS services and return their endpoints."""
+    with StubServices(llm_latency=LatencyDistribution("fixed", 0.01)) as services:
+        yield ServiceEndpoints.from_services(services)
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import threading
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 import speech_recognition as sr
 
 from voice_assistant import AssistantConfig, VoiceAssistant
+from voice_assistant.fakes import synthetic_speech
 
 
 class TestVoiceAssistantInit:
@@ -137,6 +139,7 @@ class TestRecognizeSpeech:
         voice_assistant.recognizer.recognize_google.assert_called_once_with(
             mock_audio_data
         )
+        assert len(voice_assistant.metrics.samples("recognition")) == 1
 
     def test_recognize_speech_unknown_value(self, voice_assistant, mock_audio_data):
         """Test speech recognition with unintelligible audio."""
@@ -159,6 +162,68 @@ class TestRecognizeSpeech:
         assert result is None
 
 
+class TestPreprocessAudio:
+    """Tests for _preprocess_audio method."""
+
+    def test_preprocess_audio_downsamples_and_records_bytes(self, voice_assistant):
+        """Test that captured audio is downsampled and byte counts recorded."""
+        voice_assistant.recognizer.energy_threshold = 300
+        audio = sr.AudioData(b"\x00\x10" * 44100, 44100, 2)
+
+        processed = voice_assistant._preprocess_audio(audio)
+
+        assert processed.sample_rate == 16000
+        assert voice_assistant.metrics.samples("audio_bytes_captured") == [88200]
+        assert voice_assistant.metrics.samples("audio_bytes_uploaded") == [
+            len(processed.get_raw_data())
+        ]
+
+    def test_preprocess_audio_disabled_trimming(self, voice_assistant):
+        """Test that trimming can be disabled while still resampling."""
+        voice_assistant.config.trim_silence = False
+        voice_assistant.config.target_sample_rate = None
+        audio = sr.AudioData(b"\x00\x00" * 1600, 16000, 2)
+
+        processed = voice_assistant._preprocess_audio(audio)
+
+        assert processed.get_raw_data() == audio.get_raw_data()
+
+    def test_preprocess_audio_falls_back_on_invalid_audio(
+        self, voice_assistant, mock_audio_data
+    ):
+        """Test that audio that cannot be decoded is passed through."""
+        assert voice_assistant._preprocess_audio(mock_audio_data) is mock_audio_data
+
+
+class TestAnswerAudio:
+    """Tests for answering recorded audio."""
+
+    def test_answer_audio(self, voice_assistant, mock_openai_client):
+        """Test transcription and answer without microphone or speaker."""
+        voice_assistant.client = mock_openai_client
+        voice_assistant.recognizer.recognize_google.return_value = "Hello"
+
+        with patch.object(voice_assistant, "speak_text") as mock_speak:
+            interaction = voice_assistant.answer_audio(synthetic_speech(seed=0))
+
+        assert interaction.transcript == "Hello"
+        assert interaction.response == "This is a test response"
+        assert interaction.audio is not None
+        assert "interaction" in interaction.timings
+        mock_speak.assert_not_called()
+
+    def test_answer_audio_unintelligible(self, voice_assistant, mock_openai_client):
+        """Test that no answer is requested without a transcript."""
+        voice_assistant.client = mock_openai_client
+        voice_assistant.recognizer.recognize_google.side_effect = sr.UnknownValueError()
+
+        interaction = voice_assistant.answer_audio(MagicMock(spec=sr.AudioData))
+
+        assert interaction.transcript is None
+        assert interaction.response is None
+        mock_openai_client.chat.completions.create.assert_not_called()
+
+
 class TestSpeakText:
     """Tests for speak_text method."""
 
@@ -215,6 +280,20 @@ class TestSpeakText:
 
         mock_gtts.assert_called_once()
 
+    @patch("voice_assistant.assistant.gTTS")
+    def test_speak_text_gtts_error_removes_temp_file(
+        self, mock_gtts, voice_assistant, tmp_path, monkeypatch
+    ):
+        """Test that a failed synthesis does not leave its temp file behind."""
+        from gtts.tts import gTTSError
+
+        monkeypatch.setattr("tempfile.tempdir", str(tmp_path))
+        mock_gtts.side_effect = gTTSError("Network error")
+
+        voice_assistant.speak_text("Hello")
+
+        assert list(tmp_path.iterdir()) == []
+
     @patch("voice_assistant.assistant.pygame")
     @patch("voice_assistant.assistant.gTTS")
     @patch("voice_assistant.assistant.tempfile.NamedTemporaryFile")
@@ -235,6 +314,54 @@ class TestSpeakText:
         # Should not raise, just log error
         voice_assistant.speak_text("Hello")
 
+    @patch("voice_assistant.assistant.pygame")
+    def test_speak_text_plays_chunks_in_order(self, mock_pygame, voice_assistant):
+        """Test that sentence chunks synthesize concurrently but play in order."""
+        first_played = threading.Event()
+        waited_for_first = []
+        synthesized = {}
+
+        def synthesize(text, path):
+            if text == "Second is slow.":
+                # Only finishes early if the first chunk plays without it.
+                waited_for_first.append(first_played.wait(timeout=5))
+            path.write_text(text)
+            synthesized[str(path)] = text
+
+        def load(path):
+            played.append(synthesized[path])
+            if synthesized[path] == "First.":
+                first_played.set()
+
+        mock_pygame.mixer.music.get_busy.return_value = False
+        played = []
+        mock_pygame.mixer.music.load.side_effect = load
+        voice_assistant._synthesize = synthesize
+
+        text = "First. " + "Second is slow. " + "Third " * 40 + "is long."
+        voice_assistant.speak_text(text)
+
+        assert played[:2] == ["First.", "Second is slow."]
+        assert len(played) > 2
+        assert waited_for_first == [True]
+        assert voice_assistant.metrics.summary("time_to_first_audio").count == 1
+
+    @patch("voice_assistant.assistant.pygame")
+    def test_speak_text_single_worker_sends_whole_text(
+        self, mock_pygame, voice_assistant
+    ):
+        """Test that one synthesis worker keeps the response in one request."""
+        voice_assistant.config.synthesis_workers = 1
+        mock_pygame.mixer.music.get_busy.return_value = False
+
+        with patch("voice_assistant.assistant.gTTS") as mock_gtts:
+            voice_assistant.speak_text("One. Two. Three.")
+
+        mock_gtts.assert_called_once_with(
+            text="One. Two. Three.", lang="en", slow=False
+        )
+        mock_pygame.mixer.music.load.assert_called_once()
+
 
 class TestPrepareMincrophone:
     """Tests for _prepare_microphone method."""
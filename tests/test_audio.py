@@ -0,0 +1,144 @@
+"""Tests for audio preprocessing helpers."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import speech_recognition as sr
+
+from voice_assistant.audio import (
+    array_to_pcm,
+    downmix,
+    pcm_to_array,
+    preprocess_audio,
+    preprocess_pcm,
+    resample,
+    speech_segments,
+    trim_silence,
+)
+
+
+def make_tone(seconds: float, rate: int, amplitude: float = 0.5) -> np.ndarray:
+    """Create a 440 Hz sine wave."""
+    times = np.arange(int(seconds * rate)) / rate
+    return (amplitude * np.sin(2 * np.pi * 440 * times)).astype(np.float32)
+
+
+def with_silence(signal: np.ndarray, rate: int, lead: float, tail: float) -> np.ndarray:
+    """Surround ``signal`` with digital silence."""
+    return np.concatenate(
+        [np.zeros(int(lead * rate)), signal, np.zeros(int(tail * rate))]
+    ).astype(np.float32)
+
+
+class TestPcmConversion:
+    """Tests for PCM encoding and decoding."""
+
+    def test_round_trip(self):
+        """Test that encoding and decoding preserves samples."""
+        samples = np.array([0.0, 0.5, -0.5, 0.25], dtype=np.float32)
+
+        decoded = pcm_to_array(array_to_pcm(samples))
+
+        assert decoded.shape == (4, 1)
+        np.testing.assert_allclose(decoded[:, 0], samples, atol=1e-4)
+
+    def test_array_to_pcm_clips(self):
+        """Test that out-of-range samples are clipped."""
+        decoded = pcm_to_array(array_to_pcm(np.array([2.0, -2.0])))
+
+        assert decoded.max() < 1.0
+        assert decoded.min() == -1.0
+
+    def test_invalid_channel_count(self):
+        """Test that a channel count below one is rejected."""
+        with pytest.raises(ValueError, match="channels"):
+            pcm_to_array(b"\x00\x00", channels=0)
+
+    def test_downmix_averages_channels(self):
+        """Test that stereo input is averaged into mono."""
+        stereo = np.array([[0.5, -0.5], [1.0, 0.0]], dtype=np.float32)
+
+        np.testing.assert_allclose(downmix(stereo), [0.0, 0.5])
+
+
+class TestSilence:
+    """Tests for silence detection and trimming."""
+
+    def test_speech_segments(self):
+        """Test that voiced regions are located."""
+        rate = 16000
+        signal = with_silence(make_tone(0.5, rate), rate, lead=1.0, tail=0.5)
+
+        segments = speech_segments(signal, rate, threshold=0.05)
+
+        assert len(segments) == 1
+        start, end = segments[0]
+        assert start == pytest.approx(1.0, abs=0.03)
+        assert end == pytest.approx(1.5, abs=0.03)
+
+    def test_trim_silence_keeps_padding(self):
+        """Test that leading and trailing silence is removed."""
+        rate = 16000
+        signal = with_silence(make_tone(0.5, rate), rate, lead=1.0, tail=1.0)
+
+        trimmed = trim_silence(signal, rate, threshold=0.05, padding=0.1)
+
+        assert len(trimmed) / rate == pytest.approx(0.7, abs=0.05)
+
+    def test_trim_silence_without_speech_returns_input(self):
+        """Test that silent input is left untouched."""
+        signal = np.zeros(16000, dtype=np.float32)
+
+        assert trim_silence(signal, 16000, threshold=0.05) is signal
+
+
+class TestResample:
+    """Tests for resampling."""
+
+    def test_downsample_length(self):
+        """Test that downsampling produces the expected sample count."""
+        resampled = resample(make_tone(1.0, 48000), 48000, 16000)
+
+        assert len(resampled) == 16000
+
+    def test_same_rate_is_noop(self):
+        """Test that matching rates return the input."""
+        signal = make_tone(0.1, 16000)
+
+        assert resample(signal, 16000, 16000) is signal
+
+
+class TestPreprocess:
+    """Tests for the complete preprocessing pipeline."""
+
+    def test_preprocess_pcm_shrinks_audio(self):
+        """Test that trimming and downsampling reduce the payload."""
+        rate = 44100
+        signal = with_silence(make_tone(0.5, rate), rate, lead=0.8, tail=0.8)
+        raw = array_to_pcm(signal)
+
+        processed, new_rate = preprocess_pcm(
+            raw, rate, target_rate=16000, energy_threshold=300
+        )
+
+        assert new_rate == 16000
+        assert len(processed) < len(raw) / 4
+
+    def test_preprocess_pcm_downmixes_stereo(self):
+        """Test that interleaved stereo input becomes mono."""
+        mono = make_tone(0.2, 16000)
+        stereo = np.repeat(mono, 2)
+
+        processed, _ = preprocess_pcm(array_to_pcm(stereo), 16000, channels=2)
+
+        assert len(processed) == len(array_to_pcm(mono))
+
+    def test_preprocess_audio_never_upsamples(self):
+        """Test that audio below the target rate keeps its rate."""
+        audio = sr.AudioData(array_to_pcm(make_tone(0.2, 8000)), 8000, 2)
+
+        processed = preprocess_audio(audio, target_rate=16000)
+
+        assert processed.sample_rate == 8000
+        assert processed.sample_width == 2
@@ -0,0 +1,114 @@
+"""Tests for barge-in detection."""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import patch
+
+import numpy as np
+
+from voice_assistant.audio import array_to_pcm
+from voice_assistant.bargein import BargeInMonitor, frame_rms
+from voice_assistant.fakes import FakeMicrophone, FakeOpenAIClient, synthetic_speech
+
+LONG_RESPONSE = " ".join(["word"] * 100)
+
+
+def test_frame_rms():
+    """RMS is measured in 16-bit sample units."""
+    assert frame_rms(b"") == 0.0
+    assert frame_rms(b"\x00\x00" * 100) == 0.0
+    constant = array_to_pcm(np.full(100, 1000 / 32768, dtype=np.float32))
+    assert abs(frame_rms(constant) - 1000) < 1
+
+
+class TestBargeInMonitor:
+    """Tests for the microphone monitor."""
+
+    def test_triggers_on_speech(self):
+        """Sustained speech calls back with the onset time and keeps the preroll."""
+        detected = threading.Event()
+        onsets = []
+
+        def on_speech(onset):
+            onsets.append(onset)
+            detected.set()
+
+        microphone = FakeMicrophone(audio=synthetic_speech(seed=0), realtime=True)
+        with BargeInMonitor(
+            microphone, on_speech, energy_threshold=900, min_speech=0.2
+        ) as monitor:
+            assert detected.wait(2.0)
+
+        assert monitor.triggered
+        assert monitor.speech_started_at == onsets[0]
+        assert len(monitor.preroll_audio()) > 0
+
+    def test_ignores_silence(self):
+        """Quiet input never triggers."""
+        on_speech = threading.Event()
+        microphone = FakeMicrophone(realtime=True)
+        with BargeInMonitor(
+            microphone, lambda onset: on_speech.set(), energy_threshold=900
+        ) as monitor:
+            assert not on_speech.wait(0.3)
+
+        assert not monitor.triggered
+        assert monitor.preroll_audio() == b"\x00" * len(monitor.preroll_audio())
+
+
+class TestAssistantBargeIn:
+    """Tests for barge-in handling in the assistant."""
+
+    def test_interrupts_streaming_generation(self, scripted_assistant):
+        """Speaking during generation cancels it and queues the speech as the next question."""
+        scripted_assistant.config.barge_in = True
+        scripted_assistant.client = FakeOpenAIClient([LONG_RESPONSE], chunk_delay=0.05)
+        scripted_assistant._microphone = FakeMicrophone(
+            audio=synthetic_speech(seed=1, lead=0.1), realtime=True
+        )
+
+        with patch.object(scripted_assistant, "speak_text") as mock_speak:
+            interaction = scripted_assistant.interact()
+
+        assert interaction.error == "barge-in"
+        assert interaction.response is None
+        mock_speak.assert_not_called()
+        assert scripted_assistant.client.last_request["stream"] is True
+        assert scripted_assistant.metrics.count("barge_ins") == 1
+        assert scripted_assistant.metrics.summary("barge_in_cutoff").maximum < 1.0
+        assert scripted_assistant._barge_in_preroll
+        assert not scripted_assistant._cancel.is_set()
+
+    def test_streams_full_response_without_interruption(self, scripted_assistant):
+        """Without speech the streamed response is assembled and spoken."""
+        scripted_assistant.config.barge_in = True
+        scripted_assistant._microphone = FakeMicrophone(realtime=True)
+
+        with patch.object(scripted_assistant, "speak_text") as mock_speak:
+            interaction = scripted_assistant.interact()
+
+        assert interaction.response == "It is noon."
+        mock_speak.assert_called_once_with("It is noon.")
+        assert scripted_assistant._barge_in_preroll is None
+
+    def test_preroll_skips_keyword_and_calibration(self, scripted_assistant):
+        """A queued interruption becomes the next question straight away."""
+        scripted_assistant._barge_in_preroll = b"\x00\x00" * 1600
+
+        with (
+            patch.object(scripted_assistant, "_prepare_microphone") as mock_prepare,
+            patch.object(scripted_assistant, "speak_text"),
+        ):
+            interaction = scripted_assistant.interact()
+
+        mock_prepare.assert_not_called()
+        assert interaction.transcript == "test"
+        assert scripted_assistant._barge_in_preroll is None
+
+    def test_speak_text_skipped_after_barge_in(self, scripted_assistant):
+        """Nothing is synthesized once a barge-in cancelled the turn."""
+        scripted_assistant._cancel.set()
+        with patch("voice_assistant.assistant.gTTS") as mock_gtts:
+            scripted_assistant.speak_text("Hello")
+        mock_gtts.assert_not_called()
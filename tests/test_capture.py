@@ -0,0 +1,155 @@
+"""Tests for choosing capture settings."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from voice_assistant import AssistantConfig, VoiceAssistant
+from voice_assistant.capture import (
+    CaptureSettings,
+    low_latency_chunk_size,
+    select_capture_settings,
+)
+
+PA_INT16 = 8
+
+
+def fake_pyaudio(devices, *, default=0, rates=(16000, 44100, 48000)):
+    """Build a ``pyaudio`` module double with the given device infos."""
+
+    class FakePyAudio:
+        def get_device_count(self):
+            return len(devices)
+
+        def get_device_info_by_index(self, index):
+            return devices[index]
+
+        def get_default_input_device_info(self):
+            if default is None:
+                raise OSError("No Default Input Device Available")
+            return devices[default]
+
+        def is_format_supported(
+            self, rate, input_device=None, input_channels=None, input_format=None
+        ):
+            assert input_format == PA_INT16
+            if rate not in rates:
+                raise ValueError("Invalid sample rate")
+            return True
+
+        def terminate(self):
+            return None
+
+    return SimpleNamespace(PyAudio=FakePyAudio, paInt16=PA_INT16)
+
+
+def device(index, *, inputs=1, latency=0.0087, rate=44100.0):
+    return {
+        "index": index,
+        "maxInputChannels": inputs,
+        "defaultLowInputLatency": latency,
+        "defaultSampleRate": rate,
+    }
+
+
+def test_low_latency_chunk_size():
+    """Test that chunks cover the latency in a power of two."""
+    assert low_latency_chunk_size(16000, 0.0087) == 256
+    assert low_latency_chunk_size(48000, 0.02) == 1024
+    assert low_latency_chunk_size(16000, 0.0) == 256  # never below 10 ms
+
+
+def test_capture_settings_latency():
+    """Test the buffering delay of a setting."""
+    settings = CaptureSettings(None, 16000, 1024)
+    assert settings.chunk_seconds == 0.064
+    assert "64.0 ms" in settings.describe()
+
+
+class TestSelectCaptureSettings:
+    """Tests for auto-selecting capture settings."""
+
+    def test_prefers_target_rate_and_small_chunks(self):
+        """Test the selection on the default device."""
+        settings = select_capture_settings(fake_pyaudio([device(0)]))
+        assert settings == CaptureSettings(0, 16000, 256)
+
+    def test_falls_back_to_supported_rate(self):
+        """Test a device that cannot capture at the target rate."""
+        pyaudio = fake_pyaudio([device(0)], rates=(48000,))
+        assert select_capture_settings(pyaudio).sample_rate == 48000
+
+    def test_no_supported_rate(self):
+        """Test that an unusable device is reported."""
+        with pytest.raises(ValueError, match="No supported sample rate"):
+            select_capture_settings(fake_pyaudio([device(0)], rates=()))
+
+    def test_picks_lowest_latency_input_without_default(self):
+        """Test multi-device hosts without a default input device."""
+        devices = [
+            device(0, inputs=0),
+            device(1, latency=0.05),
+            device(2, latency=0.01),
+        ]
+        settings = select_capture_settings(fake_pyaudio(devices, default=None))
+        assert settings.device_index == 2
+
+    def test_default_output_only_device_is_skipped(self):
+        """Test that a default device without inputs is not used."""
+        devices = [device(0, inputs=0), device(1)]
+        assert select_capture_settings(fake_pyaudio(devices)).device_index == 1
+
+    def test_no_input_device(self):
+        """Test hosts without any microphone."""
+        with pytest.raises(OSError):
+            select_capture_settings(fake_pyaudio([device(0, inputs=0)], default=None))
+
+    def test_explicit_settings_are_kept(self):
+        """Test that configured values are not overridden."""
+        settings = select_capture_settings(
+            fake_pyaudio([device(0), device(1)]),
+            device_index=1,
+            sample_rate=44100,
+            chunk_size=2048,
+        )
+        assert settings == CaptureSettings(1, 44100, 2048)
+
+
+class TestAssistantMicrophone:
+    """Tests for creating the microphone from the configuration."""
+
+    @patch("voice_assistant.assistant.sr.Microphone")
+    def test_configured_settings(self, mock_mic_class):
+        """Test that configured settings reach the microphone."""
+        assistant = VoiceAssistant(
+            api_key="sk-test",
+            config=AssistantConfig(device_index=3, chunk_size=512),
+        )
+        assistant._get_microphone()
+        mock_mic_class.assert_called_once_with(device_index=3, chunk_size=512)
+
+    @patch("voice_assistant.assistant.sr.Microphone")
+    def test_auto_capture(self, mock_mic_class):
+        """Test that auto-selected settings reach the microphone."""
+        mock_mic_class.get_pyaudio.return_value = fake_pyaudio([device(0)])
+        assistant = VoiceAssistant(
+            api_key="sk-test", config=AssistantConfig(auto_capture=True)
+        )
+        assistant._get_microphone()
+        mock_mic_class.assert_called_once_with(
+            device_index=0, sample_rate=16000, chunk_size=256
+        )
+
+    @patch("voice_assistant.assistant.sr.Microphone")
+    def test_auto_capture_without_pyaudio(self, mock_mic_class):
+        """Test that a failed selection falls back to the configured settings."""
+        mock_mic_class.get_pyaudio.side_effect = AttributeError("no PyAudio")
+        assistant = VoiceAssistant(
+            api_key="sk-test",
+            config=AssistantConfig(auto_capture=True, chunk_size=512),
+        )
+        assistant._get_microphone()
+        mock_mic_class.assert_called_once_with(chunk_size=512)
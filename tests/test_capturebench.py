@@ -0,0 +1,38 @@
+"""Tests for the capture latency benchmark."""
+
+from __future__ import annotations
+
+import pytest
+
+from voice_assistant.capture import CaptureSettings
+from voice_assistant.capturebench import benchmark_capture, format_benchmark, parse_args
+from voice_assistant.fakes import synthetic_speech
+
+
+def test_smaller_chunks_wait_less():
+    """Test that the measured delay follows the chunk duration."""
+    audio = synthetic_speech(seconds=0.6, lead=0.1, tail=0.3, seed=0)
+    small, large = benchmark_capture(
+        [CaptureSettings(None, 16000, 256), CaptureSettings(None, 16000, 2048)],
+        audio=audio,
+        pause_threshold=0.2,
+    )
+
+    assert small.reads > large.reads
+    assert small.mean_delay == pytest.approx(0.016, abs=0.01)
+    assert large.mean_delay == pytest.approx(0.128, abs=0.02)
+    assert small.max_delay < large.mean_delay
+
+    table = format_benchmark([small, large])
+    assert len(table.splitlines()) == 3
+    assert " 2048 " in table
+
+
+def test_parse_args():
+    """Test the benchmark's settings lists."""
+    args = parse_args(["--sample-rates", "16000", "--chunk-sizes", "256,1024"])
+    assert args.sample_rates == [16000]
+    assert args.chunk_sizes == [256, 1024]
+
+    with pytest.raises(SystemExit):
+        parse_args(["--chunk-sizes", "big"])
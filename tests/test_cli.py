@@ -25,6 +25,36 @@ class TestParseArgs:
         assert args.once is False
         assert args.log_level == "INFO"
         assert args.api_key is None
+        assert args.target_sample_rate == 16000
+        assert args.trim_silence is True
+        assert args.autotune is False
+        assert args.tuning_profile is None
+        assert args.warm_up is True
+        assert args.mixer_buffer_size == 512
+        assert args.record_session is None
+        assert args.device_index is None
+        assert args.capture_sample_rate is None
+        assert args.chunk_size is None
+        assert args.auto_capture is False
+        assert args.barge_in is False
+        assert args.barge_in_ratio == 3.0
+        assert args.barge_in_min_speech == 0.2
+        assert args.synthesis_workers == 4
+        assert args.faq_path is None
+        assert args.faq_threshold == 0.75
+        assert args.recognizers == ["google"]
+        assert args.recognition_confidence == 0.7
+        assert args.recognition_timeout == 3.0
+        assert args.speculative_prefetch is False
+        assert args.speculation_min_words == 3
+        assert args.fast_model is None
+        assert args.route_prompt_words == 25
+        assert args.degraded_latency == 5.0
+        assert args.requests_per_minute is None
+        assert args.tokens_per_minute is None
+        assert args.profile_dir is None
+        assert args.profile_interactions == 5
+        assert args.memory_diagnostics is False
 
     def test_parse_args_custom_keyword(self):
         """Test custom keyword argument."""
@@ -70,6 +100,142 @@ class TestParseArgs:
         args = parse_args(["--pause-threshold", "1.2"])
         assert args.pause_threshold == 1.2
 
+    def test_parse_args_audio_preprocessing(self):
+        """Test audio preprocessing arguments."""
+        args = parse_args(["--target-sample-rate", "8000", "--no-trim-silence"])
+        assert args.target_sample_rate == 8000
+        assert args.trim_silence is False
+
+        with pytest.raises(SystemExit):
+            parse_args(["--target-sample-rate", "0"])
+
+    def test_parse_args_autotune(self):
+        """Test auto-tuning arguments."""
+        args = parse_args(["--autotune", "--tuning-profile", "/tmp/profile.json"])
+        assert args.autotune is True
+        assert args.tuning_profile == "/tmp/profile.json"
+
+    def test_parse_args_warm_up(self):
+        """Test warm-up arguments."""
+        args = parse_args(["--no-warm-up", "--mixer-buffer-size", "256"])
+        assert args.warm_up is False
+        assert args.mixer_buffer_size == 256
+
+    def test_parse_args_record_session(self):
+        """Test session recording argument."""
+        args = parse_args(["--record-session", "session.jsonl"])
+        assert args.record_session == "session.jsonl"
+
+    def test_parse_args_barge_in(self):
+        """Test barge-in arguments."""
+        args = parse_args(
+            ["--barge-in", "--barge-in-ratio", "4", "--barge-in-min-speech", "0.3"]
+        )
+        assert args.barge_in is True
+        assert args.barge_in_ratio == 4.0
+        assert args.barge_in_min_speech == 0.3
+
+    def test_parse_args_synthesis_workers(self):
+        """Test synthesis worker argument."""
+        args = parse_args(["--synthesis-workers", "2"])
+        assert args.synthesis_workers == 2
+
+        with pytest.raises(SystemExit):
+            parse_args(["--synthesis-workers", "0"])
+
+    def test_parse_args_faq(self):
+        """Test FAQ arguments."""
+        args = parse_args(["--faq", "faq.json", "--faq-threshold", "0.8"])
+        assert args.faq_path == "faq.json"
+        assert args.faq_threshold == 0.8
+
+    def test_parse_args_capture_settings(self):
+        """Test capture device arguments."""
+        args = parse_args(
+            [
+                "--device-index",
+                "2",
+                "--capture-sample-rate",
+                "16000",
+                "--chunk-size",
+                "256",
+                "--auto-capture",
+            ]
+        )
+        assert args.device_index == 2
+        assert args.capture_sample_rate == 16000
+        assert args.chunk_size == 256
+        assert args.auto_capture is True
+
+    def test_parse_args_recognizers(self):
+        """Test racing recognizer arguments."""
+        args = parse_args(
+            [
+                "--recognizers",
+                "google, sphinx",
+                "--recognition-confidence",
+                "0.5",
+                "--recognition-timeout",
+                "1.5",
+            ]
+        )
+        assert args.recognizers == ["google", "sphinx"]
+        assert args.recognition_confidence == 0.5
+        assert args.recognition_timeout == 1.5
+
+    def test_parse_args_rejects_unknown_recognizer(self):
+        """Test that only built-in recognizers can be raced."""
+        with pytest.raises(SystemExit):
+            parse_args(["--recognizers", "google,carrier-pigeon"])
+        with pytest.raises(SystemExit):
+            parse_args(["--recognition-timeout", "0"])
+
+    def test_parse_args_speculative_prefetch(self):
+        """Test speculative prefetch arguments."""
+        args = parse_args(["--speculative-prefetch", "--speculation-min-words", "5"])
+        assert args.speculative_prefetch is True
+        assert args.speculation_min_words == 5
+
+    def test_parse_args_model_routing(self):
+        """Test model routing arguments."""
+        args = parse_args(
+            [
+                "--fast-model",
+                "gpt-4o-mini",
+                "--route-prompt-words",
+                "40",
+                "--degraded-latency",
+                "2.5",
+            ]
+        )
+        assert args.fast_model == "gpt-4o-mini"
+        assert args.route_prompt_words == 40
+        assert args.degraded_latency == 2.5
+
+    def test_parse_args_rate_limits(self):
+        """Test rate-limit budget arguments."""
+        args = parse_args(
+            ["--requests-per-minute", "500", "--tokens-per-minute", "90000"]
+        )
+        assert args.requests_per_minute == 500
+        assert args.tokens_per_minute == 90000
+
+    def test_parse_args_profile(self):
+        """Test profiling arguments."""
+        args = parse_args(["--profile", "profiles", "--profile-interactions", "3"])
+        assert args.profile_dir == "profiles"
+        assert args.profile_interactions == 3
+
+    def test_parse_args_rejects_no_profiled_interactions(self):
+        """Test that at least one interaction must be profiled."""
+        with pytest.raises(SystemExit):
+            parse_args(["--profile", "profiles", "--profile-interactions", "0"])
+
+    def test_parse_args_memory_diagnostics(self):
+        """Test memory diagnostics flag."""
+        args = parse_args(["--memory-diagnostics"])
+        assert args.memory_diagnostics is True
+
     def test_parse_args_once_flag(self):
         """Test once flag."""
         args = parse_args(["--once"])
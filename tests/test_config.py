@@ -15,6 +15,36 @@ def test_config_default_values():
     assert config.ambient_noise_duration == 0.5
     assert config.listen_timeout is None
     assert config.phrase_time_limit is None
+    assert config.target_sample_rate == 16000
+    assert config.trim_silence is True
+    assert config.silence_padding == 0.2
+    assert config.autotune is False
+    assert config.tuning_profile is None
+    assert config.warm_up is True
+    assert config.mixer_buffer_size == 512
+    assert config.record_session is None
+    assert config.device_index is None
+    assert config.capture_sample_rate is None
+    assert config.chunk_size is None
+    assert config.auto_capture is False
+    assert config.barge_in is False
+    assert config.barge_in_ratio == 3.0
+    assert config.barge_in_min_speech == 0.2
+    assert config.synthesis_workers == 4
+    assert config.faq_path is None
+    assert config.faq_threshold == 0.75
+    assert config.requests_per_minute is None
+    assert config.recognizers == ["google"]
+    assert config.recognition_confidence == 0.7
+    assert config.recognition_timeout == 3.0
+    assert config.speculative_prefetch is False
+    assert config.speculation_min_words == 3
+    assert config.fast_model is None
+    assert config.route_prompt_words == 25
+    assert config.degraded_latency == 5.0
+    assert config.tokens_per_minute is None
+    assert config.profile_dir is None
+    assert config.profile_interactions == 5
 
 
 def test_config_custom_values():
@@ -0,0 +1,166 @@
+"""Tests for the local FAQ answer index."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from voice_assistant import AssistantConfig, VoiceAssistant
+from voice_assistant.faq import FaqEntry, FaqIndex, char_ngrams, load_entries, normalize
+
+ENTRIES = [
+    FaqEntry(
+        ("What are your opening hours?", "When are you open?"),
+        "We are open from nine to five.",
+    ),
+    FaqEntry(("What is the Wi-Fi password?",), "It is on the card at the desk."),
+    FaqEntry(("How do I get to the train station?",), "Turn left at the exit."),
+]
+
+
+@pytest.fixture
+def faq_file(tmp_path):
+    """Write a FAQ file with one multi-phrasing and one single-question entry."""
+    path = tmp_path / "faq.json"
+    path.write_text(
+        json.dumps(
+            [
+                {
+                    "questions": ["What are your opening hours?", "When are you open?"],
+                    "answer": "We are open from nine to five.",
+                },
+                {"question": "Where is the toilet?", "answer": "Down the hall."},
+            ]
+        )
+    )
+    return path
+
+
+def test_normalize():
+    """Test that case, punctuation and spacing are ignored."""
+    assert normalize("  What's   the Wi-Fi?! ") == "what s the wi fi"
+
+
+def test_char_ngrams_mark_word_boundaries():
+    """Test n-gram extraction."""
+    assert char_ngrams("Hi", sizes=(3,)) == [" hi", "hi "]
+
+
+class TestFaqIndex:
+    """Tests for matching questions."""
+
+    def test_exact_question_scores_one(self):
+        """Test that a known question matches itself."""
+        match = FaqIndex(ENTRIES).lookup("what is the wifi password")
+        assert match.answer == "It is on the card at the desk."
+        assert match.score == pytest.approx(1.0, abs=0.2)
+
+    def test_alternative_phrasing_matches(self):
+        """Test that every phrasing of an entry leads to its answer."""
+        match = FaqIndex(ENTRIES).lookup("When are you open")
+        assert match.question == "When are you open?"
+        assert match.answer == "We are open from nine to five."
+
+    def test_unrelated_question_misses(self):
+        """Test that other questions are left to the language model."""
+        index = FaqIndex(ENTRIES)
+        assert index.lookup("What is the capital of France?") is None
+        assert index.best_match("What is the capital of France?").score < 0.5
+
+    def test_threshold(self):
+        """Test that the threshold decides what counts as a hit."""
+        query = "how do I get to the station"
+        score = FaqIndex(ENTRIES).best_match(query).score
+        assert FaqIndex(ENTRIES, threshold=score - 0.01).lookup(query) is not None
+        assert FaqIndex(ENTRIES, threshold=score + 0.01).lookup(query) is None
+
+    def test_empty_index(self):
+        """Test that an empty FAQ never matches."""
+        assert FaqIndex([]).lookup("anything") is None
+        assert len(FaqIndex([])) == 0
+
+
+class TestLoadEntries:
+    """Tests for reading FAQ files."""
+
+    def test_load(self, faq_file):
+        """Test both the single and multiple question forms."""
+        entries = load_entries(faq_file)
+        assert entries[0].questions == (
+            "What are your opening hours?",
+            "When are you open?",
+        )
+        assert entries[1] == FaqEntry(("Where is the toilet?",), "Down the hall.")
+        assert len(FaqIndex.load(faq_file)) == 3
+
+    def test_rejects_missing_answer(self, tmp_path):
+        """Test validation of entries."""
+        path = tmp_path / "faq.json"
+        path.write_text(json.dumps([{"question": "Hello?"}]))
+        with pytest.raises(ValueError, match="needs a question and an answer"):
+            load_entries(path)
+
+    @pytest.mark.parametrize(
+        "item",
+        [
+            {"questions": "When are you open?", "answer": "Nine to five."},
+            {"question": ["When are you open?"], "answer": "Nine to five."},
+            {"questions": ["When are you open?", 9], "answer": "Nine to five."},
+            "When are you open?",
+        ],
+    )
+    def test_rejects_malformed_questions(self, tmp_path, item):
+        """Test that questions must be strings, and a string is not a list."""
+        path = tmp_path / "faq.json"
+        path.write_text(json.dumps([item]))
+        with pytest.raises(ValueError, match="When are you open"):
+            load_entries(path)
+
+    def test_rejects_non_list(self, tmp_path):
+        """Test validation of the top-level structure."""
+        path = tmp_path / "faq.json"
+        path.write_text(json.dumps({"question": "Hello?", "answer": "Hi"}))
+        with pytest.raises(ValueError, match="must contain a list"):
+            load_entries(path)
+
+
+class TestAssistantFaq:
+    """Tests for answering from the FAQ in the assistant."""
+
+    def test_known_question_skips_openai(self, mock_openai_client, faq_file):
+        """Test that a FAQ hit is answered without a chat completion."""
+        assistant = VoiceAssistant(
+            api_key="sk-test", config=AssistantConfig(faq_path=str(faq_file))
+        )
+        assistant.client = mock_openai_client
+
+        assert assistant.generate_response("When are you open?") == (
+            "We are open from nine to five."
+        )
+        mock_openai_client.chat.completions.create.assert_not_called()
+        assert assistant.metrics.count("faq_hits") == 1
+        assert assistant.metrics.summary("faq_build").count == 1
+        assert assistant.metrics.summary("faq").count == 1
+
+    def test_unknown_question_goes_to_openai(self, mock_openai_client, faq_file):
+        """Test that a FAQ miss falls through to the model."""
+        assistant = VoiceAssistant(
+            api_key="sk-test", config=AssistantConfig(faq_path=str(faq_file))
+        )
+        assistant.client = mock_openai_client
+
+        assert (
+            assistant.generate_response("Tell me a joke") == "This is a test response"
+        )
+        mock_openai_client.chat.completions.create.assert_called_once()
+        assert assistant.metrics.count("faq_misses") == 1
+
+    def test_unreadable_faq_is_ignored(self, tmp_path):
+        """Test that a broken FAQ file does not stop the assistant."""
+        path = tmp_path / "faq.json"
+        path.write_text("not json")
+        assistant = VoiceAssistant(
+            api_key="sk-test", config=AssistantConfig(faq_path=str(path))
+        )
+        assert assistant.faq is None
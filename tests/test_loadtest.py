@@ -0,0 +1,125 @@
+"""Tests for the load generator."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from voice_assistant.loadtest import (
+    LevelReport,
+    StubbedAssistant,
+    format_reports,
+    main,
+    parse_args,
+    run_level,
+    run_worker,
+)
+from voice_assistant.stubs import LatencyDistribution
+
+
+def test_stubbed_assistant_completes_interaction(endpoints):
+    """Test a full interaction through the real clients and stub services."""
+    interaction = StubbedAssistant(endpoints, seed=0).interact()
+
+    assert interaction.error is None
+    assert interaction.transcript == "What time is it?"
+    assert interaction.response == "It is twelve o'clock."
+    assert {"recognition", "generation", "synthesis"} <= set(interaction.timings)
+
+
+def test_worker_cpu_excludes_stub_services(endpoints):
+    """Test that a worker's CPU time is its own thread's, not the process's."""
+    process_start = time.process_time()
+
+    result = run_worker(endpoints, time.time() + 0.2, seed=0)
+
+    assert result.latencies
+    assert 0 < result.cpu_seconds < time.process_time() - process_start
+
+
+def test_run_level_threads(endpoints):
+    """Test that a concurrency level produces a report."""
+    report = run_level(endpoints, 2, duration=0.3)
+
+    assert report.concurrency == 2
+    assert report.interactions >= 2
+    assert report.errors == 0
+    assert report.throughput > 0
+    assert report.p50 <= report.p95 <= report.p99
+    assert report.peak_threads >= 3
+
+
+def test_run_level_pool(endpoints):
+    """Test that the worker pool mode produces a report."""
+    report = run_level(endpoints, 2, duration=0.5, mode="pool")
+
+    assert report.concurrency == 2
+    assert report.interactions >= 2
+    assert report.errors == 0
+    assert report.p50 <= report.p95 <= report.p99
+
+
+def test_run_level_rejects_unknown_mode(endpoints):
+    """Test worker mode validation."""
+    with pytest.raises(ValueError, match="Unknown worker mode"):
+        run_level(endpoints, 1, duration=0.1, mode="fiber")
+
+
+def test_format_reports():
+    """Test the report table."""
+    report = LevelReport(
+        concurrency=4,
+        interactions=40,
+        errors=1,
+        duration=10.0,
+        p50=0.5,
+        p95=0.9,
+        p99=1.2,
+        cpu_percent=35.0,
+        peak_threads=9,
+        peak_open_files=None,
+    )
+
+    row = format_reports([report]).splitlines()[1].split()
+
+    assert row == ["4", "40", "1", "4.00", "0.500", "0.900", "1.200", "35.0", "9", "-"]
+
+
+def test_parse_args():
+    """Test load generator arguments."""
+    args = parse_args(
+        ["--levels", "1,3", "--mode", "process", "--llm-latency", "fixed:0"]
+    )
+
+    assert args.levels == [1, 3]
+    assert args.mode == "process"
+    assert args.llm_latency == LatencyDistribution("fixed", 0.0)
+
+    with pytest.raises(SystemExit):
+        parse_args(["--levels", "one"])
+
+
+def test_main_prints_levels(capsys):
+    """Test the command-line entry point."""
+    assert (
+        main(
+            [
+                "--levels",
+                "1",
+                "--duration",
+                "0.2",
+                "--llm-latency",
+                "fixed:0",
+                "--stt-latency",
+                "fixed:0",
+                "--tts-latency",
+                "fixed:0",
+            ]
+        )
+        == 0
+    )
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].split()[0] == "workers"
+    assert lines[1].split()[0] == "1"
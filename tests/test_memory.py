@@ -0,0 +1,65 @@
+"""Tests for memory measurements and reports."""
+
+from __future__ import annotations
+
+import logging
+import os
+import signal
+import tracemalloc
+
+import pytest
+
+from voice_assistant.memory import (
+    install_memory_dump,
+    memory_report,
+    rss_bytes,
+    top_allocations,
+)
+
+
+def test_rss_bytes():
+    """Test that RSS is reported where /proc exists."""
+    rss = rss_bytes()
+    if os.path.exists("/proc/self/statm"):
+        assert rss > 0
+    else:
+        assert rss is None
+
+
+def test_top_allocations_ranks_growth():
+    """Test that the site that allocated since the baseline is reported first."""
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.take_snapshot()
+        retained = [bytearray(1024) for _ in range(100)]
+        sites = top_allocations(tracemalloc.take_snapshot(), baseline, limit=3)
+    finally:
+        tracemalloc.stop()
+
+    assert len(retained) == 100
+    assert "test_memory.py" in sites[0]
+    assert sites[0].startswith("+")
+
+
+def test_memory_report_without_tracing():
+    """Test the report when tracemalloc is off."""
+    assert not tracemalloc.is_tracing()
+    report = memory_report()
+    assert report.startswith("RSS:")
+    assert "not tracing" in report
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGUSR1"), reason="needs SIGUSR1")
+def test_install_memory_dump_logs_on_signal(caplog):
+    """Test that the signal handler logs a memory report."""
+    previous = signal.getsignal(signal.SIGUSR1)
+    try:
+        assert install_memory_dump(limit=2)
+        with caplog.at_level(logging.WARNING, logger="voice_assistant.memory"):
+            os.kill(os.getpid(), signal.SIGUSR1)
+    finally:
+        signal.signal(signal.SIGUSR1, previous)
+        tracemalloc.stop()
+
+    assert "Memory report" in caplog.text
+    assert "Traced:" in caplog.text
@@ -0,0 +1,76 @@
+"""Tests for metrics collection."""
+
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+from voice_assistant.metrics import Metrics, percentile
+
+
+def test_percentile_interpolates():
+    """Test percentile interpolation."""
+    assert percentile([1, 2, 3, 4], 0.5) == 2.5
+    assert percentile([5], 0.95) == 5
+    assert percentile([3, 1, 2], 1.0) == 3
+
+
+def test_percentile_rejects_bad_input():
+    """Test percentile argument validation."""
+    with pytest.raises(ValueError):
+        percentile([], 0.5)
+
+    with pytest.raises(ValueError):
+        percentile([1], 1.5)
+
+
+def test_record_and_summary():
+    """Test that samples are summarized."""
+    metrics = Metrics()
+    for value in (1.0, 2.0, 3.0):
+        metrics.record("latency", value)
+
+    summary = metrics.summary("latency")
+
+    assert summary.count == 3
+    assert summary.mean == 2.0
+    assert summary.maximum == 3.0
+    assert metrics.summary("missing") is None
+
+
+def test_window_bounds_samples():
+    """Test that only the most recent samples are kept."""
+    metrics = Metrics(window=2)
+    for value in (1.0, 2.0, 3.0):
+        metrics.record("latency", value)
+
+    assert metrics.samples("latency") == [2.0, 3.0]
+
+
+def test_time_records_duration():
+    """Test the timing context manager."""
+    metrics = Metrics()
+
+    with metrics.time("stage"):
+        pass
+
+    assert len(metrics.samples("stage")) == 1
+    assert metrics.samples("stage")[0] >= 0
+
+
+def test_counters_and_report(caplog):
+    """Test counters and the logged report."""
+    metrics = Metrics()
+    metrics.increment("hits")
+    metrics.increment("hits", 2)
+    metrics.record("latency", 0.5)
+
+    with caplog.at_level(logging.INFO):
+        metrics.log_report()
+
+    assert metrics.count("hits") == 3
+    assert metrics.counters() == {"hits": 3}
+    assert set(metrics.report()) == {"latency"}
+    assert "hits: 3" in caplog.text
+    assert "latency: n=1" in caplog.text
@@ -0,0 +1,114 @@
+"""Tests for per-stage profiling."""
+
+from __future__ import annotations
+
+import pstats
+
+import pytest
+
+from voice_assistant.profiling import COMBINED_FILE, StageProfiler, collapsed_stacks
+from voice_assistant.soak import SoakAssistant
+
+
+def inner(n: int) -> int:
+    return sum(i * i for i in range(n))
+
+
+def outer() -> int:
+    return inner(20000) + inner(20000)
+
+
+def profile_stage(profiler: StageProfiler, name: str) -> None:
+    profile = profiler.start()
+    try:
+        outer()
+    finally:
+        profiler.stop(name, profile)
+
+
+class TestStageProfiler:
+    """Tests for collecting and writing stage profiles."""
+
+    def test_runs_of_a_stage_are_merged(self):
+        """Test that every run of a stage ends up in one profile."""
+        profiler = StageProfiler("unused")
+        profile_stage(profiler, "generation")
+        profile_stage(profiler, "generation")
+
+        stats = profiler.stats["generation"].stats
+        calls = {key[2]: value[1] for key, value in stats.items()}
+        assert calls["outer"] == 2
+        assert calls["inner"] == 4
+
+    def test_nested_stage_goes_to_outer_stage(self):
+        """Test that a thread is profiled by one stage at a time."""
+        profiler = StageProfiler("unused")
+        outer_profile = profiler.start()
+        assert profiler.start() is None
+        profiler.stop("inner", None)
+        profiler.stop("outer", outer_profile)
+
+        assert set(profiler.stats) == {"outer"}
+        profile = profiler.start()
+        assert profile is not None
+        profiler.stop("outer", profile)
+
+    def test_interaction_limit(self):
+        """Test that profiling ends after the configured interactions."""
+        profiler = StageProfiler("unused", interactions=2)
+        assert not profiler.interaction_finished()
+        assert profiler.interaction_finished()
+
+    def test_write(self, tmp_path):
+        """Test the pstats and collapsed-stack files."""
+        profiler = StageProfiler(tmp_path / "profiles")
+        profile_stage(profiler, "recognition")
+
+        written = profiler.write()
+
+        directory = tmp_path / "profiles"
+        assert set(written) == {
+            directory / "recognition.pstats",
+            directory / "recognition.folded",
+            directory / COMBINED_FILE,
+        }
+        loaded = pstats.Stats(str(directory / "recognition.pstats"))
+        assert any(key[2] == "outer" for key in loaded.stats)
+        combined = (directory / COMBINED_FILE).read_text().splitlines()
+        assert combined
+        assert all(line.startswith("recognition;") for line in combined)
+
+
+def test_collapsed_stacks_follow_calls():
+    """Test that callee time appears under its caller's frame."""
+    profiler = StageProfiler("unused")
+    profile_stage(profiler, "stage")
+
+    lines = collapsed_stacks(profiler.stats["stage"], root="stage")
+
+    stacks = {line.rsplit(" ", 1)[0]: int(line.rsplit(" ", 1)[1]) for line in lines}
+    inner_stacks = [stack for stack in stacks if "inner (test_profiling.py" in stack]
+    assert inner_stacks
+    assert all(stack.startswith("stage;") for stack in inner_stacks)
+    assert all("outer (test_profiling.py" in stack for stack in inner_stacks)
+    assert all(count > 0 for count in stacks.values())
+
+
+@pytest.mark.parametrize("interactions", [1, 2])
+def test_assistant_writes_profiles_after_interactions(
+    tmp_path, monkeypatch, interactions
+):
+    """Test that an assistant profiles its stages and then stops profiling."""
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    assistant = SoakAssistant(speech_seconds=0.01, seed=0)
+    assistant.profiler = StageProfiler(tmp_path, interactions=interactions)
+
+    for _ in range(interactions - 1):
+        assistant.interact()
+        assert assistant.profiler is not None
+    assistant.interact()
+
+    assert assistant.profiler is None
+    for stage in ("capture", "recognition", "generation", "synthesis", "tts"):
+        assert (tmp_path / f"{stage}.pstats").exists()
+    assert (tmp_path / COMBINED_FILE).read_text()
@@ -0,0 +1,219 @@
+"""Tests for racing speech recognizers."""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import speech_recognition as sr
+
+from voice_assistant import AssistantConfig, VoiceAssistant
+from voice_assistant.fakes import FakeRecognitionBackend, fixed_delay
+from voice_assistant.recognition import RecognizerRace, create_backends
+from voice_assistant.scheduler import RateLimitScheduler
+
+AUDIO = sr.AudioData(b"\x00\x00" * 160, 16000, 2)
+
+
+def race(**backends: FakeRecognitionBackend) -> RecognizerRace:
+    return RecognizerRace(backends, min_confidence=0.7)
+
+
+class TestRecognizerRace:
+    """Tests for picking the winning transcript."""
+
+    def test_first_confident_result_wins(self):
+        """Test that a slow backend does not hold up a fast confident one."""
+        release = threading.Event()
+        finished = []
+
+        def held_until_released() -> float:
+            release.wait(5)
+            finished.append("local")
+            return 0.0
+
+        recognizers = race(
+            cloud=FakeRecognitionBackend("hello", 0.9, delay=fixed_delay(0.01)),
+            local=FakeRecognitionBackend("hullo", 0.8, delay=held_until_released),
+        )
+
+        transcript = recognizers.recognize(AUDIO)
+        assert finished == []
+        release.set()
+
+        assert (transcript.text, transcript.backend) == ("hello", "cloud")
+        assert recognizers.metrics.count("recognition_wins_cloud") == 1
+        assert recognizers.metrics.summary("recognition_cloud").count == 1
+
+    def test_unsure_result_waits_for_confident_one(self):
+        """Test that a fast low-confidence result does not win outright."""
+        recognizers = race(
+            fast=FakeRecognitionBackend("hell oh", 0.3),
+            slow=FakeRecognitionBackend("hello", 0.95, delay=fixed_delay(0.05)),
+        )
+        assert recognizers.recognize(AUDIO).backend == "slow"
+
+    def test_most_confident_result_when_none_is_confident(self):
+        """Test the fallback once every backend has answered."""
+        recognizers = race(
+            a=FakeRecognitionBackend("hell oh", 0.3),
+            b=FakeRecognitionBackend("hello", 0.6, delay=fixed_delay(0.02)),
+        )
+        transcript = recognizers.recognize(AUDIO)
+        assert (transcript.text, transcript.confidence) == ("hello", 0.6)
+
+    def test_result_without_confidence_is_a_last_resort(self):
+        """Test that an engine without confidence does not beat the threshold."""
+        recognizers = race(
+            local=FakeRecognitionBackend("hullo"),
+            cloud=FakeRecognitionBackend("hello", 0.9, delay=fixed_delay(0.02)),
+        )
+        assert recognizers.recognize(AUDIO).backend == "cloud"
+
+        recognizers = race(
+            local=FakeRecognitionBackend("hullo"),
+            cloud=FakeRecognitionBackend("hello", 0.4, delay=fixed_delay(0.02)),
+        )
+        assert recognizers.recognize(AUDIO).backend == "cloud"
+
+        recognizers = race(local=FakeRecognitionBackend("hello"))
+        assert recognizers.recognize(AUDIO).text == "hello"
+
+    def test_failed_backend_is_ignored(self):
+        """Test that one service outage does not fail recognition."""
+        recognizers = race(
+            cloud=FakeRecognitionBackend(None, error=sr.RequestError("offline")),
+            local=FakeRecognitionBackend("hello", delay=fixed_delay(0.02)),
+        )
+        assert recognizers.recognize(AUDIO).backend == "local"
+        assert recognizers.metrics.count("recognition_failures_cloud") == 1
+
+    def test_all_failed_raises_request_error(self):
+        """Test that errors surface like recognize_google's."""
+        recognizers = race(
+            a=FakeRecognitionBackend(None, error=sr.RequestError("offline")),
+            b=FakeRecognitionBackend(None, error=OSError("no model")),
+        )
+        with pytest.raises(sr.RequestError, match="offline"):
+            recognizers.recognize(AUDIO)
+
+    def test_unintelligible(self):
+        """Test that unintelligible speech raises UnknownValueError."""
+        recognizers = race(
+            a=FakeRecognitionBackend(None),
+            b=FakeRecognitionBackend(None, error=sr.RequestError("offline")),
+        )
+        with pytest.raises(sr.UnknownValueError):
+            recognizers.recognize(AUDIO)
+
+    def test_timeout(self):
+        """Test that a hung backend is abandoned."""
+        recognizers = RecognizerRace(
+            {"hung": FakeRecognitionBackend("hello", delay=fixed_delay(0.5))},
+            timeout=0.05,
+        )
+        with pytest.raises(sr.RequestError, match="hung timed out"):
+            recognizers.recognize(AUDIO)
+
+    def test_deadline_settles_for_best_result(self):
+        """Test that a slow confident backend loses to the deadline."""
+        release = threading.Event()
+        recognizers = RecognizerRace(
+            {
+                "cloud": FakeRecognitionBackend(
+                    "hello", 0.95, delay=lambda: release.wait(5) and 0.0
+                ),
+                "local": FakeRecognitionBackend("hullo"),
+            },
+            timeout=0.05,
+        )
+
+        transcript = recognizers.recognize(AUDIO)
+        release.set()
+
+        assert (transcript.text, transcript.backend) == ("hullo", "local")
+
+    def test_requires_backends(self):
+        """Test that a race needs at least one backend."""
+        with pytest.raises(ValueError):
+            RecognizerRace({})
+
+
+def test_create_backends():
+    """Test the built-in backends around a recognizer."""
+    recognizer = MagicMock(spec=sr.Recognizer)
+    recognizer.recognize_google.return_value = ("hello", 0.9)
+    recognizer.recognize_sphinx.return_value = "hello"
+    recognizer.recognize_whisper.return_value = {
+        "text": " hello",
+        "segments": [{"avg_logprob": -0.1}, {"avg_logprob": -0.3}],
+    }
+
+    backends = create_backends(recognizer, ["google", "sphinx", "whisper"])
+
+    assert backends["google"](AUDIO) == ("hello", 0.9)
+    recognizer.recognize_google.assert_called_once_with(AUDIO, with_confidence=True)
+    assert backends["sphinx"](AUDIO) == ("hello", None)
+    assert backends["whisper"](AUDIO) == ("hello", pytest.approx(math.exp(-0.2)))
+    recognizer.recognize_whisper.assert_called_once_with(AUDIO, show_dict=True)
+    with pytest.raises(ValueError, match="carrier-pigeon"):
+        create_backends(recognizer, ["carrier-pigeon"])
+
+
+class TestAssistantRecognizerRace:
+    """Tests for racing recognizers in the assistant."""
+
+    def test_race_transcribes(self, mock_recognizer):
+        """Test that configured recognizers race and the winner is used."""
+
+        def slow_sphinx(audio):
+            time.sleep(0.2)
+            return "hullo"
+
+        mock_recognizer.recognize_google.return_value = ("hello", 0.9)
+        mock_recognizer.recognize_sphinx.side_effect = slow_sphinx
+        assistant = VoiceAssistant(
+            api_key="sk-test",
+            config=AssistantConfig(recognizers=["google", "sphinx"]),
+            recognizer=mock_recognizer,
+        )
+
+        assert assistant._recognize_speech(AUDIO) == "hello"
+        assert assistant.metrics.count("recognition_wins_google") == 1
+
+    def test_run_closes_thread_pools(self, mock_recognizer):
+        """Test that leaving the loop shuts down the race and prefetch pools."""
+        shared = RateLimitScheduler()
+        assistant = VoiceAssistant(
+            api_key="sk-test",
+            config=AssistantConfig(
+                recognizers=["google", "sphinx"],
+                speculative_prefetch=True,
+                warm_up=False,
+            ),
+            recognizer=mock_recognizer,
+            scheduler=shared,
+        )
+
+        with patch.object(assistant, "_await_keyword", side_effect=KeyboardInterrupt):
+            assistant.run()
+
+        with pytest.raises(RuntimeError):
+            assistant.recognizer_race._pool.submit(lambda: None)
+        with pytest.raises(RuntimeError):
+            assistant.prefetcher._pool.submit(lambda: None)
+        # A scheduler passed in may serve other assistants and stays open.
+        assert shared.submit(lambda: "ok") == "ok"
+
+    def test_close_closes_own_scheduler(self, voice_assistant):
+        """Test that the scheduler the assistant created is closed with it."""
+        voice_assistant.close()
+        with pytest.raises(RuntimeError):
+            voice_assistant.scheduler.submit(lambda: None)
+
+    def test_single_google_recognizer_is_not_raced(self, voice_assistant):
+        """Test that the default configuration calls recognize_google directly."""
+        assert voice_assistant.recognizer_race is None
@@ -0,0 +1,98 @@
+"""Tests for session replay."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import call, patch
+
+from voice_assistant.fakes import fixed_delay, synthetic_speech
+from voice_assistant.replay import (
+    ReplayAssistant,
+    format_comparison,
+    main,
+    prompt_changes,
+    stage_means,
+)
+from voice_assistant.session import Interaction, SessionRecorder, load_session
+
+
+def recorded_interaction(**timings: float) -> Interaction:
+    """Create a recorded interaction with the given stage timings."""
+    return Interaction(
+        timestamp=time.time(),
+        transcript="What time is it?",
+        response="It is noon.",
+        audio=synthetic_speech(seconds=0.3, seed=2),
+        timings=timings,
+    )
+
+
+def test_replay_reproduces_recorded_latency():
+    """Test that recorded service delays are replayed at the given speed."""
+    recorded = [recorded_interaction(generation=0.4, playback=0.2)]
+    assistant = ReplayAssistant(speed=4.0)
+
+    with patch("voice_assistant.replay.fixed_delay", wraps=fixed_delay) as delays:
+        (replayed,) = assistant.replay(recorded)
+
+    assert replayed.transcript == "What time is it?"
+    assert replayed.response == "It is noon."
+    assert call(0.1) in delays.call_args_list
+    assert assistant._speak_timings["playback"] == 0.05
+    assert replayed.timings["generation"] >= 0.1
+    assert replayed.timings["playback"] >= 0.05
+    assert "preprocess" in replayed.timings
+
+
+def test_replay_without_delays_skips_audio_less_interactions():
+    """Test accelerated replay and skipping failed captures."""
+    recorded = [
+        recorded_interaction(generation=5.0),
+        Interaction(timestamp=0.0, error="Timed out"),
+    ]
+    start = time.perf_counter()
+
+    replayed = ReplayAssistant(speed=None).replay(recorded)
+
+    assert len(replayed) == 1
+    assert time.perf_counter() - start < 1.0
+
+
+def test_stage_means_and_comparison():
+    """Test the latency comparison table."""
+    baseline = stage_means(
+        [Interaction(0, timings={"a": 1.0}), Interaction(0, timings={"a": 3.0})]
+    )
+    candidate = {"a": 1.5, "b": 0.5}
+
+    table = format_comparison(baseline, candidate)
+
+    assert baseline == {"a": 2.0}
+    assert "-0.5000" in table
+    assert table.splitlines()[2].startswith("b")
+
+
+def test_prompt_changes():
+    """Test that a different model or prompt is reported."""
+    recorded = recorded_interaction()
+    recorded.model = "gpt-4o"
+    recorded.messages = [{"role": "user", "content": "What time is it?"}]
+    (replayed,) = ReplayAssistant(speed=None).replay([recorded])
+
+    changes = prompt_changes([Interaction(timestamp=0.0), recorded], [replayed])
+
+    assert replayed.model == "gpt-3.5-turbo"
+    assert changes == ["1: model gpt-4o -> gpt-3.5-turbo", "1: messages changed"]
+    assert prompt_changes([replayed], [replayed]) == []
+
+
+def test_main_replays_session(tmp_path, capsys):
+    """Test the command-line replay tool."""
+    session = tmp_path / "session.jsonl"
+    output = tmp_path / "replayed.jsonl"
+    SessionRecorder(session).record(recorded_interaction(generation=0.01))
+
+    assert main([str(session), "--speed", "0", "--output", str(output)]) == 0
+
+    assert "Replayed 1 of 1 interactions" in capsys.readouterr().out
+    assert len(list(load_session(output))) == 1
@@ -0,0 +1,166 @@
+"""Tests for routing prompts between models."""
+
+from __future__ import annotations
+
+import httpx
+import openai
+import pytest
+
+from voice_assistant import AssistantConfig, VoiceAssistant
+from voice_assistant.fakes import FakeOpenAIClient
+from voice_assistant.routing import FAST, STRONG, ModelRouter, classify_prompt
+
+
+@pytest.mark.parametrize(
+    ("prompt", "tier"),
+    [
+        ("What's two plus two?", FAST),
+        ("What time is it", FAST),
+        ("Explain how a rainbow forms", STRONG),
+        ("Why is the sky blue?", STRONG),
+        ("Is it raining? Should I take an umbrella?", STRONG),
+        (" ".join(["word"] * 30), STRONG),
+    ],
+)
+def test_classify_prompt(prompt, tier):
+    """Test the routing heuristics."""
+    assert classify_prompt(prompt)[0] == tier
+
+
+class TestModelRouter:
+    """Tests for model choice and degradation."""
+
+    def test_routes_by_tier(self):
+        """Test that each tier goes to its model."""
+        router = ModelRouter("small", "large")
+        assert router.route("What time is it?").model == "small"
+        route = router.route("Compare Python and Rust")
+        assert (route.model, route.tier) == ("large", STRONG)
+        assert route.reason == "keyword 'compare'"
+
+    def test_slow_model_is_avoided_until_cooldown(self, clock):
+        """Test fallback on a degraded model and recovery after the cooldown."""
+        router = ModelRouter(
+            "small", "large", degraded_latency=1.0, cooldown=30.0, clock=clock
+        )
+        router.observe("small", 0.5)
+        assert not router.is_degraded("small")
+        router.observe("small", 10.0)
+
+        route = router.route("What time is it?")
+        assert route.model == "large"
+        assert route.reason == "small degraded"
+
+        clock.now = 31.0
+        assert router.route("What time is it?").model == "small"
+        assert "small" not in router.latency
+
+    def test_latency_is_smoothed(self):
+        """Test that a single slow request does not degrade a model."""
+        router = ModelRouter("small", "large", degraded_latency=1.0)
+        router.observe("large", 0.5)
+        router.observe("large", 2.0)
+        assert router.latency["large"] == pytest.approx(0.95)
+        assert not router.is_degraded("large")
+
+    def test_fallback(self):
+        """Test that a failed model is retried on the other, but only once."""
+        router = ModelRouter("small", "large")
+        route = router.route("What time is it?")
+        router.failed("small")
+
+        fallback = router.fallback(route)
+        assert fallback.model == "large"
+        assert router.fallback(fallback) is None
+
+    def test_all_degraded_keeps_preferred_model(self):
+        """Test that a prompt still gets a model when both are degraded."""
+        router = ModelRouter("small", "large")
+        router.failed("small")
+        router.failed("large")
+        assert router.route("What time is it?").model == "small"
+
+
+class TestAssistantRouting:
+    """Tests for routing in the assistant."""
+
+    @pytest.fixture
+    def assistant(self, mock_openai_client):
+        assistant = VoiceAssistant(
+            api_key="sk-test",
+            config=AssistantConfig(model="gpt-4o", fast_model="gpt-4o-mini"),
+        )
+        assistant.client = mock_openai_client
+        return assistant
+
+    def test_questions_are_routed(self, assistant, mock_openai_client):
+        """Test that simple and complex questions use different models."""
+        assistant.generate_response("What time is it?")
+        assistant.generate_response("Explain quantum computing")
+
+        models = [
+            call.kwargs["model"]
+            for call in mock_openai_client.chat.completions.create.call_args_list
+        ]
+        assert models == ["gpt-4o-mini", "gpt-4o"]
+        assert assistant.metrics.count("route_fast") == 1
+        assert assistant.metrics.count("route_strong") == 1
+        assert assistant.metrics.summary("generation_fast").count == 1
+        assert set(assistant.router.latency) == {"gpt-4o-mini", "gpt-4o"}
+
+    def test_failed_model_falls_back(self, assistant, mock_openai_client):
+        """Test that an API error is retried on the other model."""
+        create = mock_openai_client.chat.completions.create
+        error = openai.APIConnectionError(
+            request=httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+        )
+        create.side_effect = [error, create.return_value]
+
+        assert assistant.generate_response("What time is it?") == (
+            "This is a test response"
+        )
+        assert [call.kwargs["model"] for call in create.call_args_list] == [
+            "gpt-4o-mini",
+            "gpt-4o",
+        ]
+        assert assistant.metrics.count("route_fallbacks") == 1
+        assert assistant.router.is_degraded("gpt-4o-mini")
+
+    def test_rejected_request_does_not_fall_back(self, assistant, mock_openai_client):
+        """Test that a bad request is raised without degrading the model."""
+        request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+        create = mock_openai_client.chat.completions.create
+        create.side_effect = openai.BadRequestError(
+            "Prompt too long",
+            response=httpx.Response(400, request=request),
+            body=None,
+        )
+
+        with pytest.raises(openai.BadRequestError):
+            assistant.generate_response("What time is it?")
+
+        create.assert_called_once()
+        assert assistant.metrics.count("route_fallbacks") == 0
+        assert not assistant.router.is_degraded("gpt-4o-mini")
+
+    def test_streamed_latency_covers_whole_response(self, assistant):
+        """Test that a streamed completion is timed until its last chunk."""
+        assistant.config.barge_in = True
+        assistant.client = FakeOpenAIClient(
+            ["one two three four five"], chunk_delay=0.02
+        )
+
+        assert assistant.generate_response("What time is it?") == (
+            "one two three four five"
+        )
+        assert assistant.metrics.summary("generation_fast").maximum >= 0.1
+        assert assistant.router.latency["gpt-4o-mini"] >= 0.1
+
+    def test_routing_disabled_by_default(self, voice_assistant, mock_openai_client):
+        """Test that without a fast model every question uses the configured model."""
+        voice_assistant.client = mock_openai_client
+        voice_assistant.generate_response("What time is it?")
+
+        assert voice_assistant.router is None
+        call_kwargs = mock_openai_client.chat.completions.create.call_args.kwargs
+        assert call_kwargs["model"] == "gpt-3.5-turbo"
@@ -0,0 +1,232 @@
+"""Tests for the rate-limit-aware request scheduler."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import httpx
+import openai
+import pytest
+
+from voice_assistant import AssistantConfig, VoiceAssistant
+from voice_assistant.loadtest import ServiceEndpoints, StubbedAssistant
+from voice_assistant.scheduler import (
+    BATCH,
+    INTERACTIVE,
+    RateLimitScheduler,
+    TokenBucket,
+    estimate_tokens,
+    parse_duration,
+    retry_after,
+)
+from voice_assistant.stubs import StubServices
+
+
+def rate_limit_error(headers: dict[str, str]) -> openai.RateLimitError:
+    """Build the error the OpenAI client raises for a 429 response."""
+    request = httpx.Request("POST", "http://localhost/v1/chat/completions")
+    response = httpx.Response(429, headers=headers, request=request)
+    return openai.RateLimitError("Rate limit reached", response=response, body=None)
+
+
+@pytest.mark.parametrize(
+    ("value", "seconds"),
+    [("6m0s", 360.0), ("1.5s", 1.5), ("20ms", 0.02), ("1h2m", 3720.0), ("soon", None)],
+)
+def test_parse_duration(value, seconds):
+    """Test OpenAI reset durations."""
+    assert parse_duration(value) == (pytest.approx(seconds) if seconds else None)
+
+
+def test_retry_after_prefers_milliseconds():
+    """Test both retry headers and invalid values."""
+    assert retry_after({"retry-after-ms": "250", "retry-after": "3"}) == 0.25
+    assert retry_after({"retry-after": "3"}) == 3.0
+    assert retry_after({"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"}) is None
+
+
+def test_estimate_tokens():
+    """Test that prompt characters and the completion budget both count."""
+    request = {"messages": [{"role": "user", "content": "x" * 40}], "max_tokens": 100}
+    assert estimate_tokens(request) == 110
+
+
+class TestTokenBucket:
+    """Tests for the budget bookkeeping."""
+
+    def test_refill(self, clock):
+        """Test that spent budget comes back at the refill rate."""
+        bucket = TokenBucket(2, 1.0, clock=clock)
+        bucket.take(2)
+        assert bucket.wait_time(1) == pytest.approx(1.0)
+        clock.now = 0.5
+        assert bucket.wait_time(1) == pytest.approx(0.5)
+        clock.now = 10.0
+        assert bucket.wait_time(1) == 0.0
+        assert bucket.level == 2
+
+    def test_wait_time_is_capped_at_capacity(self, clock):
+        """Test that a request larger than the bucket can still be admitted."""
+        bucket = TokenBucket(10, 1.0, clock=clock)
+        assert bucket.wait_time(50) == 0.0
+
+    def test_update_from_headers(self, clock):
+        """Test that the reported budget and reset time replace local estimates."""
+        bucket = TokenBucket(100, 1.0, clock=clock)
+        bucket.update(60, 30, 15.0)
+        assert bucket.capacity == 60
+        assert bucket.level == 30
+        assert bucket.per_second == pytest.approx(2.0)
+
+
+class TestRateLimitScheduler:
+    """Tests for queueing and prioritizing requests."""
+
+    def test_unlimited_runs_immediately(self):
+        """Test that without budgets requests pass straight through."""
+        scheduler = RateLimitScheduler()
+        assert scheduler.submit(lambda: "done") == "done"
+        assert scheduler.metrics.count("throttled") == 0
+        assert scheduler.metrics.summary("queue_wait").count == 1
+
+    def test_throttles_beyond_request_budget(self):
+        """Test that requests over the budget wait instead of failing."""
+        scheduler = RateLimitScheduler(requests_per_minute=1200)  # 20 per second
+        scheduler.buckets["requests"].level = 0
+
+        start = time.monotonic()
+        assert scheduler.submit(lambda: "done") == "done"
+
+        assert time.monotonic() - start >= 0.04
+        assert scheduler.metrics.count("throttled") == 1
+        assert scheduler.metrics.summary("queue_wait").maximum >= 0.04
+
+    def test_interactive_requests_go_first(self):
+        """Test that a live question overtakes queued batch work."""
+        scheduler = RateLimitScheduler()
+        scheduler.observe_headers({"retry-after-ms": "200"}, rate_limited=True)
+        order: list[str] = []
+
+        def submit(name: str, priority: int) -> None:
+            scheduler.submit(lambda: order.append(name), priority=priority)
+
+        batch = threading.Thread(target=submit, args=("batch", BATCH))
+        interactive = threading.Thread(target=submit, args=("interactive", INTERACTIVE))
+        batch.start()
+        time.sleep(0.05)
+        interactive.start()
+        batch.join(timeout=5)
+        interactive.join(timeout=5)
+
+        assert order == ["interactive", "batch"]
+        assert scheduler.metrics.count("rate_limited") == 1
+
+    def test_headers_create_budgets(self):
+        """Test that an exhausted budget reported by the API delays requests."""
+        scheduler = RateLimitScheduler()
+        scheduler.observe_headers(
+            {
+                "x-ratelimit-limit-requests": "100",
+                "x-ratelimit-remaining-requests": "0",
+                "x-ratelimit-reset-requests": "1s",
+                "x-ratelimit-limit-tokens": "1000",
+                "x-ratelimit-remaining-tokens": "1000",
+            }
+        )
+        assert scheduler.buckets["requests"].per_second == pytest.approx(100.0)
+        assert scheduler.buckets["tokens"].capacity == 1000
+
+        scheduler.submit(lambda: None, tokens=10)
+        assert scheduler.metrics.count("throttled") == 1
+
+    def test_close_fails_queued_requests(self):
+        """Test that closing releases waiting requests with an error."""
+        scheduler = RateLimitScheduler(requests_per_minute=1)
+        scheduler.submit(lambda: None)
+        errors = []
+
+        def queued() -> None:
+            try:
+                scheduler.submit(lambda: None)
+            except RuntimeError as exc:
+                errors.append(exc)
+
+        thread = threading.Thread(target=queued)
+        thread.start()
+        scheduler.close()
+        thread.join(timeout=5)
+
+        assert not thread.is_alive()
+        assert len(errors) == 1
+        with pytest.raises(RuntimeError):
+            scheduler.submit(lambda: None)
+
+    def test_rate_limit_error_is_retried(self):
+        """Test that a 429 is requeued after the server's retry delay."""
+        scheduler = RateLimitScheduler()
+        attempts = []
+
+        def call() -> str:
+            attempts.append(time.monotonic())
+            if len(attempts) == 1:
+                raise rate_limit_error({"retry-after-ms": "50"})
+            return "done"
+
+        assert scheduler.submit(call) == "done"
+        assert attempts[1] - attempts[0] >= 0.05
+
+    def test_rate_limit_error_beyond_max_wait_raises(self):
+        """Test that requests are not queued forever."""
+        scheduler = RateLimitScheduler(max_wait=1.0)
+
+        def call() -> None:
+            raise rate_limit_error({"retry-after": "30"})
+
+        with pytest.raises(openai.RateLimitError):
+            scheduler.submit(call)
+
+
+def test_default_client_leaves_429_retries_to_the_scheduler(caplog):
+    """Test that every 429 reaches the scheduler instead of the SDK's retry loop."""
+    with StubServices(response="Done.", rate_limit=1, rate_limit_window=0.5) as stubs:
+        assistant = VoiceAssistant(
+            api_key="stub", config=AssistantConfig(warm_up=False)
+        )
+        assistant.client = assistant._create_client(
+            "stub", base_url=stubs.openai_base_url
+        )
+
+        # Another client spends the budget the assistant does not know about yet.
+        other = openai.OpenAI(
+            api_key="stub", base_url=stubs.openai_base_url, max_retries=0
+        )
+        other.chat.completions.create(
+            model="gpt-test", messages=[{"role": "user", "content": "hi"}]
+        )
+
+        with caplog.at_level("WARNING", logger="voice_assistant.scheduler"):
+            response = assistant.generate_response("Hi")
+
+        assert response == "Done."
+        assert assistant.client.max_retries == 0
+        assert stubs.requests["llm_rate_limited"] >= 1
+        retries = [r for r in caplog.records if "Rate limited" in r.message]
+        assert len(retries) == stubs.requests["llm_rate_limited"]
+
+
+def test_assistant_queues_against_rate_limited_stub():
+    """Test that the real client is held back instead of failing on 429s."""
+    with StubServices(response="Done.", rate_limit=2, rate_limit_window=1.0) as stubs:
+        assistant = StubbedAssistant(ServiceEndpoints.from_services(stubs), seed=0)
+
+        responses = [assistant.generate_response("Hi") for _ in range(4)]
+
+        assert responses == ["Done."] * 4
+        assert stubs.requests["llm"] >= 4
+        assert (
+            assistant.metrics.count("throttled")
+            + assistant.metrics.count("rate_limited")
+            >= 1
+        )
+        assert assistant.metrics.summary("queue_wait").count == 4
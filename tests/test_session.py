@@ -0,0 +1,87 @@
+"""Tests for session recording."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from voice_assistant.fakes import synthetic_speech
+from voice_assistant.session import Interaction, SessionRecorder, load_session
+
+
+def test_interaction_round_trip():
+    """Test that an interaction survives JSON serialization."""
+    audio = synthetic_speech(seconds=0.2, seed=1)
+    interaction = Interaction(
+        timestamp=123.0,
+        transcript="hello",
+        response="hi there",
+        audio=audio,
+        timings={"recognition": 0.25},
+        model="gpt-4o-mini",
+        messages=[{"role": "user", "content": "hello"}],
+    )
+
+    restored = Interaction.from_json(interaction.to_json())
+
+    assert restored.transcript == "hello"
+    assert restored.response == "hi there"
+    assert restored.timings == {"recognition": 0.25}
+    assert restored.model == "gpt-4o-mini"
+    assert restored.messages == [{"role": "user", "content": "hello"}]
+    assert restored.audio.get_raw_data() == audio.get_raw_data()
+    assert restored.audio.sample_rate == audio.sample_rate
+
+
+def test_unsupported_version_rejected():
+    """Test that unknown format versions are rejected."""
+    with pytest.raises(ValueError, match="Unsupported session format"):
+        Interaction.from_json('{"version": 99, "timestamp": 0}')
+
+
+def test_recorder_appends_and_loader_skips_corrupt_lines(tmp_path):
+    """Test appending interactions and tolerant loading."""
+    path = tmp_path / "sessions" / "session.jsonl"
+    recorder = SessionRecorder(path)
+    recorder.record(Interaction(timestamp=1.0, transcript="one"))
+    with path.open("a", encoding="utf-8") as session_file:
+        session_file.write("not json\n")
+    recorder.record(Interaction(timestamp=2.0, transcript="two"))
+
+    interactions = list(load_session(path))
+
+    assert [interaction.transcript for interaction in interactions] == ["one", "two"]
+
+
+def test_recorder_drops_unserializable_audio(tmp_path, mock_audio_data):
+    """Test that audio that cannot be encoded does not lose the interaction."""
+    path = tmp_path / "session.jsonl"
+
+    SessionRecorder(path).record(
+        Interaction(timestamp=1.0, transcript="hello", audio=mock_audio_data)
+    )
+
+    (interaction,) = load_session(path)
+    assert interaction.audio is None
+    assert interaction.transcript == "hello"
+
+
+def test_run_records_interaction(tmp_path, scripted_assistant):
+    """Test that the run loop writes each interaction with stage timings."""
+    path = tmp_path / "session.jsonl"
+    scripted_assistant.recorder = SessionRecorder(path)
+
+    with patch.object(scripted_assistant, "speak_text"):
+        scripted_assistant.run(once=True)
+
+    (interaction,) = load_session(path)
+    assert interaction.transcript == "What time is it?"
+    assert interaction.response == "It is noon."
+    captured = synthetic_speech(seed=0)
+    assert interaction.model == scripted_assistant.config.model
+    assert interaction.messages[-1] == {"role": "user", "content": "What time is it?"}
+    assert interaction.audio.get_raw_data() == captured.get_raw_data()
+    assert {"capture", "recognition", "generation", "interaction"} <= set(
+        interaction.timings
+    )
@@ -0,0 +1,75 @@
+"""Tests for the memory soak test."""
+
+from __future__ import annotations
+
+import pytest
+
+from voice_assistant.soak import (
+    MemorySample,
+    SoakAssistant,
+    SoakResult,
+    format_result,
+    parse_args,
+    run_soak,
+)
+
+
+@pytest.fixture
+def soak_assistant(monkeypatch):
+    """Create a soak assistant that plays speech without a sound card."""
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    return SoakAssistant(speech_seconds=0.01, seed=0)
+
+
+def test_soak_assistant_runs_full_pipeline(soak_assistant):
+    """Test that interactions go through synthesis and playback."""
+    interaction = soak_assistant.interact()
+
+    assert interaction.error is None
+    assert interaction.response == "It is twelve o'clock."
+    assert {"capture", "recognition", "generation", "synthesis", "playback"} <= set(
+        interaction.timings
+    )
+
+
+def test_run_soak_samples_memory(soak_assistant):
+    """Test that memory is sampled at the start, every interval and at the end."""
+    result = run_soak(soak_assistant, interactions=5, sample_every=2, warmup=1)
+
+    assert [sample.interactions for sample in result.samples] == [0, 2, 4, 5]
+    assert result.errors == 0
+    assert result.passed
+    assert result.top_growth
+
+
+def test_soak_result_fails_past_limit():
+    """Test the growth verdict."""
+    result = SoakResult(
+        samples=[
+            MemorySample(0, 0.0, rss=100, traced=10),
+            MemorySample(10, 1.0, rss=300, traced=20),
+        ],
+        max_growth=150,
+    )
+    assert result.growth == 200
+    assert not result.passed
+    assert "FAIL: grew" in format_result(result)
+
+
+def test_soak_result_uses_traced_memory_without_rss():
+    """Test the fallback when RSS is unavailable."""
+    result = SoakResult(
+        samples=[
+            MemorySample(0, 0.0, rss=None, traced=10),
+            MemorySample(10, 1.0, rss=None, traced=20),
+        ],
+        max_growth=100,
+    )
+    assert result.growth == 10
+    assert result.passed
+
+
+def test_parse_args_rejects_zero_interval():
+    """Test argument validation."""
+    with pytest.raises(SystemExit):
+        parse_args(["--sample-every", "0"])
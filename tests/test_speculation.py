@@ -0,0 +1,192 @@
+"""Tests for speculative response prefetching."""
+
+from __future__ import annotations
+
+import json
+import time
+
+import pytest
+import speech_recognition as sr
+
+from voice_assistant import AssistantConfig, VoiceAssistant
+from voice_assistant.fakes import (
+    FakeOpenAIClient,
+    FakeRecognitionBackend,
+    fixed_delay,
+)
+from voice_assistant.recognition import RecognizerRace
+from voice_assistant.speculation import Prefetcher, looks_complete
+
+AUDIO = sr.AudioData(b"\x00\x00" * 160, 16000, 2)
+
+
+def slow_answer(prompt: str) -> str:
+    time.sleep(0.1)
+    return f"Answer to {prompt}"
+
+
+@pytest.mark.parametrize(
+    ("transcript", "complete"),
+    [
+        ("What time is it?", True),
+        ("what time is", False),
+        ("what is the", False),
+        ("hello", False),
+        ("Tell me a joke um", False),
+    ],
+)
+def test_looks_complete(transcript, complete):
+    """Test the heuristic for cut-off transcripts."""
+    assert looks_complete(transcript) is complete
+
+
+class TestPrefetcher:
+    """Tests for reusing or discarding speculative responses."""
+
+    def test_matching_transcript_reuses_response(self):
+        """Test that a speculation matching after normalization is used."""
+        prefetcher = Prefetcher(slow_answer)
+        prefetcher.offer("what time is it")
+        time.sleep(0.05)
+
+        assert prefetcher.resolve("What time is it?") == "Answer to what time is it"
+        assert prefetcher.metrics.count("speculation_hits") == 1
+        saved = prefetcher.metrics.summary("speculation_saved")
+        assert saved.maximum == pytest.approx(0.05, abs=0.04)
+        assert prefetcher.metrics.count("speculation_tokens") > 0
+
+    def test_mismatch_is_discarded(self):
+        """Test that a wrong guess is not used and its tokens count as wasted."""
+        prefetcher = Prefetcher(slow_answer)
+        prefetcher.offer("what time is it")
+        time.sleep(0.02)
+
+        assert prefetcher.resolve("what tide is it") is None
+        assert prefetcher.metrics.count("speculation_misses") == 1
+        time.sleep(0.2)
+        wasted = prefetcher.metrics.count("speculation_wasted_tokens")
+        assert wasted == prefetcher.metrics.count("speculation_tokens") > 0
+
+    def test_newer_transcript_replaces_speculation(self):
+        """Test that only the latest early transcript is kept."""
+        calls = []
+
+        def generate(prompt: str) -> str:
+            calls.append(prompt)
+            return prompt.upper()
+
+        prefetcher = Prefetcher(generate)
+        prefetcher.offer("what time is it")
+        prefetcher.offer("What time is it?")  # same after normalization
+        prefetcher.offer("what time is it now")
+
+        assert prefetcher.resolve("what time is it now") == "WHAT TIME IS IT NOW"
+        assert prefetcher.metrics.count("speculations") == 2
+        assert calls[-1] == "what time is it now"
+
+    def test_incomplete_transcript_is_ignored(self):
+        """Test that transcripts cut off mid-sentence are not used."""
+        prefetcher = Prefetcher(slow_answer)
+        prefetcher.offer("what is the")
+        assert prefetcher.resolve("what is the time") is None
+        assert prefetcher.metrics.count("speculations") == 0
+
+    def test_failed_speculation_falls_back(self):
+        """Test that a failed speculative call is reissued by the caller."""
+
+        def fail(prompt: str) -> str:
+            raise RuntimeError("API down")
+
+        prefetcher = Prefetcher(fail)
+        prefetcher.offer("what time is it")
+        assert prefetcher.resolve("what time is it") is None
+        assert prefetcher.metrics.count("speculation_misses") == 1
+
+
+def test_race_reports_early_results():
+    """Test that unsure results are passed on while the race goes on."""
+    early = []
+    race = RecognizerRace(
+        {
+            "fast": FakeRecognitionBackend("what time is it", 0.4),
+            "slow": FakeRecognitionBackend(
+                "what time is it", 0.9, delay=fixed_delay(0.05)
+            ),
+        }
+    )
+
+    assert race.recognize(AUDIO, on_early_result=early.append).backend == "slow"
+    assert [transcript.backend for transcript in early] == ["fast"]
+
+
+class TestAssistantSpeculation:
+    """Tests for speculative prefetch in the assistant."""
+
+    @pytest.fixture
+    def assistant(self, mock_recognizer, tmp_path):
+        """Race a fast local recognizer without confidence against a slower cloud one."""
+
+        def slow_google(audio, **kwargs):
+            time.sleep(0.1)
+            return "What time is it?", 0.92
+
+        mock_recognizer.recognize_sphinx.return_value = "what time is it"
+        mock_recognizer.recognize_google.side_effect = slow_google
+        faq_path = tmp_path / "faq.json"
+        faq_path.write_text(
+            json.dumps([{"question": "What is your name?", "answer": "Genius."}])
+        )
+        assistant = VoiceAssistant(
+            api_key="sk-test",
+            config=AssistantConfig(
+                recognizers=["google", "sphinx"],
+                speculative_prefetch=True,
+                fast_model="gpt-4o-mini",
+                faq_path=str(faq_path),
+            ),
+            recognizer=mock_recognizer,
+        )
+        assistant.client = FakeOpenAIClient(["It is noon."])
+        return assistant
+
+    def test_local_early_result_is_reused(self, assistant):
+        """Test that the cloud transcript reuses the answer to the local one."""
+        question = assistant._recognize_speech(AUDIO, prefetch=True)
+
+        assert question == "What time is it?"
+        assert assistant._respond(question) == "It is noon."
+        assert assistant.client.request_count == 1
+        assert assistant.metrics.count("speculation_hits") == 1
+        assert assistant.metrics.summary("speculation_saved").count == 1
+        assert assistant.metrics.count("faq_misses") == 1
+        assert assistant.metrics.count("route_fast") == 1
+
+    def test_miss_counts_metrics_once(self, assistant, mock_recognizer):
+        """Test that a discarded speculation adds no FAQ or routing counts."""
+        mock_recognizer.recognize_sphinx.return_value = "what tide is it"
+
+        question = assistant._recognize_speech(AUDIO, prefetch=True)
+        assistant._respond(question)
+
+        assert assistant.metrics.count("speculation_misses") == 1
+        assert assistant.metrics.count("faq_misses") == 1
+        assert assistant.metrics.count("route_fast") == 1
+
+    def test_faq_questions_are_not_speculated(self, assistant, mock_recognizer):
+        """Test that questions the FAQ answers are not sent to OpenAI early."""
+        mock_recognizer.recognize_sphinx.return_value = "what is your name"
+
+        assistant._recognize_speech(AUDIO, prefetch=True)
+
+        assert assistant.metrics.count("speculations") == 0
+
+    def test_speculation_ignores_barge_in_state(self, assistant):
+        """Test that speculation is not streamed or cancelled by a barge-in."""
+        assistant.config.barge_in = True
+        assistant._cancel.set()
+        live_stream = object()
+        assistant._active_stream = live_stream
+
+        assert assistant._speculate("What time is it?") == "It is noon."
+        assert "stream" not in assistant.client.last_request
+        assert assistant._active_stream is live_stream
@@ -0,0 +1,103 @@
+"""Tests for the local stub services."""
+
+from __future__ import annotations
+
+import json
+import random
+import urllib.request
+
+import pytest
+import speech_recognition as sr
+from openai import OpenAI, RateLimitError
+
+from voice_assistant.fakes import synthetic_speech
+from voice_assistant.stubs import LatencyDistribution, StubServices
+
+
+class TestLatencyDistribution:
+    """Tests for latency specifications."""
+
+    def test_parse_and_sample(self):
+        """Test each supported distribution."""
+        rng = random.Random(0)
+
+        assert LatencyDistribution.parse("fixed:0.5").sample(rng) == 0.5
+        assert 1.0 <= LatencyDistribution.parse("uniform:1:2").sample(rng) <= 2.0
+        assert LatencyDistribution.parse("lognormal:0.3:0.5").sample(rng) > 0
+
+    @pytest.mark.parametrize("spec", ["fixed", "gamma:1:2", "uniform:1", "fixed:-1"])
+    def test_parse_rejects_invalid(self, spec):
+        """Test that malformed specifications are rejected."""
+        with pytest.raises(ValueError):
+            LatencyDistribution.parse(spec)
+
+
+@pytest.fixture
+def services():
+    """Run stub services for the duration of a test."""
+    with StubServices(transcript="hello there", response="General Kenobi") as running:
+        yield running
+
+
+def test_openai_client_against_stub(services):
+    """Test that the real OpenAI client can talk to the stub."""
+    client = OpenAI(api_key="stub", base_url=services.openai_base_url, max_retries=0)
+
+    completion = client.chat.completions.create(
+        model="gpt-test", messages=[{"role": "user", "content": "hi"}]
+    )
+
+    assert completion.choices[0].message.content == "General Kenobi"
+    assert completion.usage.completion_tokens == 2
+    assert client.models.retrieve("gpt-test").id == "gpt-test"
+    assert services.requests["llm"] == 1
+
+
+def test_rate_limited_stub_answers_429():
+    """Test that the chat endpoint enforces its budget with OpenAI's headers."""
+    with StubServices(rate_limit=1, rate_limit_window=60.0) as services:
+        client = OpenAI(
+            api_key="stub", base_url=services.openai_base_url, max_retries=0
+        )
+        messages = [{"role": "user", "content": "hi"}]
+
+        response = client.chat.completions.with_raw_response.create(
+            model="gpt-test", messages=messages
+        )
+        assert response.headers["x-ratelimit-limit-requests"] == "1"
+        assert response.headers["x-ratelimit-remaining-requests"] == "0"
+
+        with pytest.raises(RateLimitError) as error:
+            client.chat.completions.create(model="gpt-test", messages=messages)
+
+        assert int(error.value.response.headers["retry-after-ms"]) > 0
+        assert services.requests["llm_rate_limited"] == 1
+
+
+def test_google_recognizer_against_stub(services):
+    """Test that the real Google recognizer parses the stub response."""
+    recognizer = sr.Recognizer()
+
+    transcript = recognizer.recognize_google(
+        synthetic_speech(seconds=0.2, seed=0), endpoint=services.stt_endpoint
+    )
+
+    assert transcript == "hello there"
+    assert services.requests["stt"] == 1
+
+
+def test_tts_and_unknown_paths(services):
+    """Test the TTS endpoint and 404 handling."""
+    request = urllib.request.Request(services.tts_endpoint, data=b"hi")
+    with urllib.request.urlopen(request) as response:
+        assert len(response.read()) == 800
+
+    with pytest.raises(urllib.error.HTTPError) as excinfo:
+        urllib.request.urlopen(f"{services.base_url}/missing")
+    assert json.loads(excinfo.value.read())["error"]["message"] == "not found"
+
+
+def test_base_url_requires_running_server():
+    """Test that URLs are unavailable before start."""
+    with pytest.raises(RuntimeError, match="not running"):
+        _ = StubServices().base_url
@@ -0,0 +1,45 @@
+"""Tests for response chunking."""
+
+from __future__ import annotations
+
+from voice_assistant.synthesis import split_sentences
+
+
+def test_single_sentence_is_one_chunk():
+    """Test that short text is left alone."""
+    assert split_sentences("Hello world") == ["Hello world"]
+
+
+def test_first_sentence_is_its_own_chunk():
+    """Test that later sentences are merged but the first stands alone."""
+    chunks = split_sentences("It is noon. The sun is high. Have a nice day!")
+    assert chunks == ["It is noon.", "The sun is high. Have a nice day!"]
+
+
+def test_chunks_respect_max_chars():
+    """Test that merged chunks stay within the limit."""
+    text = " ".join(f"Sentence number {index}." for index in range(20))
+    chunks = split_sentences(text, max_chars=60)
+
+    assert all(len(chunk) <= 60 for chunk in chunks)
+    assert " ".join(chunks) == text
+
+
+def test_long_sentence_is_wrapped_at_words():
+    """Test that an overlong sentence is broken at word boundaries."""
+    text = "word " * 30
+    chunks = split_sentences(text, max_chars=40)
+
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 40 for chunk in chunks)
+    assert " ".join(chunks) == text.strip()
+
+
+def test_decimal_points_do_not_split():
+    """Test that numbers are not treated as sentence ends."""
+    assert split_sentences("Pi is about 3.14 today.") == ["Pi is about 3.14 today."]
+
+
+def test_blank_text():
+    """Test that whitespace produces no chunks."""
+    assert split_sentences("   ") == []
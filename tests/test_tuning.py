@@ -0,0 +1,246 @@
+"""Tests for capture parameter auto-tuning."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import speech_recognition as sr
+
+from voice_assistant import AssistantConfig, VoiceAssistant
+from voice_assistant.audio import array_to_pcm
+from voice_assistant.fakes import FakeMicrophone
+from voice_assistant.tuning import (
+    AMBIENT_NOISE_BOUNDS,
+    PAUSE_THRESHOLD_BOUNDS,
+    AutoTuner,
+    CaptureObservation,
+    TuningProfile,
+    observe_audio,
+)
+
+RATE = 16000
+
+
+def make_utterance(*parts: tuple[str, float]) -> sr.AudioData:
+    """Build audio from ``("tone" | "silence", seconds)`` parts."""
+    chunks = []
+    for kind, seconds in parts:
+        length = int(seconds * RATE)
+        if kind == "tone":
+            times = np.arange(length) / RATE
+            chunks.append(0.5 * np.sin(2 * np.pi * 440 * times))
+        else:
+            chunks.append(np.zeros(length))
+    return sr.AudioData(array_to_pcm(np.concatenate(chunks)), RATE, 2)
+
+
+def observation(**overrides) -> CaptureObservation:
+    """Create an observation of a short, cleanly captured question."""
+    values = {
+        "duration": 2.0,
+        "leading_silence": 0.5,
+        "longest_gap": 0.2,
+        "energy_threshold": 300.0,
+    }
+    values.update(overrides)
+    return CaptureObservation(**values)
+
+
+class TestObserveAudio:
+    """Tests for measuring captured audio."""
+
+    def test_measures_gaps_and_silence(self):
+        """Test utterance duration, leading silence and gap measurement."""
+        audio = make_utterance(
+            ("silence", 0.6), ("tone", 0.5), ("silence", 0.3), ("tone", 0.4)
+        )
+
+        result = observe_audio(
+            audio, energy_threshold=300, phrase_time_limit=None, unintelligible=False
+        )
+
+        assert result.leading_silence == pytest.approx(0.6, abs=0.03)
+        assert result.longest_gap == pytest.approx(0.3, abs=0.03)
+        assert result.duration == pytest.approx(1.2, abs=0.05)
+        assert result.truncated is False
+
+    def test_detects_truncation(self):
+        """Test that audio reaching the phrase limit counts as truncated."""
+        audio = make_utterance(("tone", 2.0))
+
+        result = observe_audio(
+            audio, energy_threshold=300, phrase_time_limit=2.0, unintelligible=True
+        )
+
+        assert result.truncated is True
+        assert result.unintelligible is True
+
+    def test_detects_pause_near_threshold(self):
+        """Test that a pause almost as long as the pause threshold counts as truncated."""
+        audio = make_utterance(("tone", 0.5), ("silence", 0.45), ("tone", 0.5))
+
+        near = observe_audio(
+            audio,
+            energy_threshold=300,
+            phrase_time_limit=None,
+            unintelligible=False,
+            pause_threshold=0.5,
+        )
+        clear = observe_audio(
+            audio,
+            energy_threshold=300,
+            phrase_time_limit=None,
+            unintelligible=False,
+            pause_threshold=0.8,
+        )
+
+        assert near.truncated is True
+        assert clear.truncated is False
+
+
+class TestAutoTuner:
+    """Tests for the tuning rules."""
+
+    def test_waits_for_enough_observations(self):
+        """Test that nothing changes before the minimum sample count."""
+        profile = TuningProfile(pause_threshold=0.8, ambient_noise_duration=0.5)
+        tuner = AutoTuner(profile, min_observations=5)
+        tuner.observe(observation())
+
+        assert tuner.tune().pause_threshold == 0.8
+
+    def test_shortens_pause_for_short_gaps(self):
+        """Test that short inter-word gaps reduce the pause threshold."""
+        profile = TuningProfile(pause_threshold=1.5, ambient_noise_duration=0.5)
+        tuner = AutoTuner(profile, min_observations=3)
+        for _ in range(10):
+            tuner.observe(observation())
+            tuner.tune()
+
+        assert profile.pause_threshold < 0.5
+        assert profile.pause_threshold >= PAUSE_THRESHOLD_BOUNDS[0]
+        assert profile.ambient_noise_duration == pytest.approx(
+            AMBIENT_NOISE_BOUNDS[0], abs=0.01
+        )
+        assert profile.energy_threshold == 300.0
+
+    def test_never_shortens_while_truncating(self):
+        """Test that a high truncation rate blocks reductions."""
+        profile = TuningProfile(
+            pause_threshold=1.5, ambient_noise_duration=0.5, phrase_time_limit=5.0
+        )
+        tuner = AutoTuner(profile, min_observations=3)
+        for _ in range(5):
+            tuner.observe(observation(truncated=True, duration=5.0))
+            tuner.tune()
+
+        assert profile.pause_threshold == 1.5
+        assert profile.phrase_time_limit > 5.0
+        assert tuner.truncation_rate == 1.0
+
+    def test_pinned_settings_are_not_tuned(self):
+        """Test that explicitly configured settings keep their value."""
+        profile = TuningProfile(
+            pause_threshold=1.5, ambient_noise_duration=0.5, listen_timeout=20.0
+        )
+        tuner = AutoTuner(
+            profile,
+            pinned=frozenset({"pause_threshold", "listen_timeout"}),
+            min_observations=3,
+        )
+        for _ in range(5):
+            tuner.observe(observation())
+            tuner.tune()
+
+        assert profile.pause_threshold == 1.5
+        assert profile.listen_timeout == 20.0
+        assert profile.ambient_noise_duration < 0.5
+
+    def test_noisy_environment_lengthens_calibration(self):
+        """Test that an unstable noise floor increases calibration time."""
+        profile = TuningProfile(pause_threshold=0.8, ambient_noise_duration=0.3)
+        tuner = AutoTuner(profile, min_observations=2)
+        for energy in (100.0, 900.0, 300.0, 1500.0):
+            tuner.observe(observation(energy_threshold=energy))
+        tuner.tune()
+
+        assert profile.ambient_noise_duration > 0.3
+
+
+class TestTuningProfile:
+    """Tests for persistence and application of profiles."""
+
+    def test_save_and_load(self, tmp_path):
+        """Test that a profile round-trips through disk."""
+        path = tmp_path / "nested" / "tuning.json"
+        profile = TuningProfile(
+            pause_threshold=0.6, ambient_noise_duration=0.2, energy_threshold=250.0
+        )
+
+        profile.save(path)
+
+        assert TuningProfile.load(path) == profile
+
+    def test_assistant_loads_profile(self, tmp_path, mock_recognizer):
+        """Test that a saved profile is applied on start-up."""
+        path = tmp_path / "tuning.json"
+        TuningProfile(
+            pause_threshold=0.55, ambient_noise_duration=0.15, energy_threshold=420.0
+        ).save(path)
+        config = AssistantConfig(autotune=True, tuning_profile=str(path))
+
+        assistant = VoiceAssistant(
+            api_key="sk-test", config=config, recognizer=mock_recognizer
+        )
+
+        assert assistant.config.pause_threshold == 0.55
+        assert assistant.config.ambient_noise_duration == 0.15
+        assert assistant.recognizer.pause_threshold == 0.55
+        assert assistant.recognizer.energy_threshold == 420.0
+
+    def test_explicit_settings_override_profile(self, tmp_path, mock_recognizer):
+        """Test that values set explicitly win over the saved profile."""
+        path = tmp_path / "tuning.json"
+        TuningProfile(pause_threshold=0.55, ambient_noise_duration=0.15).save(path)
+        config = AssistantConfig(
+            autotune=True,
+            tuning_profile=str(path),
+            listen_timeout=10.0,
+            pause_threshold=1.5,
+        )
+
+        assistant = VoiceAssistant(
+            api_key="sk-test", config=config, recognizer=mock_recognizer
+        )
+
+        assert assistant.config.listen_timeout == 10.0
+        assert assistant.config.pause_threshold == 1.5
+        assert assistant.config.ambient_noise_duration == 0.15
+        assert assistant.recognizer.pause_threshold == 1.5
+        assistant._update_tuning(make_utterance(("tone", 0.5)), "hello")
+        assert assistant.config.listen_timeout == 10.0
+        assert TuningProfile.load(path).pause_threshold == 0.55
+
+    def test_learned_energy_threshold_seeds_calibration(self):
+        """Test that noise calibration starts from the learned energy threshold."""
+        learned = sr.Recognizer()
+        learned.energy_threshold = 1500.0
+        fresh = sr.Recognizer()
+        for recognizer in (learned, fresh):
+            with FakeMicrophone() as source:
+                recognizer.adjust_for_ambient_noise(source, duration=0.1)
+
+        assert learned.energy_threshold > 2 * fresh.energy_threshold
+
+    def test_assistant_saves_profile_after_capture(self, tmp_path, mock_recognizer):
+        """Test that question captures update the persisted profile."""
+        path = tmp_path / "tuning.json"
+        config = AssistantConfig(autotune=True, tuning_profile=str(path))
+        mock_recognizer.energy_threshold = 300
+        assistant = VoiceAssistant(
+            api_key="sk-test", config=config, recognizer=mock_recognizer
+        )
+
+        assistant._update_tuning(make_utterance(("tone", 0.5)), "hello")
+
+        assert TuningProfile.load(path).observations == 1
@@ -0,0 +1,83 @@
+"""Tests for start-up warm-up."""
+
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from voice_assistant.scheduler import BATCH
+from voice_assistant.warmup import run_warmup
+
+
+def test_run_warmup_runs_concurrently():
+    """Test that tasks overlap instead of running back to back."""
+    # Each task only gets past the barrier once all three are running.
+    barrier = threading.Barrier(3, timeout=5)
+
+    def task():
+        barrier.wait()
+        time.sleep(0.01)
+
+    timings = run_warmup(dict.fromkeys(("a", "b", "c"), task))
+
+    assert set(timings) == {"a", "b", "c"}
+    assert all(seconds >= 0.01 for seconds in timings.values())
+
+
+def test_run_warmup_skips_failures(caplog):
+    """Test that a failing task is logged and omitted."""
+
+    def broken():
+        raise OSError("no device")
+
+    timings = run_warmup({"ok": lambda: None, "broken": broken})
+
+    assert set(timings) == {"ok"}
+    assert "Warm-up of broken failed" in caplog.text
+
+
+def test_run_warmup_without_tasks():
+    """Test that no tasks produce no timings."""
+    assert run_warmup({}) == {}
+
+
+class TestAssistantWarmUp:
+    """Tests for VoiceAssistant.warm_up."""
+
+    @patch("voice_assistant.assistant.pygame")
+    @patch("voice_assistant.assistant.sr.Microphone")
+    def test_warm_up_initializes_components(
+        self, mock_mic_class, mock_pygame, voice_assistant
+    ):
+        """Test that the mixer and client are initialized but not the microphone."""
+        mock_pygame.mixer.get_init.return_value = None
+        voice_assistant.client = MagicMock()
+        voice_assistant.config.mixer_buffer_size = 256
+
+        with patch.object(
+            voice_assistant.scheduler,
+            "submit",
+            wraps=voice_assistant.scheduler.submit,
+        ) as mock_submit:
+            timings = voice_assistant.warm_up()
+
+        assert set(timings) == {"mixer", "openai"}
+        mock_pygame.mixer.init.assert_called_once_with(
+            frequency=24000, size=-16, channels=1, buffer=256
+        )
+        mock_mic_class.assert_not_called()
+        voice_assistant.client.models.retrieve.assert_called_once_with(
+            voice_assistant.config.model
+        )
+        assert mock_submit.call_args.kwargs["priority"] == BATCH
+        assert voice_assistant.metrics.summary("warmup_openai").count == 1
+
+    @patch("voice_assistant.assistant.sr.Microphone")
+    def test_microphone_is_probed_once(self, mock_mic_class, voice_assistant):
+        """Test that the microphone object is reused across captures."""
+        first = voice_assistant._get_microphone()
+        second = voice_assistant._get_microphone()
+
+        assert first is second
+        mock_mic_class.assert_called_once_with()
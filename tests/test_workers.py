@@ -0,0 +1,78 @@
+"""Tests for the multi-process worker pool."""
+
+from __future__ import annotations
+
+import functools
+from multiprocessing.shared_memory import SharedMemory
+
+import pytest
+
+from voice_assistant import VoiceAssistant
+from voice_assistant.fakes import synthetic_speech
+from voice_assistant.loadtest import StubbedAssistant
+from voice_assistant.workers import SharedAudio, WorkerPool, main, parse_args
+
+
+def test_shared_audio_round_trip():
+    """Test that audio survives the trip through shared memory."""
+    audio = synthetic_speech(seed=0)
+    memory, shared = SharedAudio.create(audio)
+    try:
+        restored = shared.read()
+    finally:
+        memory.close()
+        memory.unlink()
+
+    assert restored.get_raw_data() == audio.get_raw_data()
+    assert restored.sample_rate == audio.sample_rate
+    assert restored.sample_width == audio.sample_width
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=shared.name)
+
+
+def test_pool_answers_in_order(endpoints):
+    """Test that every clip is answered and results keep the input order."""
+    audios = [synthetic_speech(seed=seed) for seed in range(5)]
+    with WorkerPool(
+        functools.partial(StubbedAssistant, endpoints), 2, max_in_flight=3
+    ) as pool:
+        interactions = list(pool.map(audios))
+
+    assert len(interactions) == 5
+    assert all(interaction.error is None for interaction in interactions)
+    assert {interaction.response for interaction in interactions} == {
+        "It is twelve o'clock."
+    }
+    assert all(interaction.audio is None for interaction in interactions)
+    assert all("recognition" in interaction.timings for interaction in interactions)
+    assert pool.worker_cpu_seconds > 0
+
+
+def test_pool_reports_failed_start(monkeypatch):
+    """Test that a worker that cannot build its assistant fails start()."""
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    pool = WorkerPool(functools.partial(VoiceAssistant), 1)
+    with pytest.raises(RuntimeError, match="Worker failed to start"):
+        pool.start()
+
+
+def test_main_reports_errors_on_stderr(monkeypatch, tmp_path, capsys, caplog):
+    """Test that failures are logged rather than printed, with a non-zero exit."""
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    assert main(["question.wav"]) == 1
+    assert "API key is required" in caplog.text
+
+    missing = str(tmp_path / "missing.wav")
+    assert main([missing, "--api-key", "sk-test", "--processes", "1"]) == 1
+    assert "Batch processing failed" in caplog.text
+    assert capsys.readouterr().out == ""
+
+
+def test_parse_args():
+    """Test batch arguments."""
+    args = parse_args(["a.wav", "b.wav", "--processes", "3"])
+    assert args.files == ["a.wav", "b.wav"]
+    assert args.processes == 3
+
+    with pytest.raises(SystemExit):
+        parse_args(["a.wav", "--processes", "0"])